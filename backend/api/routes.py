@@ -11,6 +11,8 @@ from config import STADIUM_MODELS, SUPPORTED_STADIUMS
 from schemas.prediction import (
     PredictionRequest,
     PredictionResponse,
+    BatchPredictionRequest,
+    BatchPredictionResponse,
     HealthResponse,
     ModelInfoResponse,
     AllModelsInfoResponse,
@@ -20,8 +22,14 @@ from schemas.prediction import (
     WeatherResponse,
     WeatherTimelineRequest,
     WeatherTimelineResponse,
+    HistoryResponse,
+    LiveCancellationEvent,
+    LiveCancellationResponse,
+    LiveStatusResponse,
 )
 from services.weather import weather_service
+from services.history import history_service
+from services.live import live_service
 
 if TYPE_CHECKING:
     from models.predictor import MultiStadiumPredictor
@@ -207,6 +215,11 @@ async def predict_cancellation(
             f"prediction={result.prediction}, confidence={result.confidence}"
         )
 
+        # 실시간 취소 감시 주기 조정용 확률 관측
+        live_service.observe_prediction(
+            stadium_id, result.cancellation_probability, prediction_request.game_date
+        )
+
         return result
 
     except ValueError as e:
@@ -223,6 +236,54 @@ async def predict_cancellation(
         )
 
 
+@router.post("/predict/batch", response_model=BatchPredictionResponse)
+async def predict_cancellation_batch(
+    request: Request,
+    batch_request: BatchPredictionRequest
+) -> BatchPredictionResponse:
+    """
+    우천취소 일괄 예측 엔드포인트
+
+    여러 경기(구장 혼합 가능)를 한 번에 예측합니다. 같은 모델을 쓰는 경기끼리 묶어
+    예측하며, 통합 모델(GLOBAL_MODEL_ENABLED=1)이면 모든 경기를 한 번에 예측합니다.
+
+    - **games**: /api/predict 요청 형식의 경기 목록
+    """
+    predictor = get_predictor(request)
+    games = batch_request.games
+
+    unavailable = sorted({game.stadium for game in games if not predictor.is_stadium_available(game.stadium)})
+    if unavailable:
+        raise HTTPException(
+            status_code=404,
+            detail=f"{', '.join(unavailable)} 구장 모델을 사용할 수 없습니다."
+        )
+
+    logger.info(f"[PREDICT] 일괄 예측 요청 {len(games)}건, 구장: {sorted({game.stadium for game in games})}")
+
+    try:
+        results = predictor.predict_batch(games)
+
+        # 실시간 취소 감시 주기 조정용 확률 관측
+        for game, result in zip(games, results):
+            live_service.observe_prediction(result.stadium, result.cancellation_probability, game.game_date)
+
+        return BatchPredictionResponse(results=results, global_model=predictor.uses_global_model())
+
+    except ValueError as e:
+        logger.error(f"일괄 예측 요청 오류: {e}")
+        raise HTTPException(
+            status_code=400,
+            detail=str(e)
+        )
+    except Exception as e:
+        logger.error(f"일괄 예측 중 오류 발생: {e}", exc_info=True)
+        raise HTTPException(
+            status_code=500,
+            detail="예측 중 오류가 발생했습니다."
+        )
+
+
 @router.post("/weather", response_model=WeatherResponse)
 async def get_weather(weather_request: WeatherRequest) -> WeatherResponse:
     """
@@ -347,3 +408,92 @@ async def get_weather_timeline(
             status_code=500,
             detail="타임라인 데이터 조회 중 오류가 발생했습니다."
         )
+
+
+@router.get("/history", response_model=HistoryResponse)
+async def get_history(
+    stadium: str = Query(..., description=f"구장 ID. 지원: {', '.join(SUPPORTED_STADIUMS)}"),
+    month: Optional[int] = Query(default=None, ge=1, le=12, description="월 (미지정 시 전체)"),
+    min_pre_game_precip: Optional[float] = Query(
+        default=None, ge=0, description="경기 전 강수량 하한 (mm)"
+    ),
+) -> HistoryResponse:
+    """
+    과거 우천취소 이력 조회 엔드포인트
+
+    구장/월/경기 전 강수량 조건에 맞는 과거 경기의 우천취소 비율을 반환합니다.
+
+    - **stadium**: 구장 ID
+    - **month** (선택): 월
+    - **min_pre_game_precip** (선택): 경기 전 강수량 하한 (mm)
+    """
+    stadium_config = STADIUM_MODELS.get(stadium)
+    if not stadium_config:
+        raise HTTPException(
+            status_code=404,
+            detail=f"{stadium} 구장은 지원하지 않습니다."
+        )
+
+    if not history_service.is_available():
+        raise HTTPException(
+            status_code=503,
+            detail="과거 경기 데이터셋을 사용할 수 없습니다."
+        )
+
+    try:
+        history = history_service.get_cancellation_history(
+            stadium=stadium,
+            month=month,
+            min_pre_game_precip=min_pre_game_precip,
+        )
+        return HistoryResponse(
+            stadium=stadium,
+            stadium_name=stadium_config["name"],
+            month=month,
+            min_pre_game_precip=min_pre_game_precip,
+            **history
+        )
+
+    except Exception as e:
+        logger.error(f"이력 조회 중 오류 발생: {e}", exc_info=True)
+        raise HTTPException(
+            status_code=500,
+            detail="이력 데이터 조회 중 오류가 발생했습니다."
+        )
+
+
+@router.get("/live/cancellations", response_model=LiveCancellationResponse)
+async def get_live_cancellations(
+    stadium: Optional[str] = Query(
+        default=None, description=f"구장 ID (미지정 시 전체). 지원: {', '.join(SUPPORTED_STADIUMS)}"
+    ),
+    limit: int = Query(default=20, ge=1, le=100, description="최대 이벤트 수"),
+) -> LiveCancellationResponse:
+    """
+    당일 경기 취소 이벤트 조회 엔드포인트
+
+    실시간 감시(LIVE_WATCH_ENABLED=1)가 감지한 최근 경기 상태 변경을 최신순으로 반환합니다.
+
+    - **stadium** (선택): 구장 ID
+    - **limit** (선택): 최대 이벤트 수 (기본값 20)
+    """
+    if stadium is not None and stadium not in STADIUM_MODELS:
+        raise HTTPException(
+            status_code=404,
+            detail=f"{stadium} 구장은 지원하지 않습니다."
+        )
+
+    events = live_service.recent_events(stadium=stadium, limit=limit)
+    return LiveCancellationResponse(
+        events=[LiveCancellationEvent(**event.to_dict()) for event in events]
+    )
+
+
+@router.get("/live/status", response_model=LiveStatusResponse)
+async def get_live_status() -> LiveStatusResponse:
+    """
+    당일 경기 취소 감시 상태 엔드포인트
+
+    감시 실행 여부, 조회 횟수, 다음 조회 주기와 오늘 관측한 최대 예측 취소 확률을 반환합니다.
+    """
+    return LiveStatusResponse(**live_service.status())
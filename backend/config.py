@@ -18,6 +18,11 @@ BACKEND_ROOT = Path(__file__).parent
 # - 로컬: MODEL_DIR 미설정 시 PROJECT_ROOT/models 사용
 MODEL_DIR = Path(os.environ.get("MODEL_DIR", str(PROJECT_ROOT / "models")))
 
+# 과거 경기 데이터셋 (구장/연/월 파티션 저장소)
+# - Docker: DATA_STORE_DIR=/app/data_store (docker-compose.yml에서 설정)
+# - 로컬: DATA_STORE_DIR 미설정 시 PROJECT_ROOT/data/store 사용
+DATA_STORE_DIR = Path(os.environ.get("DATA_STORE_DIR", str(PROJECT_ROOT / "data" / "store")))
+
 # API 설정
 API_VERSION = "1.1.0"
 API_TITLE = "KBO 우천취소 예측 API"
@@ -29,66 +34,101 @@ API_DESCRIPTION = "KBO 야구장 경기 우천취소 확률을 예측하는 API
 # 새 구장 추가 시 아래 형식으로 추가:
 # "구장_id": {
 #     "path": Path("모델 파일 경로"),
+#     "student_path": Path("경량(증류) 모델 파일 경로"),  # python distill_model.py
 #     "name": "구장 한글명",
 #     "team": "홈팀명",
 #     "coordinates": (위도, 경도),  # 날씨 API 호출용
+#     "search_keyword": "구장명",  # KBO 일정 표의 구장 표기 (실시간 취소 감시용)
 # }
 # =============================================================================
 
 STADIUM_MODELS = {
     "jamsil": {
         "path": MODEL_DIR / "kbo_jamsil_model.pkl",
+        "student_path": MODEL_DIR / "kbo_jamsil_student.pkl",
         "name": "잠실야구장",
         "team": "LG/두산",
         "coordinates": (37.5122, 127.0719),
+        "search_keyword": "잠실",
     },
     "daegu": {
         "path": MODEL_DIR / "kbo_daegu_model.pkl",
+        "student_path": MODEL_DIR / "kbo_daegu_student.pkl",
         "name": "대구삼성라이온즈파크",
         "team": "삼성",
         "coordinates": (35.8411, 128.6815),
+        "search_keyword": "대구",
     },
     "suwon": {
         "path": MODEL_DIR / "kbo_suwon_model.pkl",
+        "student_path": MODEL_DIR / "kbo_suwon_student.pkl",
         "name": "수원KT위즈파크",
         "team": "KT",
         "coordinates": (37.2997, 127.0097),
+        "search_keyword": "수원",
     },
     "incheon": {
         "path": MODEL_DIR / "kbo_incheon_model.pkl",
+        "student_path": MODEL_DIR / "kbo_incheon_student.pkl",
         "name": "인천SSG랜더스필드",
         "team": "SSG",
         "coordinates": (37.4370, 126.6932),
+        "search_keyword": "문학",
     },
     "daejeon": {
         "path": MODEL_DIR / "kbo_daejeon_model.pkl",
+        "student_path": MODEL_DIR / "kbo_daejeon_student.pkl",
         "name": "대전한화생명이글스파크",
         "team": "한화",
         "coordinates": (36.3170, 127.4291),
+        "search_keyword": ["한밭", "대전"],
     },
     "gwangju": {
         "path": MODEL_DIR / "kbo_gwangju_model.pkl",
+        "student_path": MODEL_DIR / "kbo_gwangju_student.pkl",
         "name": "광주챔피언스필드",
         "team": "KIA",
         "coordinates": (35.1681, 126.8891),
+        "search_keyword": "광주",
     },
     "busan": {
         "path": MODEL_DIR / "kbo_busan_model.pkl",
+        "student_path": MODEL_DIR / "kbo_busan_student.pkl",
         "name": "사직야구장",
         "team": "롯데",
         "coordinates": (35.1940, 129.0616),
+        "search_keyword": "사직",
     },
     "changwon": {
         "path": MODEL_DIR / "kbo_changwon_model.pkl",
+        "student_path": MODEL_DIR / "kbo_changwon_student.pkl",
         "name": "창원NC파크",
         "team": "NC",
         "coordinates": (35.2225, 128.5822),
+        "search_keyword": "창원",
     },
 }
 
 # 지원 구장 목록 (자동 생성)
 SUPPORTED_STADIUMS = list(STADIUM_MODELS.keys())
 
+# 전 구장 통합 모델 (python kbo_rain_model.py --global)
+# GLOBAL_MODEL_ENABLED=1 이고 파일이 있으면 구장별 모델 대신 통합 모델 하나로 예측합니다.
+GLOBAL_MODEL_PATH = MODEL_DIR / "kbo_global_model.pkl"
+GLOBAL_MODEL_ENABLED = os.environ.get("GLOBAL_MODEL_ENABLED", "0").lower() in ("1", "true", "yes")
+
+# 경량(증류) 모델을 사용할 구장 (python distill_model.py)
+# 쉼표 구분 구장 ID 또는 "all" - 파일이 없는 구장은 원래 모델을 사용합니다.
+_student_stadiums = os.environ.get("STUDENT_MODEL_STADIUMS", "").strip()
+STUDENT_MODEL_STADIUMS = (
+    set(SUPPORTED_STADIUMS)
+    if _student_stadiums.lower() == "all"
+    else {stadium.strip() for stadium in _student_stadiums.split(",") if stadium.strip()}
+)
+
+# 일괄 예측 요청당 최대 경기 수
+MAX_BATCH_PREDICTIONS = 100
+
 # 기본 구장
 DEFAULT_STADIUM = "jamsil"
 
@@ -115,3 +155,14 @@ RISK_THRESHOLDS = {
 
 # 장마철 월
 RAINY_SEASON_MONTHS = [7, 8]
+
+# =============================================================================
+# 당일 경기 취소 실시간 감시 (services/live.py)
+# =============================================================================
+# LIVE_WATCH_ENABLED=1 이면 서버 시작 시 백그라운드에서 오늘 일정을 조회합니다.
+LIVE_WATCH_ENABLED = os.environ.get("LIVE_WATCH_ENABLED", "0").lower() in ("1", "true", "yes")
+
+# 폴링 주기 (초): 기본 / 예측 취소 확률이 높을 때 / 경기 시간대 밖
+LIVE_WATCH_BASE_INTERVAL = float(os.environ.get("LIVE_WATCH_BASE_INTERVAL", "300"))
+LIVE_WATCH_FAST_INTERVAL = float(os.environ.get("LIVE_WATCH_FAST_INTERVAL", "60"))
+LIVE_WATCH_IDLE_INTERVAL = float(os.environ.get("LIVE_WATCH_IDLE_INTERVAL", "1800"))
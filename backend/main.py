@@ -12,9 +12,11 @@ from config import (
     API_DESCRIPTION,
     API_VERSION,
     CORS_ORIGINS,
+    LIVE_WATCH_ENABLED,
 )
 from api.routes import router
 from models.predictor import MultiStadiumPredictor
+from services.live import live_service
 
 # 로깅 설정
 logging.basicConfig(
@@ -51,9 +53,15 @@ async def lifespan(app: FastAPI):
         logger.error(f"모델 로딩 중 오류 발생: {e}")
         raise
 
+    # 당일 경기 취소 실시간 감시 (선택)
+    if LIVE_WATCH_ENABLED:
+        live_service.start()
+
     yield
 
     # Shutdown
+    if LIVE_WATCH_ENABLED:
+        live_service.stop()
     logger.info("=== KBO 우천취소 예측 API 종료 ===")
 
 
@@ -93,6 +101,9 @@ async def root():
             "predict": "/api/predict",
             "model_info": "/api/model-info",
             "health": "/api/health",
+            "history": "/api/history",
+            "live_cancellations": "/api/live/cancellations",
+            "live_status": "/api/live/status",
         }
     }
 
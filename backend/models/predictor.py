@@ -1,6 +1,7 @@
 """
 모델 로딩 및 예측 로직 (다중 구장 지원)
 """
+import hashlib
 import pickle
 import logging
 from pathlib import Path
@@ -10,7 +11,10 @@ import pandas as pd
 import numpy as np
 
 from config import (
+    GLOBAL_MODEL_ENABLED,
+    GLOBAL_MODEL_PATH,
     STADIUM_MODELS,
+    STUDENT_MODEL_STADIUMS,
     SUPPORTED_STADIUMS,
     THRESHOLD_HIGH,
     THRESHOLD_MEDIUM,
@@ -19,6 +23,13 @@ from config import (
     API_VERSION,
 )
 from schemas.prediction import PredictionRequest, PredictionResponse
+from shared.features import (
+    BASE_FEATURES,
+    DEFAULT_GAME_HOUR,
+    FEATURE_COLUMNS,
+    FEATURE_VERSION,
+    compute_features,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -26,11 +37,28 @@ logger = logging.getLogger(__name__)
 class StadiumModel:
     """단일 구장 모델 클래스"""
 
-    def __init__(self, stadium_id: str, model: Any, feature_cols: List[str], metadata: Dict[str, Any]):
+    def __init__(
+        self,
+        stadium_id: str,
+        model: Any,
+        feature_cols: List[str],
+        metadata: Dict[str, Any],
+        stadium_categories: Optional[List[str]] = None,
+    ):
+        """
+        Args:
+            stadium_categories: 통합 모델의 구장 범주 목록 (구장별 모델이면 None)
+        """
         self.stadium_id = stadium_id
         self.model = model
         self.feature_cols = feature_cols
         self.metadata = metadata
+        self.stadium_categories = stadium_categories
+
+    @property
+    def is_global(self) -> bool:
+        """전 구장 통합 모델 여부"""
+        return self.stadium_categories is not None
 
     def get_model_info(self) -> Dict[str, Any]:
         """모델 메타데이터 반환"""
@@ -41,7 +69,12 @@ class StadiumModel:
             "model_type": model_type,
             "feature_count": len(self.feature_cols),
             "features": self.feature_cols,
-            "description": f"KBO {self.metadata.get('name', self.stadium_id)} 우천취소 예측 모델",
+            "description": (
+                f"KBO 전 구장 통합 우천취소 예측 모델 ({self.metadata.get('name', self.stadium_id)})"
+                if self.is_global
+                else f"KBO {self.metadata.get('name', self.stadium_id)} 우천취소 예측 모델"
+                + (" (경량 모델)" if self.metadata.get("variant") == "student" else "")
+            ),
             "version": API_VERSION,
         }
 
@@ -59,12 +92,21 @@ class MultiStadiumPredictor:
         모든 구장 모델을 로드
 
         설정된 모든 구장의 모델을 로드하고, 실패한 경우 해당 구장만 스킵합니다.
-        모든 모델 로딩 실패 시 예외를 발생시킵니다.
+        GLOBAL_MODEL_ENABLED이면 통합 모델 하나를 먼저 로드하고, 통합 모델에 없는 구장만
+        구장별 모델을 로드합니다. 모든 모델 로딩 실패 시 예외를 발생시킵니다.
         """
         logger.info("=== 다중 구장 모델 로딩 시작 ===")
         logger.info(f"설정된 구장: {list(STADIUM_MODELS.keys())}")
 
+        if GLOBAL_MODEL_ENABLED:
+            try:
+                self._load_global_model()
+            except Exception as e:
+                logger.warning(f"[global] 통합 모델 로딩 실패, 구장별 모델 사용: {e}")
+
         for stadium_id, stadium_config in STADIUM_MODELS.items():
+            if stadium_id in self.models:
+                continue
             try:
                 self._load_single_model(stadium_id, stadium_config)
                 self._loaded_stadiums.append(stadium_id)
@@ -83,21 +125,37 @@ class MultiStadiumPredictor:
         """
         단일 구장 모델 로드
 
+        STUDENT_MODEL_STADIUMS에 포함된 구장은 경량(증류) 모델을 우선 로드하고,
+        경량 모델 파일이 없거나 증류 이후 원래 모델이 다시 학습되었으면 원래 모델을 사용합니다.
+
         Args:
             stadium_id: 구장 ID
             config: 구장 설정 딕셔너리
         """
         model_path = config["path"]
+        model_data = None
+        variant = "teacher"
+        if stadium_id in STUDENT_MODEL_STADIUMS:
+            student_path = config.get("student_path")
+            if student_path is not None and student_path.exists():
+                with open(student_path, "rb") as f:
+                    student_data = pickle.load(f)
+                if self._is_student_current(stadium_id, student_data, model_path):
+                    model_path, model_data, variant = student_path, student_data, "student"
+            else:
+                logger.warning(f"[{stadium_id}] 경량 모델 파일이 없어 원래 모델 사용: {student_path}")
         logger.info(f"[{stadium_id}] 모델 로딩: {model_path}")
 
-        if not model_path.exists():
-            raise FileNotFoundError(f"모델 파일을 찾을 수 없습니다: {model_path}")
+        if model_data is None:
+            if not model_path.exists():
+                raise FileNotFoundError(f"모델 파일을 찾을 수 없습니다: {model_path}")
 
-        with open(model_path, "rb") as f:
-            model_data = pickle.load(f)
+            with open(model_path, "rb") as f:
+                model_data = pickle.load(f)
 
         model = model_data["model"]
         feature_cols = model_data["feature_cols"]
+        self._check_feature_version(stadium_id, model_data)
 
         self.models[stadium_id] = StadiumModel(
             stadium_id=stadium_id,
@@ -107,10 +165,90 @@ class MultiStadiumPredictor:
                 "name": config.get("name", stadium_id),
                 "team": config.get("team", ""),
                 "coordinates": config.get("coordinates", (0, 0)),
+                "variant": variant,
             }
         )
 
-        logger.info(f"[{stadium_id}] 로딩 완료 - 피처 수: {len(feature_cols)}")
+        logger.info(f"[{stadium_id}] 로딩 완료 ({variant}) - 피처 수: {len(feature_cols)}")
+
+    def _load_global_model(self) -> None:
+        """
+        전 구장 통합 모델 로드
+
+        모델 객체 하나를 통합 모델이 학습한 모든 구장이 공유합니다.
+        """
+        logger.info(f"[global] 통합 모델 로딩: {GLOBAL_MODEL_PATH}")
+
+        if not GLOBAL_MODEL_PATH.exists():
+            raise FileNotFoundError(f"모델 파일을 찾을 수 없습니다: {GLOBAL_MODEL_PATH}")
+
+        with open(GLOBAL_MODEL_PATH, "rb") as f:
+            model_data = pickle.load(f)
+
+        model = model_data["model"]
+        feature_cols = model_data["feature_cols"]
+        stadium_categories = model_data["stadiums"]
+        self._check_feature_version("global", model_data)
+
+        for stadium_id in stadium_categories:
+            config = STADIUM_MODELS.get(stadium_id)
+            if config is None:
+                continue
+            self.models[stadium_id] = StadiumModel(
+                stadium_id=stadium_id,
+                model=model,
+                feature_cols=feature_cols,
+                metadata={
+                    "name": config.get("name", stadium_id),
+                    "team": config.get("team", ""),
+                    "coordinates": config.get("coordinates", (0, 0)),
+                },
+                stadium_categories=stadium_categories,
+            )
+            self._loaded_stadiums.append(stadium_id)
+
+        logger.info(f"[global] 로딩 완료 - 구장: {stadium_categories}, 피처 수: {len(feature_cols)}")
+
+    @staticmethod
+    def _is_student_current(stadium_id: str, student_data: Dict[str, Any], teacher_path: Path) -> bool:
+        """
+        경량 모델이 현재 원래 모델(교사)에서 증류되었는지 확인
+
+        증류 당시 교사 파일 해시가 기록되지 않았거나 현재 파일과 다르면 False (원래 모델 사용)
+        """
+        expected = (student_data.get("teacher") or {}).get("sha256")
+        if expected is None or not teacher_path.exists():
+            logger.warning(f"[{stadium_id}] 경량 모델에 원래 모델 정보가 없어 원래 모델 사용 (다시 증류하세요)")
+            return False
+        digest = hashlib.sha256()
+        with open(teacher_path, "rb") as f:
+            for chunk in iter(lambda: f.read(1 << 20), b""):
+                digest.update(chunk)
+        if digest.hexdigest() != expected:
+            logger.warning(
+                f"[{stadium_id}] 증류 이후 원래 모델이 다시 학습되어 원래 모델 사용 "
+                f"(증류 당시 학습 범위: ~{student_data['teacher'].get('data_through')}) - 다시 증류하세요"
+            )
+            return False
+        return True
+
+    @staticmethod
+    def _check_feature_version(name: str, model_data: Dict[str, Any]) -> None:
+        """
+        모델 학습 당시 피처 정의 버전 확인
+
+        버전이 기록되지 않은 모델은 버전 도입 전(1) 피처 정의로 학습된 것으로 간주합니다.
+        """
+        model_version = model_data.get("feature_version") or 1
+        if model_version != FEATURE_VERSION:
+            logger.warning(
+                f"[{name}] 모델 피처 버전({model_version})이 현재 피처 정의({FEATURE_VERSION})와 다릅니다. "
+                f"모델을 다시 학습하세요."
+            )
+
+    def uses_global_model(self) -> bool:
+        """통합 모델로 예측하는 구장이 있는지 여부"""
+        return any(model.is_global for model in self.models.values())
 
     def get_loaded_stadiums(self) -> List[str]:
         """로딩된 구장 목록 반환"""
@@ -137,65 +275,39 @@ class MultiStadiumPredictor:
             for stadium_id, model in self.models.items()
         }
 
-    def _prepare_features(self, request: PredictionRequest, feature_cols: List[str]) -> pd.DataFrame:
+    def _prepare_features(
+        self,
+        requests: List[PredictionRequest],
+        feature_cols: List[str],
+        stadium_categories: Optional[List[str]] = None,
+    ) -> pd.DataFrame:
         """
-        요청 데이터를 모델 입력 형식으로 변환
+        요청 데이터를 모델 입력 형식으로 변환 (요청 하나당 한 행)
 
         Args:
-            request: 예측 요청 데이터
+            requests: 예측 요청 데이터 목록
             feature_cols: 피처 컬럼 목록
+            stadium_categories: 통합 모델의 구장 범주 목록 (지정 시 범주형 stadium_id 컬럼 추가)
 
         Returns:
             피처 DataFrame
         """
-        # 기본 피처
-        data = {
-            "daily_precip_sum": [request.daily_precip_sum],
-            "daily_precip_hours": [request.daily_precip_hours],
-            "pre_game_precip": [request.pre_game_precip],
-            "pre_game_humidity": [request.pre_game_humidity],
-            "pre_game_temp": [request.pre_game_temp],
-            "pre_game_wind": [request.pre_game_wind],
-            "prev_day_precip": [request.prev_day_precip],
-            "daily_wind_max": [request.daily_wind_max],
-            "daily_temp_mean": [request.daily_temp_mean],
-            "month": [request.month],
-            "dayofweek": [request.dayofweek],
+        # 기본 피처 + 파생 피처 (학습과 같은 공통 모듈)
+        columns: Dict[str, Any] = {
+            name: [getattr(request, name) for request in requests]
+            for name in BASE_FEATURES + ["month", "dayofweek"]
         }
+        columns["game_hour"] = [getattr(request, "game_hour", DEFAULT_GAME_HOUR) for request in requests]
+        df = pd.DataFrame(
+            compute_features(columns, [col for col in feature_cols if col in FEATURE_COLUMNS])
+        )
 
-        # 파생 피처 계산 (새 모델용)
-        # is_weekend: 주말 여부 (토=5, 일=6)
-        data["is_weekend"] = [1 if request.dayofweek >= 5 else 0]
-        
-        # is_rainy_season: 장마철 여부 (7, 8월)
-        data["is_rainy_season"] = [1 if request.month in [7, 8] else 0]
-        
-        # game_hour: 경기 시간 (기본값 18시)
-        data["game_hour"] = [getattr(request, 'game_hour', 18)]
-        
-        # precip_intensity: 강수 강도
-        daily_precip_hours = max(request.daily_precip_hours, 1)
-        data["precip_intensity"] = [request.daily_precip_sum / daily_precip_hours]
-        
-        # humidity_precip_interaction: 습도와 강수량 상호작용
-        data["humidity_precip_interaction"] = [
-            request.pre_game_humidity * request.pre_game_precip / 100
-        ]
-        
-        # cumulative_precip_2days: 2일 누적 강수량
-        data["cumulative_precip_2days"] = [
-            request.daily_precip_sum + request.prev_day_precip
-        ]
-        
-        # ground_condition_score: 그라운드 상태 점수
-        data["ground_condition_score"] = [
-            request.prev_day_precip * 0.3 + 
-            request.pre_game_precip * 0.5 + 
-            request.pre_game_humidity * 0.2
-        ]
+        # 통합 모델: 구장 ID 범주형 피처 (학습 때와 같은 범주 순서)
+        if stadium_categories is not None:
+            df["stadium_id"] = pd.Categorical(
+                [request.stadium for request in requests], categories=stadium_categories
+            )
 
-        df = pd.DataFrame(data)
-        
         # 모델이 요구하는 피처만 선택 (순서 맞춤)
         return df[feature_cols]
 
@@ -276,22 +388,52 @@ class MultiStadiumPredictor:
         Returns:
             예측 결과
         """
-        stadium_id = request.stadium
+        return self.predict_batch([request])[0]
 
-        if stadium_id not in self.models:
-            raise ValueError(f"{stadium_id} 구장 모델을 사용할 수 없습니다.")
+    def predict_batch(self, requests: List[PredictionRequest]) -> List[PredictionResponse]:
+        """
+        여러 경기 우천취소 일괄 예측
 
-        stadium_model = self.models[stadium_id]
+        같은 모델을 쓰는 요청끼리 묶어 predict_proba를 한 번만 호출합니다.
+        통합 모델을 쓰면 구장이 섞인 요청도 한 번의 호출로 예측합니다.
 
-        # 피처 준비
-        features_df = self._prepare_features(request, stadium_model.feature_cols)
+        Args:
+            requests: 예측 요청 데이터 목록 (구장 혼합 가능)
 
-        # 예측 수행
-        probabilities = stadium_model.model.predict_proba(features_df)
-        cancel_probability = float(probabilities[0][1])
+        Returns:
+            요청 순서대로의 예측 결과
+        """
+        # 모델별 요청 묶기 (통합 모델은 모든 구장이 같은 모델 객체를 공유)
+        groups: Dict[int, Tuple[StadiumModel, List[int]]] = {}
+        for index, request in enumerate(requests):
+            stadium_model = self.models.get(request.stadium)
+            if stadium_model is None:
+                raise ValueError(f"{request.stadium} 구장 모델을 사용할 수 없습니다.")
+            groups.setdefault(id(stadium_model.model), (stadium_model, []))[1].append(index)
+
+        probabilities: List[float] = [0.0] * len(requests)
+        for stadium_model, indices in groups.values():
+            # 피처 준비
+            features_df = self._prepare_features(
+                [requests[i] for i in indices], stadium_model.feature_cols, stadium_model.stadium_categories
+            )
+
+            # 예측 수행
+            group_probabilities = stadium_model.model.predict_proba(features_df)[:, 1]
+            for i, probability in zip(indices, group_probabilities):
+                probabilities[i] = float(probability)
+
+        return [
+            self._build_response(request, probability)
+            for request, probability in zip(requests, probabilities)
+        ]
+
+    def _build_response(self, request: PredictionRequest, probability: float) -> PredictionResponse:
+        """예측 확률로 응답 생성"""
+        stadium_id = request.stadium
 
         # 소수점 3자리로 반올림
-        cancel_probability = round(cancel_probability, 3)
+        cancel_probability = round(probability, 3)
 
         # 예측 결과 및 신뢰도 결정
         prediction, confidence = self._determine_prediction_result(cancel_probability)
@@ -301,7 +443,7 @@ class MultiStadiumPredictor:
 
         return PredictionResponse(
             stadium=stadium_id,
-            stadium_name=stadium_model.metadata.get("name", stadium_id),
+            stadium_name=self.models[stadium_id].metadata.get("name", stadium_id),
             cancellation_probability=cancel_probability,
             prediction=prediction,
             confidence=confidence,
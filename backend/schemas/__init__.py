@@ -6,6 +6,10 @@ from .prediction import (
     AllModelsInfoResponse,
     StadiumInfo,
     StadiumListResponse,
+    HistoryResponse,
+    LiveCancellationEvent,
+    LiveCancellationResponse,
+    LiveStatusResponse,
 )
 
 __all__ = [
@@ -16,4 +20,8 @@ __all__ = [
     "AllModelsInfoResponse",
     "StadiumInfo",
     "StadiumListResponse",
+    "HistoryResponse",
+    "LiveCancellationEvent",
+    "LiveCancellationResponse",
+    "LiveStatusResponse",
 ]
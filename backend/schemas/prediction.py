@@ -4,7 +4,7 @@ Pydantic 요청/응답 스키마 정의
 from pydantic import BaseModel, Field, field_validator
 from typing import List, Optional, Dict, Any
 
-from config import SUPPORTED_STADIUMS, DEFAULT_STADIUM
+from config import SUPPORTED_STADIUMS, DEFAULT_STADIUM, MAX_BATCH_PREDICTIONS
 
 
 class PredictionRequest(BaseModel):
@@ -70,6 +70,10 @@ class PredictionRequest(BaseModel):
         le=6,
         description="요일 (0=월요일, 6=일요일)"
     )
+    game_date: Optional[str] = Field(
+        default=None,
+        description="경기 날짜 (YYYY-MM-DD 형식, 오늘 경기면 실시간 취소 감시 주기 조정에 반영)"
+    )
 
     @field_validator("stadium")
     @classmethod
@@ -81,6 +85,18 @@ class PredictionRequest(BaseModel):
             )
         return v
 
+    @field_validator("game_date")
+    @classmethod
+    def validate_game_date(cls, v: Optional[str]) -> Optional[str]:
+        if v is None:
+            return v
+        try:
+            from datetime import datetime
+            datetime.strptime(v, "%Y-%m-%d")
+        except ValueError:
+            raise ValueError("날짜 형식이 올바르지 않습니다. YYYY-MM-DD 형식으로 입력하세요.")
+        return v
+
     model_config = {
         "json_schema_extra": {
             "examples": [
@@ -96,7 +112,8 @@ class PredictionRequest(BaseModel):
                     "daily_wind_max": 20.0,
                     "daily_temp_mean": 24.0,
                     "month": 7,
-                    "dayofweek": 5
+                    "dayofweek": 5,
+                    "game_date": "2025-07-15"
                 }
             ]
         }
@@ -153,6 +170,24 @@ class PredictionResponse(BaseModel):
     }
 
 
+class BatchPredictionRequest(BaseModel):
+    """여러 경기 우천취소 일괄 예측 요청 스키마"""
+
+    games: List[PredictionRequest] = Field(
+        ...,
+        min_length=1,
+        max_length=MAX_BATCH_PREDICTIONS,
+        description=f"경기별 예측 요청 (구장 혼합 가능, 최대 {MAX_BATCH_PREDICTIONS}개)"
+    )
+
+
+class BatchPredictionResponse(BaseModel):
+    """여러 경기 우천취소 일괄 예측 응답 스키마"""
+
+    results: List[PredictionResponse] = Field(..., description="요청 순서대로의 예측 결과")
+    global_model: bool = Field(..., description="전 구장 통합 모델 사용 여부")
+
+
 class HealthResponse(BaseModel):
     """헬스 체크 응답 스키마"""
 
@@ -483,3 +518,98 @@ class WeatherTimelineResponse(BaseModel):
             ]
         }
     }
+
+
+class YearlyHistory(BaseModel):
+    """연도별 이력 집계"""
+
+    total_games: int = Field(..., description="경기 수")
+    rain_cancelled: int = Field(..., description="우천취소 경기 수")
+
+
+class HistoryResponse(BaseModel):
+    """과거 우천취소 이력 응답 스키마"""
+
+    stadium: str = Field(..., description="구장 ID")
+    stadium_name: str = Field(..., description="구장 한글명")
+    month: Optional[int] = Field(default=None, description="조회 월 (미지정 시 전체)")
+    min_pre_game_precip: Optional[float] = Field(
+        default=None, description="경기 전 강수량 하한 (mm)"
+    )
+    total_games: int = Field(..., description="조건에 맞는 경기 수")
+    rain_cancelled: int = Field(..., description="우천취소 경기 수")
+    cancellation_rate: float = Field(..., ge=0.0, le=1.0, description="우천취소 비율")
+    by_year: Dict[str, YearlyHistory] = Field(default_factory=dict, description="연도별 집계")
+
+    model_config = {
+        "json_schema_extra": {
+            "examples": [
+                {
+                    "stadium": "jamsil",
+                    "stadium_name": "잠실야구장",
+                    "month": 7,
+                    "min_pre_game_precip": 5.0,
+                    "total_games": 12,
+                    "rain_cancelled": 9,
+                    "cancellation_rate": 0.75,
+                    "by_year": {
+                        "2024": {"total_games": 3, "rain_cancelled": 2}
+                    }
+                }
+            ]
+        }
+    }
+
+
+class LiveCancellationEvent(BaseModel):
+    """당일 경기 상태 변경 이벤트"""
+
+    stadium_id: str = Field(..., description="구장 ID")
+    date: str = Field(..., description="경기 날짜")
+    home: str = Field(..., description="홈팀")
+    away: str = Field(..., description="원정팀")
+    cancelled: bool = Field(..., description="취소 여부")
+    reason: str = Field(..., description="사유 (우천취소/정상진행 등)")
+    note: str = Field(..., description="일정 비고")
+    detected_at: str = Field(..., description="감지 시각")
+
+
+class LiveCancellationResponse(BaseModel):
+    """당일 경기 취소 이벤트 목록 응답 스키마"""
+
+    events: List[LiveCancellationEvent] = Field(default_factory=list, description="최근 이벤트 (최신순)")
+
+    model_config = {
+        "json_schema_extra": {
+            "examples": [
+                {
+                    "events": [
+                        {
+                            "stadium_id": "jamsil",
+                            "date": "2025-07-15",
+                            "home": "LG",
+                            "away": "두산",
+                            "cancelled": True,
+                            "reason": "우천취소",
+                            "note": "우천취소",
+                            "detected_at": "2025-07-15T16:42:10"
+                        }
+                    ]
+                }
+            ]
+        }
+    }
+
+
+class LiveStatusResponse(BaseModel):
+    """당일 경기 취소 감시 상태 응답 스키마"""
+
+    running: bool = Field(..., description="감시 실행 여부")
+    max_probability: Optional[float] = Field(
+        default=None, description="오늘 예측 요청에서 관측한 최대 취소 확률"
+    )
+    polls: int = Field(..., description="조회 횟수")
+    unchanged_polls: int = Field(..., description="내용 변화 없이 파싱을 생략한 조회 횟수")
+    last_poll_at: Optional[str] = Field(default=None, description="마지막 조회 시각")
+    next_interval: Optional[float] = Field(default=None, description="다음 조회까지 대기 시간 (초)")
+    games_today: int = Field(..., description="오늘 감시 중인 경기 수")
@@ -0,0 +1,106 @@
+"""
+과거 경기 이력 조회 서비스 (구장/연/월 파티션 데이터셋 쿼리)
+
+data/store/with_weather (stadium_id=/year=/month= hive 파티션)를
+pyarrow dataset으로 스캔하며, 구장/월 조건은 파티션 가지치기로,
+강수량 조건은 Parquet 통계 푸시다운으로 처리합니다.
+"""
+import logging
+from pathlib import Path
+from typing import Optional
+
+from config import DATA_STORE_DIR
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.dataset as ds
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+RAIN_CANCEL_REASON = "우천취소"
+NORMAL_REASON = "정상진행"
+
+
+class HistoryService:
+    """구장별 과거 우천취소 이력 서비스"""
+
+    def __init__(self, store_dir: Path = DATA_STORE_DIR):
+        self.dataset_dir = Path(store_dir) / "with_weather"
+        self._dataset = None
+
+    def is_available(self) -> bool:
+        """이력 데이터셋 사용 가능 여부"""
+        return PYARROW_AVAILABLE and self.dataset_dir.exists()
+
+    def _get_dataset(self):
+        """파티션 데이터셋 (지연 생성, 프로세스 내 재사용)"""
+        if self._dataset is None:
+            partitioning = ds.partitioning(
+                pa.schema([("stadium_id", pa.string()), ("year", pa.int32()), ("month", pa.int32())]),
+                flavor="hive",
+            )
+            self._dataset = ds.dataset(self.dataset_dir, format="parquet", partitioning=partitioning)
+        return self._dataset
+
+    def get_cancellation_history(
+        self,
+        stadium: str,
+        month: Optional[int] = None,
+        min_pre_game_precip: Optional[float] = None,
+    ) -> dict:
+        """
+        구장 과거 우천취소 이력 집계
+
+        Args:
+            stadium: 구장 ID
+            month: 월 (미지정 시 전체 시즌)
+            min_pre_game_precip: 경기 전 강수량 하한 (mm, 미지정 시 조건 없음)
+
+        Returns:
+            이력 집계 딕셔너리
+        """
+        if not self.is_available():
+            raise RuntimeError("과거 경기 데이터셋을 사용할 수 없습니다.")
+
+        expression = (pc.field("stadium_id") == stadium) & pc.field("reason").isin(
+            [RAIN_CANCEL_REASON, NORMAL_REASON]
+        )
+        if month is not None:
+            expression &= pc.field("month") == month
+        if min_pre_game_precip is not None:
+            expression &= pc.field("pre_game_precip") >= min_pre_game_precip
+
+        table = self._get_dataset().to_table(columns=["year", "reason"], filter=expression)
+        years = table.column("year").to_pylist()
+        cancelled_flags = [
+            reason == RAIN_CANCEL_REASON for reason in table.column("reason").to_pylist()
+        ]
+
+        by_year = {}
+        for year, is_cancelled in zip(years, cancelled_flags):
+            stats = by_year.setdefault(year, {"total_games": 0, "rain_cancelled": 0})
+            stats["total_games"] += 1
+            stats["rain_cancelled"] += int(is_cancelled)
+
+        total_games = len(years)
+        rain_cancelled = sum(cancelled_flags)
+
+        logger.info(
+            f"[HISTORY] stadium={stadium}, month={month}, "
+            f"min_pre_game_precip={min_pre_game_precip}, games={total_games}"
+        )
+
+        return {
+            "total_games": total_games,
+            "rain_cancelled": rain_cancelled,
+            "cancellation_rate": round(rain_cancelled / total_games, 3) if total_games else 0.0,
+            "by_year": {str(year): by_year[year] for year in sorted(by_year)},
+        }
+
+
+# 싱글톤 인스턴스
+history_service = HistoryService()
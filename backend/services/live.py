@@ -0,0 +1,155 @@
+"""
+당일 경기 취소 실시간 감시 서비스
+
+백그라운드 스레드에서 KBO 일정(GetScheduleList)을 적응형 주기로 조회하고,
+상태가 바뀐 경기를 이벤트 스트림(shared.cancel_watch.EventStream)으로 발행합니다.
+API는 최근 이벤트를 조회하고, 예측 요청 시 관측한 오늘 최대 취소 확률이
+높으면 조회 주기를 줄입니다.
+
+데이터셋 저장소는 읽기 전용으로 마운트되므로 기록은 루트 cancel_watcher.py가 담당합니다.
+"""
+import json
+import logging
+import threading
+from datetime import date
+from typing import Dict, List, Optional
+
+import httpx
+
+from config import (
+    LIVE_WATCH_BASE_INTERVAL,
+    LIVE_WATCH_FAST_INTERVAL,
+    LIVE_WATCH_IDLE_INTERVAL,
+    STADIUM_MODELS,
+    THRESHOLD_MEDIUM,
+)
+from shared.cancel_watch import AdaptivePollInterval, CancellationEvent, CancellationWatcher, EventStream
+from shared.schedule_parser import build_keyword_lookup, parse_schedule_html, schedule_json_to_html
+
+logger = logging.getLogger(__name__)
+
+SCHEDULE_URL = "https://www.koreabaseball.com/Schedule/Schedule.aspx"
+SCHEDULE_API_URL = "https://www.koreabaseball.com/ws/Schedule.asmx/GetScheduleList"
+REGULAR_SEASON_SERIES = "0,9,6"
+
+
+class LiveCancellationService:
+    """당일 경기 취소 감시 서비스 (백그라운드 스레드)"""
+
+    def __init__(self, timeout: float = 10.0):
+        self.timeout = timeout
+        self.stream = EventStream()
+        self.watcher = CancellationWatcher(
+            fetch_page=self._fetch_page,
+            parse_games=self._parse_games,
+            stream=self.stream,
+            interval=AdaptivePollInterval(
+                base=LIVE_WATCH_BASE_INTERVAL,
+                fast=LIVE_WATCH_FAST_INTERVAL,
+                idle=LIVE_WATCH_IDLE_INTERVAL,
+                threshold=THRESHOLD_MEDIUM,
+            ),
+            probability_source=self.max_probability,
+        )
+        self._match_stadium = build_keyword_lookup(
+            {stadium_id: config["search_keyword"] for stadium_id, config in STADIUM_MODELS.items()}
+        )
+        self._client: Optional[httpx.Client] = None
+        self._thread: Optional[threading.Thread] = None
+        self._stop_event = threading.Event()
+        # 오늘 예측 요청에서 관측한 구장별 최대 취소 확률
+        self._probabilities: Dict[str, float] = {}
+        self._probability_day: Optional[date] = None
+        self._lock = threading.Lock()
+
+    def _fetch_page(self, day: date) -> str:
+        """오늘이 속한 월의 일정 테이블 HTML (GetScheduleList 요청 1회)"""
+        if self._client is None:
+            self._client = httpx.Client(
+                timeout=self.timeout,
+                headers={"Referer": SCHEDULE_URL, "X-Requested-With": "XMLHttpRequest"},
+            )
+        response = self._client.post(
+            SCHEDULE_API_URL,
+            data={
+                "leId": "1",
+                "srIdList": REGULAR_SEASON_SERIES,
+                "seasonId": str(day.year),
+                "gameMonth": f"{day.month:02d}",
+                "teamId": "",
+            },
+        )
+        response.raise_for_status()
+        data = response.json()
+        if isinstance(data, dict) and isinstance(data.get("d"), str):
+            data = json.loads(data["d"])
+        return schedule_json_to_html(data)
+
+    def _parse_games(self, html: str, day: date) -> List[dict]:
+        games = []
+        for game in parse_schedule_html(html, day.year):
+            stadium_id = self._match_stadium(game.stadium)
+            if stadium_id is not None:
+                games.append({**game.to_dict(), "stadium_id": stadium_id})
+        return games
+
+    def observe_prediction(self, stadium: str, probability: float, game_date: Optional[str]) -> None:
+        """예측 결과 관측 (오늘 경기 예측만 오늘 최대 취소 확률에 반영)"""
+        today = date.today()
+        if game_date != today.isoformat():
+            return
+        with self._lock:
+            if self._probability_day != today:
+                self._probability_day, self._probabilities = today, {}
+            self._probabilities[stadium] = max(probability, self._probabilities.get(stadium, 0.0))
+
+    def max_probability(self) -> Optional[float]:
+        """오늘 관측한 최대 예측 취소 확률 (관측 없으면 None)"""
+        with self._lock:
+            if self._probability_day != date.today() or not self._probabilities:
+                return None
+            return max(self._probabilities.values())
+
+    def is_running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        """감시 스레드 시작"""
+        if self.is_running():
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(
+            target=self.watcher.run, args=(self._stop_event,), name="live-cancel-watch", daemon=True
+        )
+        self._thread.start()
+        logger.info("[LIVE] 당일 경기 취소 감시 시작")
+
+    def stop(self) -> None:
+        """감시 스레드 종료"""
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout=self.timeout + 1)
+            self._thread = None
+        if self._client is not None:
+            self._client.close()
+            self._client = None
+        logger.info("[LIVE] 당일 경기 취소 감시 종료")
+
+    def recent_events(self, stadium: Optional[str] = None, limit: int = 20) -> List[CancellationEvent]:
+        """최근 상태 변경 이벤트 (최신순)"""
+        events = self.stream.recent()
+        if stadium is not None:
+            events = [event for event in events if event.stadium_id == stadium]
+        return events[:limit]
+
+    def status(self) -> dict:
+        """감시 상태"""
+        return {
+            "running": self.is_running(),
+            "max_probability": self.max_probability(),
+            **self.watcher.status(),
+        }
+
+
+# 싱글톤 인스턴스
+live_service = LiveCancellationService()
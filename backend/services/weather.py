@@ -1,12 +1,17 @@
 """
 Open-Meteo API를 사용한 날씨 데이터 수집 서비스
 """
+import asyncio
 import logging
+import math
+import time
+from collections import OrderedDict
 from datetime import datetime, timedelta
-from typing import Optional
+from typing import Dict, Optional, Tuple
 import httpx
 
 from config import STADIUM_MODELS
+from shared.weather_window import HourlyWeatherIndex, window_features
 
 logger = logging.getLogger(__name__)
 
@@ -14,12 +19,122 @@ logger = logging.getLogger(__name__)
 FORECAST_API_URL = "https://api.open-meteo.com/v1/forecast"
 HISTORICAL_API_URL = "https://archive-api.open-meteo.com/v1/archive"
 
+# 모든 조회가 공유하는 변수 집합 (격자 셀 + 날짜당 한 번만 요청)
+HOURLY_VARIABLES = "temperature_2m,relative_humidity_2m,precipitation,wind_speed_10m"
+DAILY_VARIABLES = "precipitation_sum,precipitation_hours,temperature_2m_mean,wind_speed_10m_max"
+
+# 응답 캐시 설정
+RESPONSE_CACHE_SIZE = 512
+FORECAST_CACHE_TTL = 600.0  # 예보: 10분
+HISTORICAL_CACHE_TTL = None  # 과거 데이터: 만료 없음
+# 최근 며칠은 아카이브 반영(backfill) 중이라 값이 바뀔 수 있으므로 짧게 캐시
+RECENT_ARCHIVE_DAYS = 5
+RECENT_HISTORICAL_CACHE_TTL = 3600.0  # 1시간
+
+GridCell = Tuple[float, float]
+
+
+def _value_or_default(value: float, default: float) -> float:
+    """결측(NaN) 또는 0이면 기본값 반환"""
+    if math.isnan(value) or not value:
+        return default
+    return value
+
 
 class WeatherService:
     """Open-Meteo API를 사용한 날씨 데이터 서비스"""
 
     def __init__(self, timeout: float = 10.0):
         self.timeout = timeout
+        # (API, 구장 좌표) -> Open-Meteo 격자 셀 좌표
+        self._grid_cells: Dict[Tuple[str, float, float], GridCell] = {}
+        # (API, 격자 셀, 날짜) -> (저장 시각, 응답)
+        self._responses: "OrderedDict[Tuple[str, GridCell, str], Tuple[float, dict]]" = OrderedDict()
+        # 진행 중인 동일 요청 공유
+        self._inflight: Dict[Tuple[str, GridCell, str], asyncio.Task] = {}
+
+    async def _fetch_day(self, api_url: str, lat: float, lon: float, date: str) -> dict:
+        """
+        하루치 날씨 응답 조회 (격자 셀 단위 캐시)
+
+        Open-Meteo는 좌표를 모델 격자 셀로 스냅하므로, 구장 좌표를 응답의
+        격자 셀 좌표로 한 번 해석한 뒤 요청/캐시를 격자 셀 기준으로 수행합니다.
+        같은 셀에 있는 구장들은 하나의 업스트림 요청과 캐시 항목을 공유합니다.
+        """
+        cell = self._grid_cells.get((api_url, lat, lon))
+        if cell is not None:
+            cached = self._get_cached(api_url, cell, date)
+            if cached is not None:
+                return cached
+            coords = cell
+        else:
+            coords = (lat, lon)
+
+        key = (api_url, coords, date)
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._request_day(api_url, coords, date))
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        data = await task
+
+        # 응답의 격자 셀 좌표로 구장 좌표 해석 (최초 1회)
+        cell = (data.get("latitude", coords[0]), data.get("longitude", coords[1]))
+        if (api_url, lat, lon) not in self._grid_cells:
+            self._grid_cells[(api_url, lat, lon)] = cell
+            self._grid_cells.setdefault((api_url, cell[0], cell[1]), cell)
+            logger.info(f"[WEATHER] 격자 셀 해석: ({lat}, {lon}) -> {cell} ({api_url})")
+        self._put_cached(api_url, cell, date, data)
+        return data
+
+    async def _request_day(self, api_url: str, coords: GridCell, date: str) -> dict:
+        """업스트림 하루치 요청"""
+        params = {
+            "latitude": coords[0],
+            "longitude": coords[1],
+            "hourly": HOURLY_VARIABLES,
+            "daily": DAILY_VARIABLES,
+            "timezone": "Asia/Seoul",
+            "start_date": date,
+            "end_date": date,
+        }
+
+        async with httpx.AsyncClient(timeout=self.timeout) as client:
+            response = await client.get(api_url, params=params)
+            response.raise_for_status()
+            return response.json()
+
+    @staticmethod
+    def _cache_ttl(api_url: str, date: str) -> Optional[float]:
+        """응답 캐시 유효 시간 (초, None이면 만료 없음)"""
+        if api_url == FORECAST_API_URL:
+            return FORECAST_CACHE_TTL
+        days_ago = (datetime.now().date() - datetime.strptime(date, "%Y-%m-%d").date()).days
+        if days_ago <= RECENT_ARCHIVE_DAYS:
+            return RECENT_HISTORICAL_CACHE_TTL
+        return HISTORICAL_CACHE_TTL
+
+    def _get_cached(self, api_url: str, cell: GridCell, date: str) -> Optional[dict]:
+        """캐시된 응답 반환 (만료 시 None)"""
+        key = (api_url, cell, date)
+        entry = self._responses.get(key)
+        if entry is None:
+            return None
+        stored_at, data = entry
+        ttl = self._cache_ttl(api_url, date)
+        if ttl is not None and time.monotonic() - stored_at > ttl:
+            del self._responses[key]
+            return None
+        self._responses.move_to_end(key)
+        return data
+
+    def _put_cached(self, api_url: str, cell: GridCell, date: str, data: dict) -> None:
+        """응답 캐시 저장 (LRU)"""
+        key = (api_url, cell, date)
+        self._responses[key] = (time.monotonic(), data)
+        self._responses.move_to_end(key)
+        while len(self._responses) > RESPONSE_CACHE_SIZE:
+            self._responses.popitem(last=False)
 
     async def get_weather_for_game(
         self,
@@ -81,21 +196,7 @@ class WeatherService:
         game_hour: int
     ) -> dict:
         """예보 데이터 조회 (오늘 이후)"""
-        params = {
-            "latitude": lat,
-            "longitude": lon,
-            "hourly": "temperature_2m,relative_humidity_2m,precipitation,wind_speed_10m",
-            "daily": "precipitation_sum,precipitation_hours,temperature_2m_mean,wind_speed_10m_max",
-            "timezone": "Asia/Seoul",
-            "start_date": date,
-            "end_date": date,
-        }
-
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            response = await client.get(FORECAST_API_URL, params=params)
-            response.raise_for_status()
-            data = response.json()
-
+        data = await self._fetch_day(FORECAST_API_URL, lat, lon, date)
         return self._parse_weather_data(data, game_hour)
 
     async def _fetch_historical(
@@ -106,21 +207,7 @@ class WeatherService:
         game_hour: int
     ) -> dict:
         """과거 데이터 조회"""
-        params = {
-            "latitude": lat,
-            "longitude": lon,
-            "hourly": "temperature_2m,relative_humidity_2m,precipitation,wind_speed_10m",
-            "daily": "precipitation_sum,precipitation_hours,temperature_2m_mean,wind_speed_10m_max",
-            "timezone": "Asia/Seoul",
-            "start_date": date,
-            "end_date": date,
-        }
-
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            response = await client.get(HISTORICAL_API_URL, params=params)
-            response.raise_for_status()
-            data = response.json()
-
+        data = await self._fetch_day(HISTORICAL_API_URL, lat, lon, date)
         return self._parse_weather_data(data, game_hour)
 
     async def _get_prev_day_precip(self, lat: float, lon: float, date: str) -> float:
@@ -134,21 +221,8 @@ class WeatherService:
         else:
             api_url = HISTORICAL_API_URL
 
-        params = {
-            "latitude": lat,
-            "longitude": lon,
-            "daily": "precipitation_sum",
-            "timezone": "Asia/Seoul",
-            "start_date": date,
-            "end_date": date,
-        }
-
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.get(api_url, params=params)
-                response.raise_for_status()
-                data = response.json()
-
+            data = await self._fetch_day(api_url, lat, lon, date)
             precip = data.get("daily", {}).get("precipitation_sum", [0])[0]
             return precip if precip is not None else 0.0
         except Exception as e:
@@ -166,35 +240,17 @@ class WeatherService:
         daily_temp_mean = daily.get("temperature_2m_mean", [20])[0] or 20.0
         daily_wind_max = daily.get("wind_speed_10m_max", [5])[0] or 5.0
 
-        # 경기 전 3시간 데이터 (game_hour-3 ~ game_hour)
-        temps = hourly.get("temperature_2m", [])
-        humidities = hourly.get("relative_humidity_2m", [])
-        precips = hourly.get("precipitation", [])
-        winds = hourly.get("wind_speed_10m", [])
-
-        # 경기 전 3시간 인덱스 (예: 18시 경기면 15, 16, 17시)
-        start_hour = max(0, game_hour - 3)
-        end_hour = game_hour
-
-        # 경기 전 3시간 강수량 합계
-        pre_game_precip = sum(
-            p for p in precips[start_hour:end_hour] if p is not None
-        )
-
-        # 경기 직전 시간의 기상 데이터 (game_hour - 1)
-        pre_hour_idx = max(0, game_hour - 1)
-
-        pre_game_humidity = (
-            humidities[pre_hour_idx] if pre_hour_idx < len(humidities) else 60.0
-        ) or 60.0
-
-        pre_game_temp = (
-            temps[pre_hour_idx] if pre_hour_idx < len(temps) else 20.0
-        ) or 20.0
+        # 경기 전 윈도우 피처 (학습 데이터 수집기와 동일한 윈도우 정의 사용)
+        index = HourlyWeatherIndex.from_open_meteo(hourly)
+        pre_game = {
+            name: float(values[0])
+            for name, values in window_features(index, [game_hour]).items()
+        }
 
-        pre_game_wind = (
-            winds[pre_hour_idx] if pre_hour_idx < len(winds) else 5.0
-        ) or 5.0
+        pre_game_precip = pre_game["pre_game_precip"]
+        pre_game_humidity = _value_or_default(pre_game["pre_game_humidity"], 60.0)
+        pre_game_temp = _value_or_default(pre_game["pre_game_temp"], 20.0)
+        pre_game_wind = _value_or_default(pre_game["pre_game_wind"], 5.0)
 
         return {
             "daily_precip_sum": round(daily_precip_sum, 1),
@@ -247,19 +303,7 @@ class WeatherService:
         else:
             api_url = HISTORICAL_API_URL
 
-        params = {
-            "latitude": lat,
-            "longitude": lon,
-            "hourly": "precipitation",
-            "timezone": "Asia/Seoul",
-            "start_date": game_date,
-            "end_date": game_date,
-        }
-
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            response = await client.get(api_url, params=params)
-            response.raise_for_status()
-            data = response.json()
+        data = await self._fetch_day(api_url, lat, lon, game_date)
 
         hourly = data.get("hourly", {})
         precips = hourly.get("precipitation", [])
@@ -0,0 +1,256 @@
+"""
+당일 경기 취소 실시간 감시 (수집기/백엔드 공통)
+
+오늘 경기 일정 페이지를 주기적으로 조회하여 직전 스냅샷과 비교하고,
+상태가 바뀐 경기(새로 취소된 경기 등)를 CancellationEvent로 발행합니다.
+
+- 폴링 비용 최소화: 페이지 내용 해시가 직전과 같으면 파싱/비교를 생략합니다.
+- 적응형 주기: 오늘 경기 중 예측 취소 확률이 높은 구장이 있으면 짧은 주기로,
+  경기 시간대가 아니면 긴 주기로 조회합니다 (AdaptivePollInterval).
+- EventStream: 프로세스 내 발행/구독 (스레드 안전). 백엔드는 구독하여 최근 이벤트를
+  제공하고, 루트 cancel_watcher.py는 구독하여 데이터셋 저장소에 기록합니다.
+
+페이지 조회/파싱 함수는 주입받으므로 이 모듈은 표준 라이브러리 외 의존성이 없어야 합니다.
+"""
+import hashlib
+import logging
+import threading
+from collections import deque
+from dataclasses import asdict, dataclass
+from datetime import date, datetime
+from typing import Callable, Deque, Dict, Iterable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# (구장 ID, 날짜, 홈팀, 원정팀) -> (취소 여부, 사유, 비고)
+GameKey = Tuple[str, str, str, str]
+GameStatus = Tuple[bool, str, str]
+
+
+@dataclass(frozen=True)
+class CancellationEvent:
+    """경기 상태 변경 이벤트"""
+
+    stadium_id: str
+    date: str
+    home: str
+    away: str
+    cancelled: bool
+    reason: str
+    note: str
+    detected_at: str
+
+    def to_dict(self) -> dict:
+        return asdict(self)
+
+
+class EventStream:
+    """프로세스 내 이벤트 발행/구독 (스레드 안전, 최근 이벤트 보관)"""
+
+    def __init__(self, history_size: int = 100):
+        self._subscribers: List[Callable[[CancellationEvent], None]] = []
+        self._history: Deque[CancellationEvent] = deque(maxlen=history_size)
+        self._lock = threading.Lock()
+
+    def subscribe(self, callback: Callable[[CancellationEvent], None]) -> Callable[[], None]:
+        """
+        구독 등록
+
+        Returns:
+            callable: 구독 해제 함수
+        """
+        with self._lock:
+            self._subscribers.append(callback)
+
+        def unsubscribe() -> None:
+            with self._lock:
+                if callback in self._subscribers:
+                    self._subscribers.remove(callback)
+
+        return unsubscribe
+
+    def publish(self, event: CancellationEvent) -> None:
+        """이벤트 발행 (구독자 예외는 기록 후 무시)"""
+        with self._lock:
+            self._history.append(event)
+            subscribers = list(self._subscribers)
+        for callback in subscribers:
+            try:
+                callback(event)
+            except Exception:
+                logger.exception("[WATCH] 이벤트 구독자 처리 실패")
+
+    def recent(self, limit: Optional[int] = None) -> List[CancellationEvent]:
+        """최근 이벤트 (최신순)"""
+        with self._lock:
+            events = list(reversed(self._history))
+        return events if limit is None else events[:limit]
+
+
+@dataclass
+class AdaptivePollInterval:
+    """
+    적응형 폴링 주기 (초)
+
+    - 경기 시간대(active_hours) 밖: idle
+    - 예측 취소 확률이 threshold 이상인 구장이 있음: fast
+    - 그 외: base
+    """
+
+    base: float = 300.0
+    fast: float = 60.0
+    idle: float = 1800.0
+    threshold: float = 0.5
+    active_hours: Tuple[int, int] = (11, 23)
+
+    def next_interval(self, max_probability: Optional[float], now: Optional[datetime] = None) -> float:
+        now = now or datetime.now()
+        start_hour, end_hour = self.active_hours
+        if not start_hour <= now.hour < end_hour:
+            return self.idle
+        if max_probability is not None and max_probability >= self.threshold:
+            return self.fast
+        return self.base
+
+
+def snapshot_games(games: Iterable[dict]) -> Dict[GameKey, GameStatus]:
+    """경기 목록 → 스냅샷 {(구장, 날짜, 홈, 원정): (취소 여부, 사유, 비고)}"""
+    return {
+        (g["stadium_id"], g["date"], g["home"], g["away"]): (bool(g["cancelled"]), g["reason"], g["note"])
+        for g in games
+    }
+
+
+def diff_snapshots(
+    previous: Optional[Dict[GameKey, GameStatus]],
+    current: Dict[GameKey, GameStatus],
+    detected_at: str,
+) -> List[CancellationEvent]:
+    """
+    스냅샷 비교
+
+    상태가 바뀐 경기와, 직전 스냅샷에 없던 취소 경기(첫 폴링 포함)를 이벤트로 반환합니다.
+    현재 스냅샷에서 사라진 경기는 무시합니다.
+    """
+    previous = previous or {}
+    events = []
+    for key, status in current.items():
+        old = previous.get(key)
+        if old == status or (old is None and not status[0]):
+            continue
+        stadium_id, game_date, home, away = key
+        cancelled, reason, note = status
+        events.append(
+            CancellationEvent(
+                stadium_id=stadium_id,
+                date=game_date,
+                home=home,
+                away=away,
+                cancelled=cancelled,
+                reason=reason,
+                note=note,
+                detected_at=detected_at,
+            )
+        )
+    return events
+
+
+class CancellationWatcher:
+    """당일 경기 취소 감시 루프"""
+
+    def __init__(
+        self,
+        fetch_page: Callable[[date], str],
+        parse_games: Callable[[str, date], List[dict]],
+        stream: EventStream,
+        interval: Optional[AdaptivePollInterval] = None,
+        probability_source: Optional[Callable[[], Optional[float]]] = None,
+    ):
+        """
+        Args:
+            fetch_page: 날짜 → 해당 월 일정 페이지 HTML
+            parse_games: (HTML, 날짜) → 경기 dict 리스트
+                         (stadium_id, date, home, away, cancelled, reason, note 포함)
+            stream: 이벤트 발행 대상
+            interval: 폴링 주기 정책
+            probability_source: 오늘 경기 최대 예측 취소 확률 (없으면 None 반환)
+        """
+        self.fetch_page = fetch_page
+        self.parse_games = parse_games
+        self.stream = stream
+        self.interval = interval or AdaptivePollInterval()
+        self.probability_source = probability_source
+
+        self._day: Optional[date] = None
+        self._digest: Optional[str] = None
+        self._snapshot: Optional[Dict[GameKey, GameStatus]] = None
+
+        self.polls = 0
+        self.unchanged_polls = 0
+        self.last_poll_at: Optional[str] = None
+        self.last_interval: Optional[float] = None
+
+    def poll_once(self, today: Optional[date] = None) -> List[CancellationEvent]:
+        """
+        한 번 조회하여 상태가 바뀐 경기 이벤트 발행
+
+        Returns:
+            list: 발행한 이벤트
+        """
+        today = today or date.today()
+        if today != self._day:
+            # 날짜가 바뀌면 새 스냅샷으로 시작
+            self._day, self._digest, self._snapshot = today, None, None
+
+        html = self.fetch_page(today)
+        self.polls += 1
+        self.last_poll_at = datetime.now().isoformat(timespec="seconds")
+
+        digest = hashlib.sha256(html.encode("utf-8")).hexdigest()
+        if digest == self._digest:
+            self.unchanged_polls += 1
+            return []
+
+        today_str = today.isoformat()
+        games = [g for g in self.parse_games(html, today) if g["date"] == today_str]
+        current = snapshot_games(games)
+        events = diff_snapshots(self._snapshot, current, self.last_poll_at)
+
+        self._digest = digest
+        self._snapshot = current
+
+        for event in events:
+            self.stream.publish(event)
+        return events
+
+    def next_interval(self) -> float:
+        """다음 폴링까지 대기 시간 (초)"""
+        max_probability = None
+        if self.probability_source is not None:
+            try:
+                max_probability = self.probability_source()
+            except Exception as e:
+                logger.warning(f"[WATCH] 예측 확률 조회 실패: {e}")
+        self.last_interval = self.interval.next_interval(max_probability)
+        return self.last_interval
+
+    def run(self, stop_event: threading.Event) -> None:
+        """stop_event가 설정될 때까지 폴링"""
+        while not stop_event.is_set():
+            try:
+                events = self.poll_once()
+                if events:
+                    logger.info(f"[WATCH] 상태 변경 {len(events)}건")
+            except Exception as e:
+                logger.warning(f"[WATCH] 일정 조회 실패: {e}")
+            stop_event.wait(self.next_interval())
+
+    def status(self) -> dict:
+        """감시 상태"""
+        return {
+            "polls": self.polls,
+            "unchanged_polls": self.unchanged_polls,
+            "last_poll_at": self.last_poll_at,
+            "next_interval": self.last_interval,
+            "games_today": len(self._snapshot) if self._snapshot is not None else 0,
+        }
@@ -0,0 +1,152 @@
+"""
+모델 입력 피처 계산 (학습/서빙 공통)
+
+기본 날씨 컬럼과 월/요일/경기 시작 시간으로 파생 피처를 계산합니다.
+입력은 컬럼별 1차원 배열(또는 스칼라)이며, 경기 1개(서빙)와
+전체 데이터셋(학습)을 같은 NumPy 연산으로 처리합니다.
+
+- 학습(kbo_rain_model.preprocess_data), 학습 시 예측 함수(create_prediction_function),
+  백엔드 예측기(predictor._prepare_features)가 모두 compute_features()를 사용합니다.
+- 피처 정의를 바꾸면 FEATURE_VERSION을 올리세요. 모델 파일에 학습 당시 버전이 저장되며,
+  백엔드는 버전이 다른 모델을 로드할 때 경고합니다.
+
+이 모듈은 NumPy 외 의존성이 없어야 합니다 (루트 학습 스크립트에서도 import).
+"""
+from typing import Any, Dict, Mapping, Optional, Sequence
+
+import numpy as np
+
+# 피처 정의 버전 (모델 파일의 feature_version과 비교)
+FEATURE_VERSION = 1
+
+# 기본 날씨 피처 (결측치는 0으로 채움)
+BASE_FEATURES = [
+    "daily_precip_sum",  # 일 강수량
+    "daily_precip_hours",  # 강수 시간
+    "pre_game_precip",  # 경기 전 강수량
+    "pre_game_humidity",  # 경기 전 습도
+    "pre_game_temp",  # 경기 전 기온
+    "pre_game_wind",  # 경기 전 풍속
+    "prev_day_precip",  # 전날 강수량
+    "daily_wind_max",  # 최대 풍속
+    "daily_temp_mean",  # 평균 기온
+]
+
+# 파생 피처
+DERIVED_FEATURES = [
+    "is_weekend",
+    "is_rainy_season",
+    "game_hour",
+    "precip_intensity",
+    "humidity_precip_interaction",
+    "cumulative_precip_2days",
+    "ground_condition_score",
+]
+
+# 모델 입력 피처 (학습 순서)
+FEATURE_COLUMNS = BASE_FEATURES + ["month", "dayofweek"] + DERIVED_FEATURES
+
+# 정수형 피처 (나머지는 float64)
+INTEGER_FEATURES = {"month", "dayofweek", "is_weekend", "is_rainy_season", "game_hour"}
+
+RAINY_SEASON_MONTHS = (7, 8)
+DEFAULT_GAME_HOUR = 18
+DEFAULT_HUMIDITY = 50.0
+
+
+def parse_game_hours(times: Any, default: int = DEFAULT_GAME_HOUR) -> np.ndarray:
+    """
+    경기 시작 시간 문자열("18:30")에서 시 추출
+
+    Args:
+        times: 시간 문자열 배열 또는 스칼라 (형식이 다르거나 결측이면 default)
+
+    Returns:
+        np.ndarray: 시 (int64)
+    """
+    hours = np.char.strip(np.char.partition(np.atleast_1d(np.asarray(times, dtype=str)), ":")[..., 0])
+    valid = np.char.isdigit(hours)
+    return np.where(valid, np.where(valid, hours, "0").astype(np.int64), default)
+
+
+def calendar_features(dates: Any) -> Dict[str, np.ndarray]:
+    """
+    날짜에서 월/요일 계산
+
+    Args:
+        dates: 날짜 배열 (datetime64로 변환 가능한 값)
+
+    Returns:
+        dict: {"month": 1-12, "dayofweek": 0=월 ~ 6=일}
+    """
+    days = np.atleast_1d(np.asarray(dates, dtype="datetime64[D]"))
+    return {
+        "month": days.astype("datetime64[M]").astype(np.int64) % 12 + 1,
+        # 1970-01-01은 목요일(3)
+        "dayofweek": (days.astype(np.int64) + 3) % 7,
+    }
+
+
+def _fill_missing(values: np.ndarray, fill: float = 0.0) -> np.ndarray:
+    """NaN만 fill로 대체 (pandas fillna와 동일)"""
+    return np.where(np.isnan(values), fill, values)
+
+
+def _column(columns: Mapping[str, Any], name: str, n_rows: int) -> np.ndarray:
+    values = np.asarray(columns[name], dtype=np.float64)
+    return np.full(n_rows, values) if values.ndim == 0 else values
+
+
+def compute_features(
+    columns: Mapping[str, Any], feature_cols: Optional[Sequence[str]] = None
+) -> Dict[str, np.ndarray]:
+    """
+    모델 입력 피처 계산
+
+    Args:
+        columns: BASE_FEATURES + month, dayofweek 컬럼 (배열 또는 스칼라).
+                 game_hour가 없으면 DEFAULT_GAME_HOUR, 날씨 결측치(NaN)는 학습 때와 같이 처리
+        feature_cols: 반환할 피처 (기본: FEATURE_COLUMNS)
+
+    Returns:
+        dict: {피처 이름: 1차원 배열} - 결측치 없음, 정수형 피처는 int64
+    """
+    n_rows = max(np.size(columns[name]) for name in BASE_FEATURES + ["month", "dayofweek"])
+    base = {name: _column(columns, name, n_rows) for name in BASE_FEATURES}
+    month = _column(columns, "month", n_rows).astype(np.int64)
+    dayofweek = _column(columns, "dayofweek", n_rows).astype(np.int64)
+    game_hour = (
+        _column(columns, "game_hour", n_rows).astype(np.int64)
+        if columns.get("game_hour") is not None
+        else np.full(n_rows, DEFAULT_GAME_HOUR, dtype=np.int64)
+    )
+
+    daily_precip_sum = base["daily_precip_sum"]
+    daily_precip_hours = base["daily_precip_hours"]
+    pre_game_precip = _fill_missing(base["pre_game_precip"])
+    prev_day_precip = _fill_missing(base["prev_day_precip"])
+    humidity = _fill_missing(base["pre_game_humidity"], DEFAULT_HUMIDITY)
+
+    features = {
+        **base,
+        "month": month,
+        "dayofweek": dayofweek,
+        "is_weekend": (dayofweek >= 5).astype(np.int64),
+        # np.isin은 경기 1개 입력에서 상대적으로 느려 월별 비교로 계산
+        "is_rainy_season": np.logical_or.reduce([month == m for m in RAINY_SEASON_MONTHS]).astype(np.int64),
+        "game_hour": game_hour,
+        # 강수 강도 (mm/시간) - 강수 시간 0이면 1로 나눔
+        "precip_intensity": daily_precip_sum / np.where(daily_precip_hours == 0, 1, daily_precip_hours),
+        # 습도 × 강수량 상호작용
+        "humidity_precip_interaction": humidity * pre_game_precip / 100,
+        # 2일 누적 강수량
+        "cumulative_precip_2days": _fill_missing(daily_precip_sum) + prev_day_precip,
+        # 그라운드 상태 점수 (높을수록 취소 위험)
+        "ground_condition_score": prev_day_precip * 0.5 + pre_game_precip * 0.3 + (humidity - DEFAULT_HUMIDITY) * 0.02,
+    }
+
+    # 남은 결측치(기본 날씨 피처, 강수 강도)는 0으로 채움
+    return {
+        name: features[name] if name in INTEGER_FEATURES else _fill_missing(features[name])
+        for name in (feature_cols or FEATURE_COLUMNS)
+    }
@@ -0,0 +1,208 @@
+"""
+KBO 일정 테이블 파서 (lxml, 수집기/백엔드 공통)
+
+일정 테이블 HTML(tblScheduleList)을 경기 레코드(ScheduleGame)로 변환합니다.
+
+- lxml로 파싱하고 셀은 직계 td만 순회합니다.
+- 날짜/요일/팀명 패턴은 미리 컴파일하고,
+  취소 사유는 행 텍스트를 한 번만 스캔하여 판정합니다.
+- 레코드는 NamedTuple로 경기당 dict 생성 없이 보관합니다 (to_dict()로 변환).
+
+루트 크롤러(cancel_crawler.py, cancel_watcher.py)와 백엔드 실시간 취소 감시가
+같은 파서를 사용합니다. 이 모듈은 lxml 외 의존성이 없어야 합니다.
+"""
+import re
+from html import escape
+from typing import Callable, Dict, List, NamedTuple, Optional, Sequence, Tuple, Union
+
+from lxml import html as lxml_html
+
+# 날짜 셀: "05.01(수)"
+DATE_PATTERN = re.compile(r"(\d+)\.(\d+)")
+DAY_PATTERN = re.compile(r"\((.)\)")
+# 점수 포함된 패턴: "팀명+점수 vs 점수+팀명" 또는 "팀명 vs 팀명"
+TEAMS_PATTERN = re.compile(r"([가-힣A-Za-z]+)\d*\s*(?:vs|VS)\s*\d*([가-힣A-Za-z]+)")
+
+# 취소 판정 키워드 (한 번의 스캔으로 모두 찾음)
+CANCEL_KEYWORDS = ["취소", "우천", "순연", "그라운드", "노게임", "폭염"]
+CANCEL_PATTERN = re.compile("|".join(CANCEL_KEYWORDS))
+
+NORMAL_REASON = "정상진행"
+
+
+class ScheduleGame(NamedTuple):
+    """일정 테이블 경기 레코드"""
+
+    date: str
+    day: str
+    time: str
+    stadium: str
+    home: str
+    away: str
+    cancelled: bool
+    reason: str
+    note: str
+
+    def to_dict(self) -> dict:
+        return self._asdict()
+
+
+def classify_cancellation(row_text: str) -> Tuple[bool, str]:
+    """
+    행 텍스트로 취소 여부/사유 판단 (단일 스캔)
+
+    Returns:
+        tuple: (취소 여부, 취소 사유)
+    """
+    found = set(CANCEL_PATTERN.findall(row_text))
+    if not found:
+        return False, NORMAL_REASON
+
+    if "우천" in found:
+        return True, "우천노게임" if "노게임" in found else "우천취소"
+    if "그라운드" in found:
+        return True, "그라운드사정"
+    if "폭염" in found:
+        return True, "폭염취소"
+    if "순연" in found:
+        return True, "순연"
+    return True, "기타취소"
+
+
+def _cell_text(cell) -> str:
+    """셀 텍스트 (각 텍스트 노드를 strip 후 연결, BeautifulSoup get_text(strip=True)와 동일)"""
+    return "".join(part.strip() for part in cell.itertext())
+
+
+def parse_schedule_html(html: str, year: int) -> List[ScheduleGame]:
+    """
+    일정 테이블 HTML 파싱 (구장 필터링 없음)
+
+    Args:
+        html: tblScheduleList 테이블을 포함한 HTML (페이지 전체 또는 테이블만)
+        year: 연도 (날짜 셀에는 월.일만 표시됨)
+
+    Returns:
+        list: ScheduleGame 리스트 (데이터 없음/테이블 없음 시 빈 리스트)
+    """
+    root = lxml_html.fromstring(html)
+    tables = root.xpath('//table[@id="tblScheduleList"]')
+    if not tables:
+        return []
+
+    games = []
+    current_date = None
+    current_day = ""
+
+    for row in tables[0].iter("tr"):
+        cells = row.findall("td")
+        n_cells = len(cells)
+        if n_cells < 8:
+            continue
+
+        # 9개 셀: 날짜 포함 행 (날짜, 시간, 경기, 게임센터, 하이라이트, TV, 라디오, 구장, 비고)
+        # 8개 셀: 날짜 없는 행 (rowspan으로 날짜 셀 생략)
+        offset = 0 if n_cells == 9 else -1
+
+        if offset == 0:
+            date_text = _cell_text(cells[0])
+            match = DATE_PATTERN.search(date_text)
+            if match:
+                m, d = match.groups()
+                current_date = f"{year}-{m.zfill(2)}-{d.zfill(2)}"
+                day_match = DAY_PATTERN.search(date_text)
+                current_day = day_match.group(1) if day_match else ""
+
+        if not current_date:
+            continue
+
+        game_cell = cells[2 + offset]
+        away_team = ""
+        home_team = ""
+
+        # 팀 이미지 alt 속성에서 팀명 추출
+        team_imgs = game_cell.findall(".//img")
+        if len(team_imgs) >= 2:
+            away_team = team_imgs[0].get("alt", "")
+            home_team = team_imgs[1].get("alt", "")
+        else:
+            # 텍스트에서 추출 (점수 제거: "KIA9vs5삼성" -> "KIA vs 삼성")
+            teams_match = TEAMS_PATTERN.search(_cell_text(game_cell))
+            if teams_match:
+                away_team, home_team = teams_match.groups()
+
+        is_cancelled, reason = classify_cancellation(row.text_content())
+
+        games.append(
+            ScheduleGame(
+                date=current_date,
+                day=current_day,
+                time=_cell_text(cells[1 + offset]),
+                stadium=_cell_text(cells[7 + offset]),
+                home=home_team,
+                away=away_team,
+                cancelled=is_cancelled,
+                reason=reason,
+                note=_cell_text(cells[8 + offset]),
+            )
+        )
+
+    return games
+
+
+def schedule_json_to_html(data: dict) -> str:
+    """
+    KBO GetScheduleList 응답을 tblScheduleList 테이블 HTML로 변환
+
+    응답의 각 행은 {"row": [{"Text", "Class", "RowSpan", "ColSpan"}, ...]} 형태이며,
+    rowspan으로 합쳐진 날짜 셀은 첫 행에만 포함되어 페이지 DOM과 셀 수가 같습니다.
+    """
+    parts = ['<table id="tblScheduleList"><tbody>']
+    for row in data.get("rows") or []:
+        parts.append("<tr>")
+        for cell in row.get("row") or []:
+            attrs = ""
+            if cell.get("Class"):
+                attrs += f' class="{escape(cell["Class"])}"'
+            if cell.get("RowSpan"):
+                attrs += f' rowspan="{escape(str(cell["RowSpan"]))}"'
+            if cell.get("ColSpan"):
+                attrs += f' colspan="{escape(str(cell["ColSpan"]))}"'
+            # Text는 서버가 렌더링한 셀 내부 HTML
+            parts.append(f"<td{attrs}>{cell.get('Text') or ''}</td>")
+        parts.append("</tr>")
+    parts.append("</tbody></table>")
+    return "".join(parts)
+
+
+def build_keyword_lookup(
+    keywords_by_stadium: Dict[str, Union[str, Sequence[str]]],
+) -> Callable[[str], Optional[str]]:
+    """
+    구장명 텍스트 → 구장 ID 조회 함수 생성
+
+    모든 구장의 검색어를 하나의 정규식으로 미리 컴파일하여,
+    행마다 구장 수만큼 비교하지 않고 한 번의 검색으로 구장을 찾습니다.
+
+    Args:
+        keywords_by_stadium: {구장 ID: 검색어 또는 검색어 리스트}
+
+    Returns:
+        callable: match(stadium_text) -> 구장 ID (대상 구장이 아니면 None)
+    """
+    keyword_to_stadium = {}
+    for stadium_id, search_keyword in keywords_by_stadium.items():
+        keywords = [search_keyword] if isinstance(search_keyword, str) else search_keyword
+        for keyword in keywords:
+            keyword_to_stadium[keyword] = stadium_id
+
+    # 긴 검색어 우선 매칭
+    pattern = re.compile(
+        "|".join(re.escape(kw) for kw in sorted(keyword_to_stadium, key=len, reverse=True))
+    )
+
+    def match(stadium_text: str) -> Optional[str]:
+        found = pattern.search(stadium_text)
+        return keyword_to_stadium[found.group(0)] if found else None
+
+    return match
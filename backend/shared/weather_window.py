@@ -0,0 +1,209 @@
+"""
+시간별 기상 시계열 윈도우 집계 엔진 (학습/서빙 공통)
+
+시간별 시계열마다 누적합(prefix sum)과 희소 테이블(sparse table) 기반
+구간 최솟값/최댓값 배열을 미리 만들어 두고, 임의의
+(시작 오프셋, 길이, 집계) 윈도우 질의를 경기당 O(1)에 계산합니다.
+
+- 수집기(weather_collector_openmeteo.py)와 백엔드 날씨 서비스가
+  동일한 PRE_GAME_WINDOWS 정의와 window_features() 호출을 사용합니다.
+- anchors/offsets/lengths는 NumPy 브로드캐스팅을 따르므로
+  전체 경기 × 윈도우 크기 조합을 한 번에 계산할 수 있습니다 (sweep_windows).
+
+이 모듈은 NumPy 외 의존성이 없어야 합니다 (루트 학습 스크립트에서도 import).
+"""
+from dataclasses import dataclass
+from typing import Dict, Mapping, Optional, Sequence
+
+import numpy as np
+
+AGGREGATIONS = ("sum", "mean", "min", "max", "count")
+
+
+@dataclass(frozen=True)
+class WindowSpec:
+    """윈도우 정의 (anchor = 경기 시작 시각의 시간 인덱스)"""
+
+    variable: str
+    offset: int
+    length: int
+    agg: str
+
+
+# 경기 전 윈도우: game_hour-3 ~ game_hour (포함, 4시간)
+# 기존 학습 데이터(with_weather.csv)가 이 구간으로 수집되었으므로 서빙도 동일하게 맞춤
+PRE_GAME_OFFSET = -3
+PRE_GAME_LENGTH = 4
+
+PRE_GAME_WINDOWS: Dict[str, WindowSpec] = {
+    "pre_game_precip": WindowSpec("precipitation", PRE_GAME_OFFSET, PRE_GAME_LENGTH, "sum"),
+    "pre_game_temp": WindowSpec("temperature_2m", PRE_GAME_OFFSET, PRE_GAME_LENGTH, "mean"),
+    "pre_game_humidity": WindowSpec("relative_humidity_2m", PRE_GAME_OFFSET, PRE_GAME_LENGTH, "mean"),
+    "pre_game_wind": WindowSpec("wind_speed_10m", PRE_GAME_OFFSET, PRE_GAME_LENGTH, "mean"),
+}
+
+
+class HourlyWeatherIndex:
+    """시간별 기상 시계열 구간 질의 인덱스"""
+
+    def __init__(self, hourly: Mapping[str, Sequence[Optional[float]]]):
+        """
+        Args:
+            hourly: {변수명: 시간별 값 리스트} (None은 결측 처리)
+                    모든 시계열은 같은 시작 시각(인덱스 0)을 공유해야 합니다.
+        """
+        self._values: Dict[str, np.ndarray] = {}
+        self._prefix_sum: Dict[str, np.ndarray] = {}
+        self._prefix_count: Dict[str, np.ndarray] = {}
+        self._sparse: Dict[tuple, np.ndarray] = {}
+
+        for name, values in hourly.items():
+            arr = np.array(
+                [np.nan if v is None else v for v in values], dtype=np.float64
+            )
+            valid = ~np.isnan(arr)
+            self._values[name] = arr
+            self._prefix_sum[name] = np.concatenate(([0.0], np.cumsum(np.where(valid, arr, 0.0))))
+            self._prefix_count[name] = np.concatenate(([0], np.cumsum(valid)))
+
+        self.n_hours = max((len(a) for a in self._values.values()), default=0)
+
+    @classmethod
+    def from_open_meteo(cls, hourly: Mapping[str, Sequence]) -> "HourlyWeatherIndex":
+        """Open-Meteo 응답의 hourly 블록으로 인덱스 생성 ("time" 키 제외)"""
+        return cls({k: v for k, v in hourly.items() if k != "time"})
+
+    def _sparse_table(self, name: str, agg: str) -> np.ndarray:
+        """구간 최솟값/최댓값용 희소 테이블 (levels × n, 지연 생성)"""
+        key = (name, agg)
+        if key not in self._sparse:
+            arr = self._values[name]
+            reduce = np.fmin if agg == "min" else np.fmax
+            levels = [arr]
+            width = 1
+            while width * 2 <= len(arr):
+                prev = levels[-1]
+                nxt = np.full(len(arr), np.nan)
+                nxt[: len(arr) - width] = reduce(prev[: len(arr) - width], prev[width:])
+                levels.append(nxt)
+                width *= 2
+            self._sparse[key] = np.vstack(levels)
+        return self._sparse[key]
+
+    def query(self, variable, anchors, offset, length, agg: str) -> np.ndarray:
+        """
+        윈도우 집계 질의
+
+        구간은 [anchor + offset, anchor + offset + length) 이며,
+        시계열 범위를 벗어나는 부분은 잘라냅니다.
+
+        Args:
+            variable: 변수명 (예: "precipitation")
+            anchors: 기준 시간 인덱스 (스칼라 또는 배열)
+            offset: 시작 오프셋 (스칼라 또는 배열)
+            length: 윈도우 길이 (스칼라 또는 배열)
+            agg: "sum" | "mean" | "min" | "max" | "count"
+
+        Returns:
+            np.ndarray: 브로드캐스팅된 질의 결과 (유효 값이 없으면 NaN, sum/count는 0)
+        """
+        if agg not in AGGREGATIONS:
+            raise ValueError(f"지원하지 않는 집계: {agg}. 가능한 집계: {', '.join(AGGREGATIONS)}")
+
+        anchors, offset, length = np.broadcast_arrays(
+            np.asarray(anchors, dtype=np.int64),
+            np.asarray(offset, dtype=np.int64),
+            np.asarray(length, dtype=np.int64),
+        )
+
+        n = len(self._values.get(variable, ()))
+        if n == 0:
+            fill = 0.0 if agg in ("sum", "count") else np.nan
+            return np.full(anchors.shape, fill)
+
+        start = np.clip(anchors + offset, 0, n)
+        end = np.clip(anchors + offset + length, 0, n)
+        end = np.maximum(end, start)
+
+        if agg in ("sum", "mean", "count"):
+            prefix_count = self._prefix_count[variable]
+            count = (prefix_count[end] - prefix_count[start]).astype(np.float64)
+            if agg == "count":
+                return count
+            prefix_sum = self._prefix_sum[variable]
+            total = prefix_sum[end] - prefix_sum[start]
+            if agg == "sum":
+                return total
+            with np.errstate(invalid="ignore", divide="ignore"):
+                return np.where(count > 0, total / np.maximum(count, 1), np.nan)
+
+        # min / max: 겹치는 두 2^k 구간으로 O(1) 질의
+        table = self._sparse_table(variable, agg)
+        width = end - start
+        empty = width <= 0
+        safe_width = np.where(empty, 1, width)
+        level = np.floor(np.log2(safe_width)).astype(np.int64)
+        left = np.minimum(start, n - 1)
+        right = np.clip(end - (1 << level), 0, n - 1)
+        reduce = np.fmin if agg == "min" else np.fmax
+        result = reduce(table[level, left], table[level, right])
+        return np.where(empty, np.nan, result)
+
+    def window(self, spec: WindowSpec, anchors) -> np.ndarray:
+        """WindowSpec 질의"""
+        return self.query(spec.variable, anchors, spec.offset, spec.length, spec.agg)
+
+
+def window_features(
+    index: HourlyWeatherIndex,
+    anchors,
+    windows: Mapping[str, WindowSpec] = PRE_GAME_WINDOWS,
+) -> Dict[str, np.ndarray]:
+    """
+    경기 전 윈도우 피처 계산 (학습/서빙 공통 진입점)
+
+    Args:
+        index: 시간별 기상 인덱스
+        anchors: 경기 시작 시각의 시간 인덱스 배열
+        windows: {피처명: WindowSpec}
+
+    Returns:
+        dict: {피처명: 경기별 값 배열}
+    """
+    anchors = np.atleast_1d(np.asarray(anchors, dtype=np.int64))
+    return {name: index.window(spec, anchors) for name, spec in windows.items()}
+
+
+def sweep_windows(
+    index: HourlyWeatherIndex,
+    anchors,
+    variable: str,
+    offsets: Sequence[int],
+    lengths: Sequence[int],
+    agg: str,
+) -> np.ndarray:
+    """
+    윈도우 크기 탐색 (벡터화)
+
+    Returns:
+        np.ndarray: shape (경기 수, len(offsets), len(lengths))
+    """
+    anchors = np.asarray(anchors, dtype=np.int64)[:, None, None]
+    offsets = np.asarray(offsets, dtype=np.int64)[None, :, None]
+    lengths = np.asarray(lengths, dtype=np.int64)[None, None, :]
+    return index.query(variable, anchors, offsets, lengths, agg)
+
+
+def hour_anchors(dates, hours, start_date) -> np.ndarray:
+    """
+    날짜/경기 시간을 시계열 시간 인덱스로 변환
+
+    Args:
+        dates: 경기 날짜 배열 (YYYY-MM-DD)
+        hours: 경기 시작 시간 배열 (0-23)
+        start_date: 시계열 시작 날짜 (인덱스 0 = start_date 00시)
+    """
+    days = (
+        np.asarray(dates, dtype="datetime64[D]") - np.datetime64(start_date, "D")
+    ).astype(np.int64)
+    return days * 24 + np.asarray(hours, dtype=np.int64)
@@ -0,0 +1,389 @@
+"""
+시즌 롤링 오리진 백테스트
+=========================
+N년까지 학습 → N+1년 테스트를 모든 시즌에 대해 반복하여 모델/피처 변경을 평가합니다.
+(kbo_rain_model.py --temporal은 2025년 한 시즌만 테스트)
+
+- 후보 모델은 kbo_rain_model.build_candidate_models()와 같은 정의를 사용합니다.
+- 전처리 결과는 학습 캐시(models/cache)의 피처 행렬을 재사용합니다.
+- (구장, 테스트 시즌) 분할은 프로세스 병렬로 학습합니다.
+- 구장별/시즌별 지표와 시즌 합산(out-of-season 예측 전체) 지표를 출력하고,
+  --output으로 CSV 저장, --baseline으로 이전 결과와 F1을 비교합니다.
+
+실행: python backtest.py --all
+      python backtest.py --stadium jamsil --models XGBoost
+      python backtest.py --all --output models/backtest/baseline.csv
+      python backtest.py --all --baseline models/backtest/baseline.csv
+"""
+
+import argparse
+import io
+import time
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import redirect_stdout
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+from sklearn.metrics import brier_score_loss, f1_score, precision_score, recall_score, roc_auc_score
+from threadpoolctl import threadpool_limits
+
+from dataset_store import dataset_exists, query_dataset
+from kbo_rain_model import (
+    TRAINING_COLUMNS,
+    build_candidate_models,
+    feature_cache_key,
+    plan_parallel_training,
+    preprocess_data,
+)
+from stadium_config import DEFAULT_STADIUM, STADIUMS, get_outdoor_stadiums
+from training_cache import TrainingCache
+
+# 첫 테스트 시즌 이전에 필요한 최소 학습 시즌 수
+MIN_TRAIN_SEASONS = 1
+
+MODEL_NAMES = ("XGBoost", "LightGBM", "RandomForest")
+
+# 시즌 합산 행의 season 값
+POOLED_SEASON = "all"
+
+
+def load_stadium_features(stadium_id, use_cache=True):
+    """
+    구장 피처 행렬과 시즌 (학습 캐시의 전처리 결과 재사용)
+
+    Returns:
+        tuple: (X, y, seasons, 캐시 사용 여부) - 데이터가 없으면 None
+    """
+    if not dataset_exists(stadium_id, "with_weather"):
+        return None
+
+    df = query_dataset("with_weather", columns=TRAINING_COLUMNS, stadiums=[stadium_id])
+    features_key = feature_cache_key(df)
+    cache = TrainingCache(stadium_id) if use_cache else None
+
+    cached = cache.get_features(features_key) if cache is not None else None
+    if cached is not None:
+        X, y, feature_cols = cached
+    else:
+        with redirect_stdout(io.StringIO()):
+            X, y, feature_cols = preprocess_data(df, STADIUMS[stadium_id]["name"])
+        if cache is not None:
+            cache.put_features(features_key, X, y, feature_cols)
+
+    seasons = pd.to_datetime(df.loc[X.index, "date"]).dt.year
+    return X[feature_cols], y, seasons, cached is not None
+
+
+def make_rolling_splits(seasons, min_train_seasons=MIN_TRAIN_SEASONS, window=None):
+    """
+    롤링 오리진 분할
+
+    Args:
+        seasons: 행별 시즌 (연도)
+        min_train_seasons: 첫 테스트 시즌 이전에 필요한 학습 시즌 수
+        window: 학습에 쓸 최근 시즌 수 (None이면 이전 시즌 전체, 확장 윈도우)
+
+    Returns:
+        list: [(테스트 시즌, 학습 시즌 목록)]
+    """
+    years = sorted(seasons.unique())
+    splits = []
+    for i in range(max(1, min_train_seasons), len(years)):
+        train_years = years[:i] if window is None else years[max(0, i - window):i]
+        splits.append((int(years[i]), [int(year) for year in train_years]))
+    return splits
+
+
+def score_predictions(y_true, y_pred, y_prob):
+    """분할 하나 (또는 합산) 지표"""
+    has_both_classes = 0 < y_true.sum() < len(y_true)
+    return {
+        "f1": f1_score(y_true, y_pred, zero_division=0),
+        "precision": precision_score(y_true, y_pred, zero_division=0),
+        "recall": recall_score(y_true, y_pred, zero_division=0),
+        "roc_auc": roc_auc_score(y_true, y_prob) if has_both_classes else np.nan,
+        "brier": brier_score_loss(y_true, y_prob),
+    }
+
+
+def _evaluate_split(task, model_names, n_threads=None):
+    """
+    분할 하나 학습/평가 (하위 프로세스에서도 실행)
+
+    Returns:
+        dict: 분할 정보 + 모델별 테스트 예측 {"predictions": {모델: (y_pred, y_prob)}}
+    """
+    X_train, y_train, X_test = task["X_train"], task["y_train"], task["X_test"]
+    n_pos = int(y_train.sum())
+    scale_pos_weight = (len(y_train) - n_pos) / n_pos
+
+    predictions = {}
+    with threadpool_limits(limits=n_threads):
+        models = build_candidate_models(scale_pos_weight, n_jobs=n_threads)
+        for name in model_names:
+            model = models[name]
+            model.fit(X_train, y_train)
+            predictions[name] = (model.predict(X_test), model.predict_proba(X_test)[:, 1])
+
+    return {
+        "stadium_id": task["stadium_id"],
+        "season": task["season"],
+        "train_seasons": task["train_seasons"],
+        "n_train": len(y_train),
+        "y_test": task["y_test"],
+        "predictions": predictions,
+    }
+
+
+def build_tasks(stadium_ids, min_train_seasons=MIN_TRAIN_SEASONS, window=None, use_cache=True):
+    """구장별 피처를 읽어 (구장, 테스트 시즌) 분할 작업 생성"""
+    tasks = []
+    for stadium_id in stadium_ids:
+        loaded = load_stadium_features(stadium_id, use_cache)
+        name = STADIUMS[stadium_id]["name"]
+        if loaded is None:
+            print(f"  [스킵] {name}: 날씨 포함 데이터가 없습니다.")
+            continue
+
+        X, y, seasons, cached = loaded
+        X_values = np.ascontiguousarray(X.to_numpy())
+        y_values = y.to_numpy()
+        splits = make_rolling_splits(seasons, min_train_seasons, window)
+        added = 0
+        for season, train_seasons in splits:
+            train_mask = seasons.isin(train_seasons).to_numpy()
+            test_mask = (seasons == season).to_numpy()
+            if y_values[train_mask].sum() == 0:
+                continue
+            tasks.append(
+                {
+                    "stadium_id": stadium_id,
+                    "season": season,
+                    "train_seasons": train_seasons,
+                    "X_train": X_values[train_mask],
+                    "y_train": y_values[train_mask],
+                    "X_test": X_values[test_mask],
+                    "y_test": y_values[test_mask],
+                }
+            )
+            added += 1
+        print(f"  {name}: {len(X)}경기, 분할 {added}개{' (캐시된 피처)' if cached else ''}")
+    return tasks
+
+
+def run_backtest(
+    stadium_ids,
+    model_names=MODEL_NAMES,
+    min_train_seasons=MIN_TRAIN_SEASONS,
+    window=None,
+    jobs=0,
+    use_cache=True,
+):
+    """
+    롤링 오리진 백테스트 실행
+
+    Args:
+        stadium_ids: 구장 ID 목록
+        model_names: 평가할 후보 모델 이름
+        min_train_seasons: 첫 테스트 시즌 이전에 필요한 학습 시즌 수
+        window: 최근 시즌 수만 학습 (None이면 확장 윈도우)
+        jobs: 병렬 프로세스 수 (1이면 순차, 0이면 코어 수 기준 자동)
+        use_cache: 학습 캐시의 전처리 결과 재사용
+
+    Returns:
+        pd.DataFrame: 구장/시즌/모델별 지표 (season == "all"은 시즌 합산)
+    """
+    start_time = time.perf_counter()
+    print("피처 로딩...")
+    tasks = build_tasks(stadium_ids, min_train_seasons, window, use_cache)
+    if not tasks:
+        print("[오류] 백테스트할 분할이 없습니다.")
+        return pd.DataFrame()
+
+    workers, n_threads = plan_parallel_training(len(tasks), jobs)
+    print(f"\n분할 {len(tasks)}개 x 모델 {len(model_names)}개 학습 (프로세스 {workers}개 x 모델 스레드 {n_threads}개)")
+
+    if workers == 1:
+        outcomes = [_evaluate_split(task, model_names, n_threads) for task in tasks]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            outcomes = list(
+                executor.map(_evaluate_split, tasks, [model_names] * len(tasks), [n_threads] * len(tasks))
+            )
+
+    rows = []
+    pooled = {}
+    for outcome in outcomes:
+        y_test = outcome["y_test"]
+        for name, (y_pred, y_prob) in outcome["predictions"].items():
+            rows.append(
+                {
+                    "stadium": outcome["stadium_id"],
+                    "season": str(outcome["season"]),
+                    "model": name,
+                    "n_train": outcome["n_train"],
+                    "n_test": len(y_test),
+                    "n_cancel": int(y_test.sum()),
+                    **score_predictions(y_test, y_pred, y_prob),
+                }
+            )
+            parts = pooled.setdefault((outcome["stadium_id"], name), ([], [], []))
+            parts[0].append(y_test)
+            parts[1].append(y_pred)
+            parts[2].append(y_prob)
+
+    # 시즌 합산: 모든 out-of-season 예측을 모아 한 번에 평가 (시즌당 취소 경기가 적어 더 안정적)
+    for (stadium_id, name), (y_tests, y_preds, y_probs) in pooled.items():
+        y_test = np.concatenate(y_tests)
+        rows.append(
+            {
+                "stadium": stadium_id,
+                "season": POOLED_SEASON,
+                "model": name,
+                "n_train": np.nan,
+                "n_test": len(y_test),
+                "n_cancel": int(y_test.sum()),
+                **score_predictions(y_test, np.concatenate(y_preds), np.concatenate(y_probs)),
+            }
+        )
+
+    print(f"백테스트 시간: {time.perf_counter() - start_time:.1f}초")
+    return pd.DataFrame(rows)
+
+
+def print_stadium_tables(results):
+    """구장별 시즌 x 모델 F1/ROC-AUC 표"""
+    model_names = list(dict.fromkeys(results["model"]))
+    for stadium_id, stadium_results in results.groupby("stadium", sort=False):
+        print("\n" + "=" * 60)
+        print(f"{STADIUMS[stadium_id]['name']} ({stadium_id})")
+        print("=" * 60)
+        header = f"{'시즌':<6} {'학습':>5} {'테스트(취소)':>12}"
+        for name in model_names:
+            header += f" {name + ' F1/AUC':>22}"
+        print(header)
+        print("-" * len(header))
+
+        for season, season_results in stadium_results.groupby("season", sort=False):
+            first = season_results.iloc[0]
+            n_train = "-" if pd.isna(first["n_train"]) else f"{int(first['n_train'])}"
+            line = f"{season:<6} {n_train:>5} {f'{first.n_test}({first.n_cancel})':>12}"
+            for name in model_names:
+                row = season_results[season_results["model"] == name].iloc[0]
+                line += f" {row['f1']:>14.4f}/{row['roc_auc']:.4f}"
+            print(line)
+
+
+def print_summary(results):
+    """모델별 시즌 F1 (구장 평균) 및 시즌 합산 지표"""
+    seasons = [season for season in dict.fromkeys(results["season"]) if season != POOLED_SEASON]
+    print("\n" + "=" * 60)
+    print("모델별 요약 (구장 평균 F1)")
+    print("=" * 60)
+    summary = results.pivot_table(index="model", columns="season", values="f1", aggfunc="mean", sort=False)
+    print(summary[sorted(seasons) + [POOLED_SEASON]].round(4).to_string())
+
+    pooled = results[results["season"] == POOLED_SEASON]
+    print("\n시즌 합산 지표 (구장 평균):")
+    print(
+        pooled.groupby("model", sort=False)[["f1", "precision", "recall", "roc_auc", "brier"]]
+        .mean()
+        .round(4)
+        .to_string()
+    )
+
+
+def compare_with_baseline(results, baseline_path):
+    """이전 백테스트 결과(CSV)와 시즌 합산 F1 비교"""
+    baseline = pd.read_csv(baseline_path, dtype={"season": str})
+    key = ["stadium", "season", "model"]
+    merged = results.merge(baseline[key + ["f1", "roc_auc"]], on=key, how="inner", suffixes=("", "_base"))
+    pooled = merged[merged["season"] == POOLED_SEASON]
+    if pooled.empty:
+        print(f"\n[경고] 기준 결과와 겹치는 구장/모델이 없습니다: {baseline_path}")
+        return
+
+    print("\n" + "=" * 60)
+    print(f"기준 결과 대비 (시즌 합산 F1): {baseline_path}")
+    print("=" * 60)
+    print(f"{'구장':<12} {'모델':<14} {'기준':>8} {'현재':>8} {'변화':>8}")
+    print("-" * 54)
+    for _, row in pooled.iterrows():
+        print(
+            f"{row['stadium']:<12} {row['model']:<14} {row['f1_base']:>8.4f} {row['f1']:>8.4f} "
+            f"{row['f1'] - row['f1_base']:>+8.4f}"
+        )
+
+    # 시즌별 개선/악화 횟수 (시즌당 취소 경기가 적어 하나의 합산값만 보면 오해 소지)
+    per_season = merged[merged["season"] != POOLED_SEASON]
+    delta = per_season["f1"] - per_season["f1_base"]
+    print(
+        f"\n구장x시즌 분할 {len(per_season)}개 중 개선 {int((delta > 0).sum())}개, "
+        f"악화 {int((delta < 0).sum())}개, 동일 {int((delta == 0).sum())}개"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="시즌 롤링 오리진 백테스트 (N년까지 학습 → N+1년 테스트)",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+예시:
+  python backtest.py --all
+  python backtest.py --stadium jamsil --models XGBoost LightGBM
+  python backtest.py --all --window 3   # 최근 3시즌만 학습
+  python backtest.py --all --output models/backtest/baseline.csv
+  python backtest.py --all --baseline models/backtest/baseline.csv   # 변경 전후 비교
+
+참고:
+  - 시즌당 취소 경기가 적으므로 시즌별 F1보다 시즌 합산(all) 지표를 우선 보세요.
+        """,
+    )
+    parser.add_argument("--stadium", "-s", type=str, default=None, help="구장 ID (예: jamsil)")
+    parser.add_argument("--all", "-a", action="store_true", help="모든 야외 구장")
+    parser.add_argument(
+        "--models", nargs="+", choices=MODEL_NAMES, default=list(MODEL_NAMES), help="평가할 모델 (기본값: 전체)"
+    )
+    parser.add_argument(
+        "--min-train-seasons",
+        type=int,
+        default=MIN_TRAIN_SEASONS,
+        help=f"첫 테스트 시즌 이전 최소 학습 시즌 수 (기본값: {MIN_TRAIN_SEASONS})",
+    )
+    parser.add_argument("--window", type=int, default=None, help="최근 N시즌만 학습 (기본값: 이전 시즌 전체)")
+    parser.add_argument(
+        "--jobs", "-j", type=int, default=0, help="병렬 프로세스 수 (기본값: 0=코어 수 기준 자동, 1=순차)"
+    )
+    parser.add_argument("--no-cache", action="store_true", help="학습 캐시의 전처리 결과를 사용하지 않음")
+    parser.add_argument("--output", "-o", type=Path, default=None, help="결과 CSV 저장 경로")
+    parser.add_argument("--baseline", type=Path, default=None, help="비교할 이전 결과 CSV")
+    args = parser.parse_args()
+
+    stadium_ids = get_outdoor_stadiums() if args.all else [args.stadium or DEFAULT_STADIUM]
+
+    results = run_backtest(
+        stadium_ids,
+        model_names=args.models,
+        min_train_seasons=args.min_train_seasons,
+        window=args.window,
+        jobs=args.jobs,
+        use_cache=not args.no_cache,
+    )
+    if results.empty:
+        return
+
+    print_stadium_tables(results)
+    print_summary(results)
+
+    if args.baseline is not None:
+        compare_with_baseline(results, args.baseline)
+
+    if args.output is not None:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        results.to_csv(args.output, index=False, encoding="utf-8-sig")
+        print(f"\n[저장] {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -3,32 +3,65 @@ KBO 우천취소 데이터 수집기 (다중 구장 지원)
 ============================================
 지정된 구장의 경기 일정 및 취소 데이터를 크롤링합니다.
 
-설치: pip install selenium webdriver-manager beautifulsoup4 pandas
+기본 수집은 일정 페이지의 데이터 요청(GetScheduleList)을 HTTP로 직접 호출하며,
+실패 시 Selenium(헤드리스 Chrome)으로 폴백합니다.
+
+설치: pip install requests beautifulsoup4 pandas
+      pip install selenium webdriver-manager  # Selenium 폴백 (선택)
 실행: python cancel_crawler.py --stadium jamsil
       python cancel_crawler.py --stadium busan --years 2023 2024
       python cancel_crawler.py --all  # 모든 야외 구장
+      python cancel_crawler.py --all --backend selenium  # 브라우저로 수집
 """
 
 import time
-import re
 import argparse
+import calendar
+import hashlib
+import json
+import threading
 import pandas as pd
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import date, datetime, timedelta
+from pathlib import Path
 import os
 
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait, Select
-from selenium.webdriver.support import expected_conditions as EC
-from webdriver_manager.chrome import ChromeDriverManager
-from bs4 import BeautifulSoup
 
+# Selenium은 HTTP 수집 실패 시 폴백용 (선택 의존성)
+try:
+    from selenium import webdriver
+    from selenium.webdriver.chrome.service import Service
+    from selenium.webdriver.chrome.options import Options
+    from selenium.webdriver.common.by import By
+    from selenium.webdriver.support.ui import WebDriverWait, Select
+    from selenium.webdriver.support import expected_conditions as EC
+    from selenium.common.exceptions import StaleElementReferenceException, TimeoutException
+    from webdriver_manager.chrome import ChromeDriverManager
+
+    SELENIUM_AVAILABLE = True
+except ImportError:
+    SELENIUM_AVAILABLE = False
+
+from kbo_schedule_api import (
+    SCHEDULE_URL,
+    REGULAR_SEASON_SERIES,
+    ScheduleClient,
+    extract_schedule_rows,
+)
+from schedule_cache import SchedulePageCache
+from schedule_parser import (
+    DATE_PATTERN,
+    DAY_PATTERN,
+    TEAMS_PATTERN,
+    build_keyword_lookup,
+    classify_cancellation,
+    parse_schedule_html,
+)
+from dataset_store import get_dataset_dir, load_dataset, replace_partitions, save_dataset, upsert_dataset
 from stadium_config import (
+    DATA_DIR,
     STADIUMS,
     get_stadium_config,
-    get_data_paths,
     get_outdoor_stadiums,
     DEFAULT_YEARS,
     DEFAULT_MONTHS,
@@ -36,31 +69,126 @@ from stadium_config import (
 )
 
 
-def crawl_kbo_schedule(years, months, stadium_id):
-    """
-    KBO 홈페이지에서 경기 일정 크롤링
+# 수집 방식 (cache: 네트워크 없이 페이지 캐시에서 재파싱)
+CRAWLER_BACKENDS = ["http", "selenium", "cache"]
 
-    Args:
-        years: 수집 연도 리스트 (예: [2019, 2020, ...])
-        months: 수집 월 리스트 (예: [3, 4, ..., 10])
-        stadium_id: 구장 ID (예: "jamsil", "busan")
+# 증분 수집 상태 (월별 마지막 수집 시각, 구장별 경기 내용 해시)
+CRAWL_STATE_FILE = DATA_DIR / "crawl_state.json"
+
+# 월 종료 후 이 기간이 지나서 수집한 월은 확정 (증분 수집에서 재수집하지 않음)
+FINAL_GRACE_DAYS = 7
+
+# 병렬 수집 기본값 (작업 수, 전체 초당 요청 수, 페이지당 재시도 횟수)
+DEFAULT_CRAWL_WORKERS = 4
+DEFAULT_CRAWL_RATE = 2.0
+DEFAULT_CRAWL_RETRIES = 2
+
+# Selenium DOM 조건 대기 최대 시간 (초)
+SELENIUM_WAIT_TIMEOUT = 15
+
+def build_stadium_lookup(stadium_ids):
+    """
+    구장명 텍스트 → 구장 ID 조회 함수 생성 (stadium_config 검색어 기준)
 
     Returns:
-        tuple: (전체 경기 리스트, 취소 경기 리스트)
+        callable: match(stadium_text) -> 구장 ID (대상 구장이 아니면 None)
     """
-    # 구장 설정 가져오기
-    stadium_config = get_stadium_config(stadium_id)
-    search_keyword = stadium_config["search_keyword"]
-    # 리스트로 통일 (하위 호환성)
-    if isinstance(search_keyword, str):
-        target_keywords = [search_keyword]
-    else:
-        target_keywords = search_keyword
-    stadium_name = stadium_config["name"]
+    return build_keyword_lookup(
+        {stadium_id: get_stadium_config(stadium_id)["search_keyword"] for stadium_id in stadium_ids}
+    )
+
+
+def parse_schedule_rows(rows, year):
+    """
+    BeautifulSoup 일정 테이블 행 파싱 (구장 필터링 없음)
 
-    print(f"\n대상 구장: {stadium_name} (검색어: {target_keywords})")
+    크롤러는 schedule_parser.parse_schedule_html()을 사용하며,
+    이 함수는 BeautifulSoup 행을 이미 가진 호출자(디버그, 벤치마크 기준선)용입니다.
 
-    # Chrome 옵션 설정
+    Args:
+        rows: tbody의 tr 요소 리스트
+        year: 연도 (날짜 셀에는 월.일만 표시됨)
+
+    Yields:
+        dict: 경기 정보 (stadium_id 제외)
+    """
+    current_date = None
+    current_day = ""
+
+    for row in rows:
+        cells = row.find_all("td")
+        if len(cells) < 8:
+            continue
+
+        # 날짜 셀 확인 (rowspan으로 합쳐진 경우 셀 수가 다름)
+        # 9개 셀: 날짜 포함 행 (날짜, 시간, 경기, 게임센터, 하이라이트, TV, 라디오, 구장, 비고)
+        # 8개 셀: 날짜 없는 행 (시간, 경기, 게임센터, 하이라이트, TV, 라디오, 구장, 비고)
+        has_date_cell = len(cells) == 9
+
+        # 인덱스 오프셋 설정
+        offset = 0 if has_date_cell else -1
+
+        # 날짜 처리
+        if has_date_cell:
+            date_text = cells[0].get_text(strip=True)
+            match = DATE_PATTERN.search(date_text) if date_text else None
+            if match:
+                m, d = match.groups()
+                current_date = f"{year}-{m.zfill(2)}-{d.zfill(2)}"
+                day_match = DAY_PATTERN.search(date_text)
+                current_day = day_match.group(1) if day_match else ""
+
+        if not current_date:
+            continue
+
+        # 시간 (날짜 있으면 index 1, 없으면 index 0)
+        time_idx = 1 + offset
+        time_text = cells[time_idx].get_text(strip=True) if len(cells) > time_idx else ""
+
+        # 경기 정보 (날짜 있으면 index 2, 없으면 index 1)
+        game_idx = 2 + offset
+        game_cell = cells[game_idx] if len(cells) > game_idx else None
+        away_team = ""
+        home_team = ""
+
+        if game_cell:
+            # 팀 이미지 alt 속성에서 팀명 추출
+            team_imgs = game_cell.find_all("img")
+            if len(team_imgs) >= 2:
+                away_team = team_imgs[0].get("alt", "")
+                home_team = team_imgs[1].get("alt", "")
+            else:
+                # 텍스트에서 추출 (점수 제거: "KIA9vs5삼성" -> "KIA vs 삼성")
+                teams_match = TEAMS_PATTERN.search(game_cell.get_text(strip=True))
+                if teams_match:
+                    away_team = teams_match.group(1)
+                    home_team = teams_match.group(2)
+
+        # 구장 (날짜 있으면 index 7, 없으면 index 6)
+        stadium_idx = 7 + offset
+        stadium = cells[stadium_idx].get_text(strip=True) if len(cells) > stadium_idx else ""
+
+        # 비고 (날짜 있으면 index 8, 없으면 index 7)
+        note_idx = 8 + offset
+        note = cells[note_idx].get_text(strip=True) if len(cells) > note_idx else ""
+
+        is_cancelled, cancel_reason = classify_cancellation(row.get_text())
+
+        yield {
+            "date": current_date,
+            "day": current_day,
+            "time": time_text,
+            "stadium": stadium,
+            "home": home_team,
+            "away": away_team,
+            "cancelled": is_cancelled,
+            "reason": cancel_reason,
+            "note": note,
+        }
+
+
+def create_driver():
+    """헤드리스 Chrome WebDriver 생성"""
     chrome_options = Options()
     chrome_options.add_argument("--headless")
     chrome_options.add_argument("--no-sandbox")
@@ -72,261 +200,522 @@ def crawl_kbo_schedule(years, months, stadium_id):
         "user-agent=Mozilla/5.0 (Macintosh; Apple Silicon Mac OS X) AppleWebKit/537.36"
     )
 
-    # WebDriver 설정
     print("Chrome WebDriver 설정 중...")
     service = Service(ChromeDriverManager().install())
-    driver = webdriver.Chrome(service=service, options=chrome_options)
+    return webdriver.Chrome(service=service, options=chrome_options)
+
+
+class WaitStats:
+    """수집 중 대기 시간 집계 (스레드 안전)"""
+
+    LABELS = {
+        "selenium": "Selenium 페이지/DOM 대기",
+        "rate_limit": "요청 속도 제한",
+        "backoff": "재시도 대기",
+    }
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.seconds = {}
+        self.selenium_pages = 0
 
-    all_games = []
-    cancelled_games = []
+    def add(self, kind, seconds):
+        with self._lock:
+            self.seconds[kind] = self.seconds.get(kind, 0.0) + seconds
+
+    def count_selenium_page(self):
+        with self._lock:
+            self.selenium_pages += 1
+
+    def total(self):
+        return sum(self.seconds.values())
+
+    def report(self):
+        """대기 시간 요약 출력 (대기가 없었으면 생략)"""
+        if not self.seconds:
+            return
+        parts = [f"{self.LABELS.get(kind, kind)} {sec:.1f}초" for kind, sec in self.seconds.items()]
+        print(f"대기 시간 합계: {self.total():.1f}초 ({', '.join(parts)})")
+        if self.selenium_pages:
+            print(
+                f"  Selenium 페이지당 평균 대기: "
+                f"{self.seconds.get('selenium', 0.0) / self.selenium_pages:.2f}초 ({self.selenium_pages}개 페이지)"
+            )
+
+
+def _find_schedule_tbody(driver):
+    """일정 테이블 tbody (아직 없으면 None)"""
+    elements = driver.find_elements(By.CSS_SELECTOR, "#tblScheduleList tbody")
+    return elements[0] if elements else None
+
+
+def _table_refreshed(old_tbody, old_html):
+    """
+    일정 테이블 갱신 조건 (WebDriverWait용)
+
+    기존 tbody가 DOM에서 교체되었거나(stale) 내용이 이전 월과 달라지면 갱신된 것으로 봅니다.
+    """
+
+    def condition(driver):
+        tbody = _find_schedule_tbody(driver)
+        if tbody is None:
+            return False
+        if old_tbody is not None:
+            try:
+                old_tbody.is_enabled()
+            except StaleElementReferenceException:
+                return True
+        try:
+            return tbody.get_attribute("innerHTML") != old_html
+        except StaleElementReferenceException:
+            return False
+
+    return condition
+
+
+def _select_and_wait(driver, element_id, value, timeout):
+    """
+    드롭다운 값 선택 후 일정 테이블 갱신 대기
+
+    이미 선택된 값이면 요청이 발생하지 않으므로 건너뜁니다.
+
+    Returns:
+        bool: 값을 변경했는지 여부
+    """
+    dropdown = Select(
+        WebDriverWait(driver, timeout).until(EC.presence_of_element_located((By.ID, element_id)))
+    )
+    if dropdown.first_selected_option.get_attribute("value") == value:
+        return False
+
+    old_tbody = _find_schedule_tbody(driver)
+    old_html = old_tbody.get_attribute("innerHTML") if old_tbody is not None else None
+    dropdown.select_by_value(value)
 
     try:
-        for year in years:
-            for month in months:
-                print(f"\n{'='*50}")
-                print(f"크롤링 중: {year}년 {month}월 ({stadium_name})")
-                print("=" * 50)
+        WebDriverWait(driver, timeout).until(_table_refreshed(old_tbody, old_html))
+    except TimeoutException:
+        # 이전 월과 새 월 모두 데이터가 없으면 테이블이 그대로일 수 있음
+        tbody = _find_schedule_tbody(driver)
+        if tbody is None or "데이터가 없습니다" not in tbody.text:
+            raise
+    return True
 
-                url = "https://www.koreabaseball.com/Schedule/Schedule.aspx"
-                driver.get(url)
-                time.sleep(2)
 
-                try:
-                    # 1. 시리즈 선택 (정규시즌: "0,9,6")
-                    series_dropdown = WebDriverWait(driver, 10).until(
-                        EC.presence_of_element_located((By.ID, "ddlSeries"))
-                    )
-                    series_select = Select(series_dropdown)
-                    series_select.select_by_value("0,9,6")  # 정규시즌
-                    time.sleep(1)
-                    print("  시리즈: 정규시즌 선택")
-
-                    # 2. 연도 선택
-                    year_dropdown = WebDriverWait(driver, 10).until(
-                        EC.presence_of_element_located((By.ID, "ddlYear"))
-                    )
-                    year_select = Select(year_dropdown)
-                    year_select.select_by_value(str(year))
-                    time.sleep(1)
-                    print(f"  연도: {year} 선택")
-
-                    # 3. 월 선택
-                    month_dropdown = WebDriverWait(driver, 10).until(
-                        EC.presence_of_element_located((By.ID, "ddlMonth"))
-                    )
-                    month_select = Select(month_dropdown)
-                    month_select.select_by_value(str(month).zfill(2))
-                    time.sleep(2)
-                    print(f"  월: {month} 선택")
+def fetch_schedule_html(driver, year, month, timeout=SELENIUM_WAIT_TIMEOUT, wait_stats=None):
+    """
+    월별 일정 페이지를 열어 일정 테이블 HTML 반환
 
-                except Exception as e:
-                    print(f"드롭다운 선택 실패: {e}")
-                    continue
-
-                # 페이지 파싱
-                page_source = driver.page_source
-                soup = BeautifulSoup(page_source, "html.parser")
-
-                # 테이블 찾기
-                table = soup.find("table", id="tblScheduleList")
-                if not table:
-                    print("  테이블(tblScheduleList)을 찾을 수 없음")
-                    continue
-
-                tbody = table.find("tbody")
-                if not tbody:
-                    print("  tbody를 찾을 수 없음")
-                    continue
-
-                rows = tbody.find_all("tr")
-
-                # "데이터가 없습니다" 체크
-                if len(rows) == 1 and "데이터가 없습니다" in rows[0].get_text():
-                    print("  데이터 없음")
-                    continue
-
-                print(f"  {len(rows)}개 행 발견")
-
-                current_date = None
-                current_day = ""
-
-                for row in rows:
-                    cells = row.find_all("td")
-                    if len(cells) < 8:
-                        continue
-
-                    # 날짜 셀 확인 (rowspan으로 합쳐진 경우 셀 수가 다름)
-                    # 9개 셀: 날짜 포함 행 (날짜, 시간, 경기, 게임센터, 하이라이트, TV, 라디오, 구장, 비고)
-                    # 8개 셀: 날짜 없는 행 (시간, 경기, 게임센터, 하이라이트, TV, 라디오, 구장, 비고)
-                    has_date_cell = len(cells) == 9
-
-                    # 인덱스 오프셋 설정
-                    offset = 0 if has_date_cell else -1
-
-                    # 날짜 처리
-                    if has_date_cell:
-                        date_cell = cells[0]
-                        date_text = date_cell.get_text(strip=True)
-
-                        if date_text and re.search(r"\d+\.\d+", date_text):
-                            match = re.search(r"(\d+)\.(\d+)", date_text)
-                            if match:
-                                m, d = match.groups()
-                                current_date = f"{year}-{m.zfill(2)}-{d.zfill(2)}"
-                                day_match = re.search(r"\((.)\)", date_text)
-                                current_day = day_match.group(1) if day_match else ""
-
-                    if not current_date:
-                        continue
-
-                    # 시간 (날짜 있으면 index 1, 없으면 index 0)
-                    time_idx = 1 + offset
-                    time_text = cells[time_idx].get_text(strip=True) if len(cells) > time_idx else ""
-
-                    # 경기 정보 (날짜 있으면 index 2, 없으면 index 1)
-                    game_idx = 2 + offset
-                    game_cell = cells[game_idx] if len(cells) > game_idx else None
-                    away_team = ""
-                    home_team = ""
-
-                    if game_cell:
-                        # 팀 이미지 alt 속성에서 팀명 추출
-                        team_imgs = game_cell.find_all("img")
-                        if len(team_imgs) >= 2:
-                            away_team = team_imgs[0].get("alt", "")
-                            home_team = team_imgs[1].get("alt", "")
-                        else:
-                            # 텍스트에서 추출 (점수 제거: "KIA9vs5삼성" -> "KIA vs 삼성")
-                            game_text = game_cell.get_text(strip=True)
-                            # 점수 포함된 패턴: "팀명+점수 vs 점수+팀명" 또는 "팀명 vs 팀명"
-                            teams_match = re.search(
-                                r"([가-힣A-Za-z]+)\d*\s*(?:vs|VS)\s*\d*([가-힣A-Za-z]+)", game_text
-                            )
-                            if teams_match:
-                                away_team = teams_match.group(1)
-                                home_team = teams_match.group(2)
-
-                    # 구장 (날짜 있으면 index 7, 없으면 index 6)
-                    stadium_idx = 7 + offset
-                    stadium = cells[stadium_idx].get_text(strip=True) if len(cells) > stadium_idx else ""
-
-                    # 비고 (날짜 있으면 index 8, 없으면 index 7)
-                    note_idx = 8 + offset
-                    note = cells[note_idx].get_text(strip=True) if len(cells) > note_idx else ""
-
-                    # 대상 구장 필터링 (여러 키워드 중 하나라도 포함되면 매칭)
-                    if target_keywords and not any(kw in stadium for kw in target_keywords):
-                        continue
-
-                    # 전체 행 텍스트
-                    row_text = row.get_text()
-
-                    # 취소 여부 확인
-                    cancel_keywords = ["취소", "우천", "순연", "그라운드", "노게임", "폭염"]
-                    is_cancelled = any(keyword in row_text for keyword in cancel_keywords)
-
-                    # 취소 사유 판단
-                    if "우천" in row_text and "노게임" in row_text:
-                        cancel_reason = "우천노게임"
-                    elif "우천" in row_text:
-                        cancel_reason = "우천취소"
-                    elif "그라운드" in row_text:
-                        cancel_reason = "그라운드사정"
-                    elif "폭염" in row_text:
-                        cancel_reason = "폭염취소"
-                    elif "순연" in row_text:
-                        cancel_reason = "순연"
-                    elif is_cancelled:
-                        cancel_reason = "기타취소"
-                    else:
-                        cancel_reason = "정상진행"
-
-                    game_info = {
-                        "date": current_date,
-                        "day": current_day,
-                        "time": time_text,
-                        "stadium": stadium,
-                        "stadium_id": stadium_id,
-                        "home": home_team,
-                        "away": away_team,
-                        "cancelled": is_cancelled,
-                        "reason": cancel_reason,
-                        "note": note,
-                    }
-
-                    all_games.append(game_info)
-
-                    if is_cancelled:
-                        cancelled_games.append(game_info)
-                        print(
-                            f"  [취소] {current_date} | {stadium} | {away_team} vs {home_team} | {cancel_reason}"
-                        )
-                    else:
-                        print(
-                            f"  [정상] {current_date} | {stadium} | {away_team} vs {home_team}"
-                        )
-
-                time.sleep(1)
+    고정 대기 대신 DOM 조건(테이블 존재, 드롭다운 변경 후 테이블 교체/내용 변경)을
+    기다립니다. 같은 WebDriver로 이어서 호출하면 페이지를 다시 열지 않고
+    드롭다운만 바꿉니다.
+
+    Args:
+        driver: WebDriver (스레드마다 재사용)
+        timeout: 조건별 최대 대기 시간 (초)
+        wait_stats: 대기 시간 집계 (WaitStats, 선택)
+
+    Returns:
+        str: tblScheduleList 테이블 HTML (페이지 캐시 저장 형식)
+
+    Raises:
+        RuntimeError: 드롭다운 선택/테이블 갱신 실패 또는 일정 테이블 없음 (재시도 대상)
+    """
+    start = time.perf_counter()
+    try:
+        if not driver.current_url.startswith(SCHEDULE_URL):
+            driver.get(SCHEDULE_URL)
+            WebDriverWait(driver, timeout).until(
+                EC.presence_of_element_located((By.CSS_SELECTOR, "#tblScheduleList tbody"))
+            )
+
+        # 시리즈(정규시즌: "0,9,6") → 연도 → 월 순서로 선택
+        _select_and_wait(driver, "ddlSeries", REGULAR_SEASON_SERIES, timeout)
+        _select_and_wait(driver, "ddlYear", str(year), timeout)
+        _select_and_wait(driver, "ddlMonth", str(month).zfill(2), timeout)
+
+        table_html = driver.find_element(By.ID, "tblScheduleList").get_attribute("outerHTML")
 
     except Exception as e:
-        print(f"크롤링 중 오류 발생: {e}")
-        import traceback
+        # 다음 시도는 페이지를 새로 열도록 초기화
+        try:
+            driver.get("about:blank")
+        except Exception:
+            pass
+        raise RuntimeError(f"일정 페이지 갱신 실패: {e}") from e
+
+    finally:
+        if wait_stats is not None:
+            wait_stats.add("selenium", time.perf_counter() - start)
+            wait_stats.count_selenium_page()
+
+    return table_html
+
+
+def fetch_schedule_rows(driver, year, month):
+    """
+    월별 일정 페이지를 열어 테이블 행 반환
+
+    Returns:
+        list: tbody의 tr 요소 리스트 (데이터 없음 시 None)
+    """
+    return extract_schedule_rows(fetch_schedule_html(driver, year, month))
+
+
+class RateLimiter:
+    """초당 요청 수 제한 (스레드 안전, 요청 시작 간격 보장)"""
+
+    def __init__(self, rate):
+        """
+        Args:
+            rate: 초당 최대 요청 수
+        """
+        self.interval = 1.0 / rate
+        self._lock = threading.Lock()
+        self._next_time = 0.0
+
+    def wait(self):
+        """
+        다음 요청 슬롯까지 대기
+
+        Returns:
+            float: 대기한 시간 (초)
+        """
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self._next_time)
+            self._next_time = start + self.interval
+        if start > now:
+            time.sleep(start - now)
+        return max(start - now, 0.0)
+
+
+class ScheduleFetcher:
+    """
+    (연, 월) 일정 페이지 수집기
+
+    작업 스레드마다 HTTP 클라이언트/WebDriver를 하나씩 생성하여 재사용하고,
+    모든 스레드가 하나의 RateLimiter를 공유합니다. 수집한 페이지는
+    페이지 캐시(schedule_cache)에 저장하고, 대기 시간은 wait_stats에 집계합니다.
+    """
+
+    def __init__(
+        self,
+        backend="http",
+        fixture_dir=None,
+        record=False,
+        rate=DEFAULT_CRAWL_RATE,
+        page_cache=None,
+    ):
+        self.backend = backend
+        self.fixture_dir = fixture_dir
+        self.record = record
+        self.replay = backend == "http" and fixture_dir is not None and not record
+        self.offline = self.replay or backend == "cache"
+        # 오프라인 수집은 네트워크 요청이 없으므로 제한하지 않음
+        self.rate_limiter = RateLimiter(rate) if rate and not self.offline else None
+        self.page_cache = page_cache
+        self.wait_stats = WaitStats()
+
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._clients = []
+        self._drivers = []
+
+    def _get_client(self):
+        client = getattr(self._local, "client", None)
+        if client is None:
+            # 요청 간격은 공유 RateLimiter가 관리
+            client = ScheduleClient(
+                fixture_dir=self.fixture_dir, record=self.record, request_interval=0
+            )
+            self._local.client = client
+            with self._lock:
+                self._clients.append(client)
+        return client
+
+    def _get_driver(self):
+        driver = getattr(self._local, "driver", None)
+        if driver is None:
+            driver = create_driver()
+            self._local.driver = driver
+            with self._lock:
+                self._drivers.append(driver)
+        return driver
+
+    def fetch_html(self, year, month):
+        """
+        월별 일정 테이블 HTML 조회 (HTTP 실패 시 Selenium 폴백)
+
+        Returns:
+            str: 일정 테이블 HTML
+        """
+        if self.backend == "cache":
+            cached = self.page_cache.get(REGULAR_SEASON_SERIES, year, month)
+            if cached is None:
+                raise LookupError("캐시된 페이지 없음")
+            return cached[0]
+
+        if self.rate_limiter is not None:
+            self.wait_stats.add("rate_limit", self.rate_limiter.wait())
+
+        if self.backend == "http":
+            try:
+                return self._get_client().fetch_table_html(year, month)
+            except Exception as e:
+                if self.replay or not SELENIUM_AVAILABLE:
+                    raise
+                print(f"  {year}년 {month}월 HTTP 수집 실패, Selenium으로 재시도: {e}")
+
+        return fetch_schedule_html(self._get_driver(), year, month, wait_stats=self.wait_stats)
+
+    def fetch_page(self, year, month):
+        """
+        월별 일정 테이블 HTML 조회 (수집한 페이지는 캐시에 저장)
+        """
+        html = self.fetch_html(year, month)
+        # 녹화 응답 재생/캐시 재파싱은 다시 저장하지 않음
+        if self.page_cache is not None and not self.offline:
+            self.page_cache.put(REGULAR_SEASON_SERIES, year, month, html)
+        return html
+
+    def fetch_games(self, year, month, retries=DEFAULT_CRAWL_RETRIES):
+        """
+        월별 경기 목록 수집 (실패 시 지수 백오프로 재시도)
+
+        Returns:
+            list: schedule_parser.ScheduleGame 리스트
+        """
+        for attempt in range(retries + 1):
+            try:
+                return parse_schedule_html(self.fetch_page(year, month), year)
+            except Exception as e:
+                if attempt == retries or self.backend == "cache":
+                    raise
+                wait = 2**attempt
+                print(f"  {year}년 {month}월 수집 실패 ({attempt + 1}/{retries + 1}), {wait}초 후 재시도: {e}")
+                time.sleep(wait)
+                self.wait_stats.add("backoff", wait)
+
+    def close(self):
+        for client in self._clients:
+            client.close()
+        for driver in self._drivers:
+            driver.quit()
+        if self._drivers:
+            print(f"\nWebDriver {len(self._drivers)}개 종료")
+        self._clients = []
+        self._drivers = []
+
+
+def fetch_schedule_pages(
+    units,
+    backend="http",
+    fixture_dir=None,
+    record=False,
+    workers=DEFAULT_CRAWL_WORKERS,
+    rate=DEFAULT_CRAWL_RATE,
+    retries=DEFAULT_CRAWL_RETRIES,
+    cache_pages=True,
+):
+    """
+    (연, 월) 단위 일정 페이지 병렬 수집/파싱
+
+    Args:
+        units: [(연, 월)] 작업 단위 리스트
+        (나머지 인자는 crawl_schedules() 참고)
+
+    Returns:
+        dict: {(연, 월): ScheduleGame 리스트} - 실패한 단위는 제외
+    """
+    if backend not in CRAWLER_BACKENDS:
+        raise ValueError(f"지원하지 않는 수집 방식: {backend}. 가능한 방식: {', '.join(CRAWLER_BACKENDS)}")
+    if backend == "selenium" and not SELENIUM_AVAILABLE:
+        raise ImportError("selenium이 설치되지 않았습니다: pip install selenium webdriver-manager")
 
-        traceback.print_exc()
+    print(f"수집 방식: {backend}, 작업 {workers}개, 초당 최대 {rate}페이지, {len(units)}개 월별 페이지")
 
+    page_cache = SchedulePageCache() if cache_pages or backend == "cache" else None
+    fetcher = ScheduleFetcher(
+        backend, fixture_dir=fixture_dir, record=record, rate=rate, page_cache=page_cache
+    )
+    pages = {}
+    start_time = time.perf_counter()
+
+    try:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {
+                executor.submit(fetcher.fetch_games, year, month, retries): (year, month)
+                for year, month in units
+            }
+            for done, future in enumerate(as_completed(futures), 1):
+                year, month = futures[future]
+                try:
+                    pages[(year, month)] = future.result()
+                    status = f"{len(pages[(year, month)])}개 경기"
+                except Exception as e:
+                    status = f"실패 ({e})"
+                elapsed = time.perf_counter() - start_time
+                print(
+                    f"  [{done}/{len(units)}] {year}년 {month}월: {status} "
+                    f"({done / elapsed:.2f} pages/s)"
+                )
     finally:
-        driver.quit()
-        print("\nWebDriver 종료")
+        fetcher.close()
 
-    return all_games, cancelled_games
+    elapsed = time.perf_counter() - start_time
+    print(
+        f"\n수집 완료: {len(pages)}/{len(units)}개 페이지, {elapsed:.1f}초 "
+        f"({len(units) / max(elapsed, 1e-9):.2f} pages/s, 작업 {workers}개)"
+    )
+    fetcher.wait_stats.report()
+    return pages
+
+
+def route_games(pages, units, stadium_ids, verbose=True):
+    """
+    수집한 경기를 구장별로 분배 ((연, 월) 순서 유지)
+
+    Args:
+        pages: fetch_schedule_pages() 결과
+        units: [(연, 월)] 분배 순서
+        stadium_ids: 대상 구장 ID 리스트
+        verbose: True면 경기별 배정 결과 출력
+
+    Returns:
+        dict: {stadium_id: (전체 경기 리스트, 취소 경기 리스트)}
+    """
+    match_stadium = build_stadium_lookup(stadium_ids)
+    results = {stadium_id: ([], []) for stadium_id in stadium_ids}
+
+    for unit in units:
+        for game in pages.get(unit, []):
+            # 대상 구장 배정 (여러 키워드 중 하나라도 포함되면 매칭)
+            stadium_id = match_stadium(game.stadium)
+            if stadium_id is None:
+                continue
+
+            game_info = {**game.to_dict(), "stadium_id": stadium_id}
+            all_games, cancelled_games = results[stadium_id]
+            all_games.append(game_info)
+
+            if game_info["cancelled"]:
+                cancelled_games.append(game_info)
+
+            if not verbose:
+                continue
+            if game_info["cancelled"]:
+                print(
+                    f"  [취소] {game_info['date']} | {game_info['stadium']} | "
+                    f"{game_info['away']} vs {game_info['home']} | {game_info['reason']}"
+                )
+            else:
+                print(
+                    f"  [정상] {game_info['date']} | {game_info['stadium']} | "
+                    f"{game_info['away']} vs {game_info['home']}"
+                )
+
+    return results
+
+
+def crawl_schedules(years, months, stadium_ids, **crawl_options):
+    """
+    KBO 홈페이지 경기 일정을 한 번만 크롤링하여 여러 구장으로 분배
+
+    월별 페이지를 한 번씩만 파싱하고, 각 행을 구장 검색어 조회 테이블로
+    해당 구장에 배정합니다 (구장 수와 무관하게 페이지 로드 횟수 동일).
+    (연, 월) 단위 작업은 workers개 스레드로 병렬 수집하되, 결과는 항상
+    (연, 월) 순서로 분배하므로 출력 순서는 작업 수와 무관합니다.
+
+    Args:
+        years: 수집 연도 리스트 (예: [2019, 2020, ...])
+        months: 수집 월 리스트 (예: [3, 4, ..., 10])
+        stadium_ids: 구장 ID 리스트 (예: ["jamsil", "busan"])
+        **crawl_options: 수집 옵션
+            backend: "http" (데이터 요청 직접 호출, 실패 시 Selenium 폴백), "selenium",
+                     또는 "cache" (페이지 캐시 재파싱, 네트워크 없음)
+            fixture_dir: HTTP 응답 녹화/재생 디렉토리 (kbo_schedule_api.ScheduleClient 참고)
+            record: True면 HTTP 응답을 fixture_dir에 녹화
+            workers: 병렬 수집 작업 수 (Selenium은 작업당 브라우저 1개)
+            rate: 전체 작업 합산 초당 최대 페이지 요청 수
+            retries: (연, 월) 단위 재시도 횟수
+            cache_pages: True면 수집한 페이지를 페이지 캐시에 저장
+
+    Returns:
+        dict: {stadium_id: (전체 경기 리스트, 취소 경기 리스트)}
+    """
+    names = ", ".join(get_stadium_config(sid)["name"] for sid in stadium_ids)
+    units = [(year, month) for year in years for month in months]
+    print(f"\n대상 구장: {names}")
+
+    pages = fetch_schedule_pages(units, **crawl_options)
+    return route_games(pages, units, stadium_ids)
+
+
+def crawl_kbo_schedule(years, months, stadium_id, **crawl_options):
+    """
+    KBO 홈페이지에서 단일 구장 경기 일정 크롤링
+
+    Args:
+        years: 수집 연도 리스트 (예: [2019, 2020, ...])
+        months: 수집 월 리스트 (예: [3, 4, ..., 10])
+        stadium_id: 구장 ID (예: "jamsil", "busan")
+        **crawl_options: crawl_schedules() 수집 옵션 (backend, fixture_dir, ...)
+
+    Returns:
+        tuple: (전체 경기 리스트, 취소 경기 리스트)
+    """
+    return crawl_schedules(years, months, [stadium_id], **crawl_options)[stadium_id]
 
 
-def save_results(all_games, cancelled_games, stadium_id, append=False):
+def save_results(all_games, cancelled_games, stadium_id, append=False, units=None):
     """
-    결과를 CSV 파일로 저장
+    결과를 데이터셋 저장소(Parquet)에 저장
 
     Args:
         all_games: 전체 경기 리스트
         cancelled_games: 취소 경기 리스트
         stadium_id: 구장 ID
         append: True면 기존 데이터에 추가, False면 덮어쓰기
+        units: [(연, 월)] 지정 시 해당 월 파티션만 교체 (재파싱/증분 수집, 나머지 기간은 유지)
     """
-    paths = get_data_paths(stadium_id)
     stadium_config = get_stadium_config(stadium_id)
     stadium_name = stadium_config["name"]
 
+    if units is not None:
+        # 지정한 월만 교체 (해당 월 경기가 없어지면 파티션 삭제)
+        stats = replace_partitions(pd.DataFrame(all_games), stadium_id, "all_games", units)
+        print(f"\n[월 교체] 전체 경기 {len(all_games)}개 ({stats['replaced']}개 파티션 교체, {stats['removed']}개 삭제)")
+        stats = replace_partitions(pd.DataFrame(cancelled_games), stadium_id, "cancelled", units)
+        print(f"취소 경기 {len(cancelled_games)}개 ({stats['replaced']}개 파티션 교체, {stats['removed']}개 삭제)")
+        return
+
     if all_games:
         df_new = pd.DataFrame(all_games)
-        all_path = paths["all_games"]
-        all_path.parent.mkdir(parents=True, exist_ok=True)
-        
-        if append and all_path.exists():
-            # 기존 데이터 로드 후 병합
-            df_existing = pd.read_csv(all_path)
-            df_all = pd.concat([df_existing, df_new], ignore_index=True)
-            # 중복 제거 (날짜 + 홈팀 + 원정팀 기준)
-            df_all = df_all.drop_duplicates(subset=["date", "home", "away"], keep="last")
-            df_all = df_all.sort_values("date").reset_index(drop=True)
-            print(f"\n[APPEND 모드] 기존 {len(df_existing)}개 + 신규 {len(df_new)}개 = 총 {len(df_all)}개")
+
+        if append:
+            # 신규 행이 속한 (연, 월) 파티션만 병합 후 교체
+            stats = upsert_dataset(df_new, stadium_id, "all_games")
+            all_path = get_dataset_dir(stadium_id, "all_games")
+            print(
+                f"\n[APPEND 모드] 신규 {stats['inserted']}개, 갱신 {stats['updated']}개 "
+                f"({stats['partitions']}개 파티션)"
+            )
         else:
-            df_all = df_new
-        
-        df_all.to_csv(all_path, index=False, encoding="utf-8-sig")
-        print(f"전체 경기 저장: {all_path} ({len(df_all)}개)")
+            all_path = save_dataset(df_new, stadium_id, "all_games")
+        print(f"전체 경기 저장: {all_path}")
 
     if cancelled_games:
         df_cancelled_new = pd.DataFrame(cancelled_games)
-        cancelled_path = paths["cancelled"]
-        
-        if append and cancelled_path.exists():
-            df_existing = pd.read_csv(cancelled_path)
-            df_cancelled = pd.concat([df_existing, df_cancelled_new], ignore_index=True)
-            df_cancelled = df_cancelled.drop_duplicates(subset=["date", "home", "away"], keep="last")
-            df_cancelled = df_cancelled.sort_values("date").reset_index(drop=True)
+
+        if append:
+            upsert_dataset(df_cancelled_new, stadium_id, "cancelled")
+            cancelled_path = get_dataset_dir(stadium_id, "cancelled")
+            df_cancelled = load_dataset(stadium_id, "cancelled", columns=["date", "reason"])
         else:
+            cancelled_path = save_dataset(df_cancelled_new, stadium_id, "cancelled")
             df_cancelled = df_cancelled_new
-        
-        df_cancelled.to_csv(cancelled_path, index=False, encoding="utf-8-sig")
+
         print(f"취소 경기 저장: {cancelled_path} ({len(df_cancelled)}개)")
 
         print("\n" + "=" * 60)
@@ -343,7 +732,7 @@ def save_results(all_games, cancelled_games, stadium_id, append=False):
         print(f"\n{stadium_name}: 취소된 경기가 없습니다.")
 
 
-def crawl_stadium(stadium_id, years=None, months=None, append=False):
+def crawl_stadium(stadium_id, years=None, months=None, append=False, **crawl_options):
     """
     특정 구장의 데이터 수집
 
@@ -352,6 +741,7 @@ def crawl_stadium(stadium_id, years=None, months=None, append=False):
         years: 연도 리스트 (기본값: DEFAULT_YEARS)
         months: 월 리스트 (기본값: DEFAULT_MONTHS)
         append: True면 기존 데이터에 추가
+        **crawl_options: crawl_schedules() 수집 옵션 (backend, fixture_dir, ...)
 
     Returns:
         tuple: (전체 경기 리스트, 취소 경기 리스트)
@@ -373,7 +763,7 @@ def crawl_stadium(stadium_id, years=None, months=None, append=False):
     print("크롤링을 시작합니다...\n")
 
     all_games, cancelled_games = crawl_kbo_schedule(
-        years=years, months=months, stadium_id=stadium_id
+        years=years, months=months, stadium_id=stadium_id, **crawl_options
     )
 
     save_results(all_games, cancelled_games, stadium_id, append=append)
@@ -385,18 +775,23 @@ def crawl_stadium(stadium_id, years=None, months=None, append=False):
     return all_games, cancelled_games
 
 
-def crawl_all_stadiums(years=None, months=None, outdoor_only=True):
+def crawl_all_stadiums(years=None, months=None, outdoor_only=True, append=False, **crawl_options):
     """
-    모든 구장 데이터 수집
+    모든 구장 데이터 수집 (월별 페이지를 한 번만 크롤링)
 
     Args:
         years: 연도 리스트
         months: 월 리스트
         outdoor_only: 야외 구장만 수집 (돔 제외)
+        append: True면 기존 데이터에 추가
+        **crawl_options: crawl_schedules() 수집 옵션 (backend, fixture_dir, ...)
 
     Returns:
         dict: {stadium_id: (all_games, cancelled_games)}
     """
+    years = years or DEFAULT_YEARS
+    months = months or DEFAULT_MONTHS
+
     if outdoor_only:
         stadium_ids = get_outdoor_stadiums()
         print(f"야외 구장 {len(stadium_ids)}개 수집 시작...")
@@ -404,17 +799,20 @@ def crawl_all_stadiums(years=None, months=None, outdoor_only=True):
         stadium_ids = list(STADIUMS.keys())
         print(f"전체 구장 {len(stadium_ids)}개 수집 시작...")
 
-    results = {}
+    print(f"수집 대상: {years[0]}~{years[-1]}년 ({len(years) * len(months)}개 월별 페이지)")
+
+    results = crawl_schedules(years, months, stadium_ids, **crawl_options)
+
     for i, stadium_id in enumerate(stadium_ids, 1):
         print(f"\n{'#'*60}")
-        print(f"# [{i}/{len(stadium_ids)}] {STADIUMS[stadium_id]['name']}")
+        print(f"# [{i}/{len(stadium_ids)}] {STADIUMS[stadium_id]['name']} 저장")
         print("#" * 60)
 
+        all_games, cancelled_games = results[stadium_id]
         try:
-            all_games, cancelled_games = crawl_stadium(stadium_id, years, months)
-            results[stadium_id] = (all_games, cancelled_games)
+            save_results(all_games, cancelled_games, stadium_id, append=append)
         except Exception as e:
-            print(f"[오류] {stadium_id} 수집 실패: {e}")
+            print(f"[오류] {stadium_id} 저장 실패: {e}")
             results[stadium_id] = ([], [])
 
     # 전체 요약
@@ -438,6 +836,182 @@ def crawl_all_stadiums(years=None, months=None, outdoor_only=True):
     return results
 
 
+def reparse_all_stadiums(years=None, months=None, outdoor_only=True):
+    """
+    페이지 캐시에서 모든 구장 데이터 재생성 (브라우저/네트워크 없음)
+
+    파서 수정 후 전체 재크롤링 없이 all_games/cancelled 데이터셋을 다시 만듭니다.
+    캐시된 (연, 월) 페이지 중 재파싱에 성공한 월의 파티션만 교체하므로,
+    캐시가 일부 기간만 있거나 --year/--month를 지정해도 나머지 기간 데이터는 유지됩니다.
+
+    Args:
+        years: 연도 리스트 (기본값: 캐시된 모든 연도)
+        months: 월 리스트 (기본값: 캐시된 모든 월)
+        outdoor_only: 야외 구장만 재생성 (돔 제외)
+
+    Returns:
+        dict: {stadium_id: (all_games, cancelled_games)}
+    """
+    entries = SchedulePageCache().entries(series=REGULAR_SEASON_SERIES)
+    units = [
+        (year, month)
+        for _, year, month, _ in entries
+        if (not years or year in years) and (not months or month in months)
+    ]
+    if not units:
+        print("캐시된 페이지가 없습니다. 먼저 크롤링을 실행하세요.")
+        return {}
+
+    stadium_ids = get_outdoor_stadiums() if outdoor_only else list(STADIUMS.keys())
+
+    print("=" * 60)
+    print(f"페이지 캐시 재파싱: {len(units)}개 캐시 페이지 ({units[0][0]}-{units[0][1]:02d} ~ {units[-1][0]}-{units[-1][1]:02d})")
+    print("=" * 60)
+
+    pages = fetch_schedule_pages(units, backend="cache", retries=0)
+    results = route_games(pages, units, stadium_ids, verbose=False)
+    # 파싱에 실패한 월은 기존 파티션 유지
+    parsed_units = [unit for unit in units if unit in pages]
+
+    for i, stadium_id in enumerate(stadium_ids, 1):
+        print(f"\n[{i}/{len(stadium_ids)}] {STADIUMS[stadium_id]['name']}")
+        all_games, cancelled_games = results[stadium_id]
+        try:
+            save_results(all_games, cancelled_games, stadium_id, units=parsed_units)
+        except Exception as e:
+            print(f"[오류] {stadium_id} 저장 실패: {e}")
+            results[stadium_id] = ([], [])
+
+    return results
+
+
+def load_crawl_state():
+    """증분 수집 상태 로드 ({"YYYY-MM": {"crawled_at", "final", "n_games", "hashes"}})"""
+    if CRAWL_STATE_FILE.exists():
+        return json.loads(CRAWL_STATE_FILE.read_text(encoding="utf-8"))
+    return {}
+
+
+def save_crawl_state(state):
+    """증분 수집 상태 저장 (임시 파일에 쓴 뒤 교체)"""
+    CRAWL_STATE_FILE.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = CRAWL_STATE_FILE.with_name(f".{CRAWL_STATE_FILE.name}.{os.getpid()}.tmp")
+    tmp_path.write_text(json.dumps(state, ensure_ascii=False, indent=1, sort_keys=True), encoding="utf-8")
+    os.replace(tmp_path, CRAWL_STATE_FILE)
+
+
+def games_hash(games):
+    """경기 목록 내용 해시 (행 순서 무관)"""
+    payload = sorted(json.dumps(game, ensure_ascii=False, sort_keys=True) for game in games)
+    return hashlib.sha256("\n".join(payload).encode("utf-8")).hexdigest()
+
+
+EMPTY_GAMES_HASH = games_hash([])
+
+
+def is_month_final(year, month, crawled_at):
+    """월 종료 후 FINAL_GRACE_DAYS가 지나서 수집했으면 확정 (더 이상 바뀌지 않음)"""
+    month_end = date(year, month, calendar.monthrange(year, month)[1])
+    return crawled_at.date() > month_end + timedelta(days=FINAL_GRACE_DAYS)
+
+
+def select_incremental_units(years, months, state, today=None):
+    """
+    증분 수집 대상 (연, 월) 선택
+
+    미래 월과 확정된 월은 제외하므로, 시즌 중에는 보통 이번 달과 지난달만 남습니다.
+    """
+    today = today or date.today()
+    units = []
+    for year in years:
+        for month in months:
+            if date(year, month, 1) > today:
+                continue
+            entry = state.get(f"{year}-{month:02d}")
+            if entry and entry.get("final"):
+                continue
+            units.append((year, month))
+    return units
+
+
+def crawl_incremental(years=None, months=None, outdoor_only=True, **crawl_options):
+    """
+    증분 수집: 바뀔 수 있는 월만 수집하고, 내용이 바뀐 구장만 병합 저장
+
+    월별로 구장마다 경기 내용 해시를 기록해 두고, 해시가 바뀐 (구장, 월)은
+    해당 월 파티션을 새 내용으로 교체합니다 (취소 번복/삭제된 경기 반영).
+
+    Args:
+        years: 연도 리스트 (기본값: DEFAULT_YEARS + 올해)
+        months: 월 리스트 (기본값: DEFAULT_MONTHS)
+        outdoor_only: 야외 구장만 수집 (돔 제외)
+        **crawl_options: crawl_schedules() 수집 옵션
+
+    Returns:
+        dict: {stadium_id: (전체 경기 리스트, 취소 경기 리스트)} - 변경된 구장/월의 경기만
+              (경기가 모두 사라진 월이면 빈 리스트)
+    """
+    now = datetime.now()
+    years = years or sorted(set(DEFAULT_YEARS) | {now.year})
+    months = months or DEFAULT_MONTHS
+    stadium_ids = get_outdoor_stadiums() if outdoor_only else list(STADIUMS.keys())
+
+    state = load_crawl_state()
+    units = select_incremental_units(years, months, state, today=now.date())
+
+    print("=" * 60)
+    print(f"증분 수집: 전체 {len(years) * len(months)}개 월 중 {len(units)}개 월 확인")
+    print("=" * 60)
+
+    if not units:
+        print("수집할 월이 없습니다 (모두 확정됨).")
+        return {}
+
+    pages = fetch_schedule_pages(units, **crawl_options)
+
+    changed = {}
+    changed_units = {}
+    for year, month in units:
+        # 실패한 월은 상태를 갱신하지 않아 다음 실행에서 다시 수집
+        if (year, month) not in pages:
+            continue
+
+        key = f"{year}-{month:02d}"
+        previous_hashes = state.get(key, {}).get("hashes", {})
+        unit_results = route_games({(year, month): pages[(year, month)]}, [(year, month)], stadium_ids, verbose=False)
+
+        hashes = {}
+        changed_ids = []
+        for stadium_id, (all_games, cancelled_games) in unit_results.items():
+            # 경기 없는 구장도 해시 기록 (경기가 모두 사라지면 변경으로 감지, 이전 상태에 없으면 경기 없음)
+            hashes[stadium_id] = games_hash(all_games)
+            if previous_hashes.get(stadium_id, EMPTY_GAMES_HASH) != hashes[stadium_id]:
+                changed_ids.append(stadium_id)
+                changed_units.setdefault(stadium_id, []).append((year, month))
+                stadium_all, stadium_cancelled = changed.setdefault(stadium_id, ([], []))
+                stadium_all.extend(all_games)
+                stadium_cancelled.extend(cancelled_games)
+
+        state[key] = {
+            "crawled_at": now.isoformat(timespec="seconds"),
+            "final": is_month_final(year, month, now),
+            "n_games": len(pages[(year, month)]),
+            "hashes": hashes,
+        }
+        print(f"  {key}: {'변경 - ' + ', '.join(changed_ids) if changed_ids else '변경 없음'}")
+
+    for stadium_id, (all_games, cancelled_games) in changed.items():
+        print(f"\n[{STADIUMS[stadium_id]['name']}] 변경 월 {len(changed_units[stadium_id])}개 교체 ({len(all_games)}개 경기)")
+        save_results(all_games, cancelled_games, stadium_id, units=changed_units[stadium_id])
+
+    # 저장이 끝난 뒤 상태 기록 (저장 실패 시 다음 실행에서 다시 변경으로 감지)
+    save_crawl_state(state)
+
+    if not changed:
+        print("\n변경된 경기가 없습니다.")
+    return changed
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="KBO 우천취소 데이터 수집기",
@@ -447,6 +1021,12 @@ def main():
   python cancel_crawler.py --stadium jamsil
   python cancel_crawler.py --stadium busan --years 2023 2024
   python cancel_crawler.py --all
+  python cancel_crawler.py --all --backend selenium
+  python cancel_crawler.py --all --workers 8 --rate 4  # 병렬 수집
+  python cancel_crawler.py --all --record            # HTTP 응답 녹화
+  python cancel_crawler.py --all --fixtures data/fixtures/schedule  # 오프라인 재생
+  python cancel_crawler.py --reparse                  # 캐시된 페이지로 재생성
+  python cancel_crawler.py --incremental              # 바뀔 수 있는 월만 수집
   python cancel_crawler.py --list
 
 지원 구장:
@@ -502,8 +1082,70 @@ def main():
         action="store_true",
         help="기존 데이터에 추가 (덮어쓰기 대신 병합)",
     )
+    parser.add_argument(
+        "--backend",
+        type=str,
+        choices=CRAWLER_BACKENDS,
+        default="http",
+        help="수집 방식 (http: 데이터 요청 직접 호출, selenium: 브라우저)",
+    )
+    parser.add_argument(
+        "--workers",
+        "-w",
+        type=int,
+        default=DEFAULT_CRAWL_WORKERS,
+        help=f"병렬 수집 작업 수 (기본: {DEFAULT_CRAWL_WORKERS})",
+    )
+    parser.add_argument(
+        "--rate",
+        type=float,
+        default=DEFAULT_CRAWL_RATE,
+        help=f"초당 최대 페이지 요청 수 (기본: {DEFAULT_CRAWL_RATE})",
+    )
+    parser.add_argument(
+        "--retries",
+        type=int,
+        default=DEFAULT_CRAWL_RETRIES,
+        help=f"페이지당 재시도 횟수 (기본: {DEFAULT_CRAWL_RETRIES})",
+    )
+    parser.add_argument(
+        "--fixtures",
+        type=str,
+        default=None,
+        help="HTTP 응답 fixture 디렉토리 (--record 없이 지정하면 오프라인 재생)",
+    )
+    parser.add_argument(
+        "--record",
+        action="store_true",
+        help="HTTP 응답을 fixture 디렉토리에 녹화",
+    )
+
+    parser.add_argument(
+        "--reparse",
+        action="store_true",
+        help="페이지 캐시에서 모든 구장 데이터 재생성 (네트워크 없음)",
+    )
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="증분 수집 (확정되지 않은 월만 수집, 바뀐 구장만 병합)",
+    )
+    parser.add_argument(
+        "--no-page-cache",
+        action="store_true",
+        help="수집한 페이지를 캐시에 저장하지 않음",
+    )
 
     args = parser.parse_args()
+    crawl_options = {
+        "backend": args.backend,
+        "fixture_dir": Path(args.fixtures) if args.fixtures else None,
+        "record": args.record,
+        "workers": args.workers,
+        "rate": args.rate,
+        "retries": args.retries,
+        "cache_pages": not args.no_page_cache,
+    }
 
     # 구장 목록 출력
     if args.list:
@@ -512,14 +1154,28 @@ def main():
         print_stadium_info()
         return
 
+    # 캐시 재파싱
+    if args.reparse:
+        reparse_all_stadiums(years=args.years, months=args.months)
+        return
+
+    # 증분 수집
+    if args.incremental:
+        crawl_incremental(years=args.years, months=args.months, **crawl_options)
+        return
+
     # 모든 구장 수집
     if args.all:
-        crawl_all_stadiums(years=args.years, months=args.months)
+        crawl_all_stadiums(
+            years=args.years, months=args.months, append=args.append, **crawl_options
+        )
         return
 
     # 특정 구장 수집
     stadium_id = args.stadium or DEFAULT_STADIUM
-    crawl_stadium(stadium_id, years=args.years, months=args.months, append=args.append)
+    crawl_stadium(
+        stadium_id, years=args.years, months=args.months, append=args.append, **crawl_options
+    )
 
 
 if __name__ == "__main__":
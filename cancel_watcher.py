@@ -0,0 +1,149 @@
+"""
+KBO 당일 경기 취소 실시간 감시기
+================================
+오늘 경기 일정을 주기적으로 조회하여 취소(우천취소 등)가 발표되면 즉시
+데이터셋 저장소(all_games/cancelled)에 반영합니다. cancel_crawler.py를 다시
+실행하지 않아도 실제 취소 결과(정답 레이블)가 바로 쌓입니다.
+
+- 폴링당 월별 일정 요청 1회 (HTTP), 내용이 바뀌지 않았으면 파싱 생략
+- 백엔드(--api-url)의 오늘 최대 예측 취소 확률이 높으면 짧은 주기로 조회
+- 감시 로직/이벤트 스트림은 backend/shared/cancel_watch.py (백엔드와 공통)
+
+실행: python cancel_watcher.py
+      python cancel_watcher.py --once                          # 한 번만 조회
+      python cancel_watcher.py --api-url http://localhost:8600 # 예측 확률로 주기 조정
+"""
+
+import argparse
+import logging
+import threading
+
+import pandas as pd
+import requests
+
+from backend.shared.cancel_watch import AdaptivePollInterval, CancellationWatcher, EventStream
+from cancel_crawler import build_stadium_lookup
+from dataset_store import delete_rows, upsert_dataset
+from kbo_schedule_api import ScheduleClient
+from schedule_parser import parse_schedule_html
+from stadium_config import STADIUMS, get_outdoor_stadiums
+
+
+class StoreSink:
+    """취소 이벤트를 데이터셋 저장소에 기록하는 구독자"""
+
+    def __init__(self):
+        # 최근 파싱한 경기 전체 정보 (이벤트에는 키/상태만 있으므로 행 전체를 보관)
+        self.latest_games = {}
+
+    def remember(self, games):
+        self.latest_games = {
+            (g["stadium_id"], g["date"], g["home"], g["away"]): g for g in games
+        }
+
+    def __call__(self, event):
+        game = self.latest_games.get((event.stadium_id, event.date, event.home, event.away))
+        if game is None:
+            return
+
+        df = pd.DataFrame([game])
+        upsert_dataset(df, event.stadium_id, "all_games")
+        if event.cancelled:
+            upsert_dataset(df, event.stadium_id, "cancelled")
+        else:
+            # 취소 번복: 취소 데이터셋에서 해당 경기 삭제
+            delete_rows(df, event.stadium_id, "cancelled")
+
+        status = f"취소 - {event.reason}" if event.cancelled else f"상태 변경 - {event.reason}"
+        print(
+            f"[{event.detected_at}] {STADIUMS[event.stadium_id]['name']} | "
+            f"{event.away} vs {event.home} | {status} (저장 완료)"
+        )
+
+
+def make_parse_games(stadium_ids, sink):
+    """오늘 일정 페이지 파서 (구장 배정 포함)"""
+    match_stadium = build_stadium_lookup(stadium_ids)
+
+    def parse_games(html, day):
+        games = []
+        for game in parse_schedule_html(html, day.year):
+            stadium_id = match_stadium(game.stadium)
+            if stadium_id is not None:
+                games.append({**game.to_dict(), "stadium_id": stadium_id})
+        sink.remember(games)
+        return games
+
+    return parse_games
+
+
+def make_probability_source(api_url):
+    """백엔드 실시간 감시 상태의 오늘 최대 예측 취소 확률"""
+
+    def probability_source():
+        response = requests.get(f"{api_url.rstrip('/')}/api/live/status", timeout=5)
+        response.raise_for_status()
+        return response.json().get("max_probability")
+
+    return probability_source
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="KBO 당일 경기 취소 실시간 감시기",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+예시:
+  python cancel_watcher.py
+  python cancel_watcher.py --once
+  python cancel_watcher.py --api-url http://localhost:8600
+  python cancel_watcher.py --base-interval 600 --fast-interval 60
+        """,
+    )
+    parser.add_argument("--once", action="store_true", help="한 번만 조회 후 종료")
+    parser.add_argument("--api-url", type=str, default=None, help="예측 확률 조회용 백엔드 주소")
+    parser.add_argument("--base-interval", type=float, default=300.0, help="기본 조회 주기 (초)")
+    parser.add_argument("--fast-interval", type=float, default=60.0, help="취소 가능성 높을 때 주기 (초)")
+    parser.add_argument("--idle-interval", type=float, default=1800.0, help="경기 시간대 밖 주기 (초)")
+    parser.add_argument("--threshold", type=float, default=0.5, help="짧은 주기 전환 예측 확률 (기본: 0.5)")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(message)s", datefmt="%H:%M:%S")
+
+    stream = EventStream()
+    sink = StoreSink()
+    stream.subscribe(sink)
+
+    client = ScheduleClient(request_interval=0)
+    watcher = CancellationWatcher(
+        fetch_page=lambda day: client.fetch_table_html(day.year, day.month),
+        parse_games=make_parse_games(get_outdoor_stadiums(), sink),
+        stream=stream,
+        interval=AdaptivePollInterval(
+            base=args.base_interval,
+            fast=args.fast_interval,
+            idle=args.idle_interval,
+            threshold=args.threshold,
+        ),
+        probability_source=make_probability_source(args.api_url) if args.api_url else None,
+    )
+
+    print("=" * 60)
+    print("KBO 당일 경기 취소 감시 시작 (Ctrl+C로 종료)")
+    print("=" * 60)
+
+    try:
+        if args.once:
+            events = watcher.poll_once()
+            print(f"오늘 경기 {watcher.status()['games_today']}개, 상태 변경 {len(events)}건")
+            return
+        watcher.run(threading.Event())
+    except KeyboardInterrupt:
+        status = watcher.status()
+        print(f"\n감시 종료: 조회 {status['polls']}회 (변경 없음 {status['unchanged_polls']}회)")
+    finally:
+        client.close()
+
+
+if __name__ == "__main__":
+    main()
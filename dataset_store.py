@@ -0,0 +1,628 @@
+"""
+KBO 구장별 데이터셋 저장소 (타입 지정 컬럼형 포맷)
+=================================================
+구장별 경기/날씨 데이터를 명시적 스키마의 Parquet 파일로 저장하고 읽습니다.
+
+- 구장/팀/취소사유 등: category
+- date: datetime64
+- 날씨 컬럼: float32
+- 필요한 컬럼만 읽기 (columns=...)
+- Parquet 데이터가 없으면 기존 CSV를 읽어 스키마를 적용 (하위 호환)
+
+저장 구조 (구장/연/월 파티션):
+    data/store/<kind>/stadium_id=<id>/year=<YYYY>/month=<M>/part-0.parquet
+
+- upsert_dataset: 신규 행이 속한 파티션만 읽어 키(date, home, away) 기준으로 병합 후
+  임시 파일 → os.replace로 원자적 교체 (나머지 파티션은 건드리지 않음)
+- replace_partitions: 지정한 (연, 월) 파티션만 교체 (나머지 파티션은 유지)
+- delete_rows: 키(date, home, away)에 해당하는 행만 삭제 (취소 번복 등)
+- load_dataset: 모든 파티션을 합친 중복 제거된 뷰 반환
+
+사용법:
+    from dataset_store import load_dataset, save_dataset, upsert_dataset
+
+    df = load_dataset("jamsil", "with_weather", columns=["date", "reason", "pre_game_precip"])
+    save_dataset(df, "jamsil", "with_weather")      # 전체 교체
+    upsert_dataset(df_new, "jamsil", "all_games")  # 변경된 파티션만 갱신
+
+설치: pip install pyarrow (미설치 시 CSV로 동작)
+"""
+
+import os
+
+import pandas as pd
+
+try:
+    import pyarrow  # noqa: F401
+    PARQUET_AVAILABLE = True
+except ImportError:
+    PARQUET_AVAILABLE = False
+
+from stadium_config import DATA_DIR, get_data_paths
+
+# 파티션 저장소 루트
+STORE_DIR = DATA_DIR / "store"
+
+PARTITION_FILE = "part-0.parquet"
+
+
+# ============================================
+# 스키마 정의
+# ============================================
+# 데이터셋 종류 (get_data_paths 키와 동일)
+DATASET_KINDS = ("all_games", "cancelled", "with_weather")
+
+# 중복 판단 키 (날짜 + 홈팀 + 원정팀)
+KEY_COLUMNS = ["date", "home", "away"]
+
+CATEGORY_COLUMNS = ["day", "stadium", "stadium_id", "home", "away", "reason"]
+STRING_COLUMNS = ["time", "note"]
+BOOL_COLUMNS = ["cancelled"]
+DATETIME_COLUMNS = ["date"]
+
+WEATHER_COLUMNS = [
+    "daily_temp_max",
+    "daily_temp_min",
+    "daily_temp_mean",
+    "daily_precip_sum",
+    "daily_rain_sum",
+    "daily_precip_hours",
+    "daily_wind_max",
+    "daily_wind_gust_max",
+    "pre_game_precip",
+    "pre_game_temp",
+    "pre_game_humidity",
+    "pre_game_wind",
+    "prev_day_precip",
+]
+
+
+def apply_schema(df):
+    """
+    데이터프레임에 명시적 스키마 적용
+
+    존재하는 컬럼에만 적용하며, 알 수 없는 컬럼은 그대로 둡니다.
+    """
+    df = df.copy()
+    for col in DATETIME_COLUMNS:
+        if col in df.columns:
+            df[col] = pd.to_datetime(df[col])
+    for col in BOOL_COLUMNS:
+        if col in df.columns:
+            df[col] = df[col].fillna(False).astype(bool)
+    for col in STRING_COLUMNS:
+        if col in df.columns:
+            df[col] = df[col].astype("string")
+    for col in CATEGORY_COLUMNS:
+        if col in df.columns:
+            df[col] = df[col].astype("string").astype("category")
+    for col in WEATHER_COLUMNS:
+        if col in df.columns:
+            df[col] = pd.to_numeric(df[col], errors="coerce").astype("float32")
+    return df
+
+
+# ============================================
+# 경로
+# ============================================
+def _check_kind(kind):
+    if kind not in DATASET_KINDS:
+        raise ValueError(f"지원하지 않는 데이터셋: {kind}. 가능한 값: {', '.join(DATASET_KINDS)}")
+
+
+def get_dataset_dir(stadium_id, kind):
+    """구장 데이터셋 파티션 디렉토리 (data/store/<kind>/stadium_id=<id>)"""
+    _check_kind(kind)
+    return STORE_DIR / kind / f"stadium_id={stadium_id}"
+
+
+def get_partition_path(stadium_id, kind, year, month):
+    """파티션 파일 경로"""
+    return get_dataset_dir(stadium_id, kind) / f"year={year}" / f"month={month}" / PARTITION_FILE
+
+
+def get_legacy_csv_path(stadium_id, kind):
+    """기존 CSV 경로 (data/<stadium>/<kind>.csv)"""
+    _check_kind(kind)
+    return get_data_paths(stadium_id)[kind]
+
+
+def _partition_files(stadium_id, kind):
+    return sorted(get_dataset_dir(stadium_id, kind).glob(f"year=*/month=*/{PARTITION_FILE}"))
+
+
+def _has_partitions(stadium_id, kind):
+    return PARQUET_AVAILABLE and any(_partition_files(stadium_id, kind))
+
+
+def dataset_exists(stadium_id, kind):
+    """데이터셋 존재 여부 (파티션 또는 CSV)"""
+    return _has_partitions(stadium_id, kind) or get_legacy_csv_path(stadium_id, kind).exists()
+
+
+def _atomic_write(df, path, writer):
+    """임시 파일에 쓴 뒤 os.replace로 교체 (쓰기 중단 시 기존 파일 보존)"""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    try:
+        writer(df, tmp_path)
+        os.replace(tmp_path, path)
+    finally:
+        if tmp_path.exists():
+            tmp_path.unlink()
+
+
+def _write_parquet(df, path):
+    # category는 파일마다 딕셔너리 인덱스 폭(int8 등)이 달라 구장을 합쳐 읽을 때 넘칠 수 있으므로
+    # 일반 문자열로 저장하고 읽을 때 apply_schema로 category 변환
+    df.astype({col: "string" for col in CATEGORY_COLUMNS if col in df.columns}).to_parquet(path, index=False)
+
+
+def _write_csv(df, path):
+    df.to_csv(path, index=False, encoding="utf-8-sig")
+
+
+# ============================================
+# 읽기 / 쓰기
+# ============================================
+def _read_partition(path):
+    return apply_schema(pd.read_parquet(path))
+
+
+def _open_partitions(path, partitioning):
+    """
+    파티션 디렉토리를 pyarrow 데이터셋으로 열기
+
+    이전에 category(딕셔너리)로 저장된 파티션도 읽을 수 있도록 딕셔너리 컬럼은
+    문자열로 읽습니다 (스키마는 첫 파일 기준이라 딕셔너리를 합치면 인덱스가 넘칠 수 있음).
+    """
+    import pyarrow as pa
+    import pyarrow.dataset as ds
+
+    dataset = ds.dataset(path, format="parquet", partitioning=partitioning)
+    schema = pa.schema(
+        [
+            pa.field(field.name, field.type.value_type) if pa.types.is_dictionary(field.type) else field
+            for field in dataset.schema
+        ]
+    )
+    return ds.dataset(path, format="parquet", partitioning=partitioning, schema=schema)
+
+
+def load_dataset(stadium_id, kind, columns=None):
+    """
+    구장 데이터셋 로드 (모든 파티션을 합친 중복 제거 뷰)
+
+    Args:
+        stadium_id: 구장 ID
+        kind: "all_games" | "cancelled" | "with_weather"
+        columns: 읽을 컬럼 리스트 (None이면 전체, 없는 컬럼은 무시)
+
+    Returns:
+        DataFrame: 스키마가 적용된 데이터, 날짜순 정렬 (데이터가 없으면 None)
+    """
+    if _has_partitions(stadium_id, kind):
+        dataset = _open_partitions(get_dataset_dir(stadium_id, kind), "hive")
+        file_columns = [
+            name for name in dataset.schema.names if name not in ("year", "month")
+        ]
+        read_columns = file_columns if columns is None else [c for c in columns if c in file_columns]
+        df = apply_schema(dataset.to_table(columns=read_columns).to_pandas())
+        if columns is None or "stadium_id" in columns:
+            df["stadium_id"] = pd.Categorical([stadium_id] * len(df))
+        if "date" in df.columns:
+            df = df.sort_values("date", kind="stable").reset_index(drop=True)
+        return df
+
+    csv_path = get_legacy_csv_path(stadium_id, kind)
+    if csv_path.exists():
+        usecols = (lambda c: c in columns) if columns is not None else None
+        df = pd.read_csv(csv_path, usecols=usecols, encoding="utf-8-sig")
+        return apply_schema(df)
+
+    return None
+
+
+def _split_partitions(df):
+    """(연, 월)별 파티션 분할"""
+    dates = pd.to_datetime(df["date"])
+    return df.groupby([dates.dt.year, dates.dt.month], sort=True)
+
+
+def save_dataset(df, stadium_id, kind):
+    """
+    구장 데이터셋 전체 교체 저장 (Parquet 파티션, pyarrow 미설치 시 CSV)
+
+    새 데이터에 없는 기존 파티션은 삭제합니다.
+
+    Returns:
+        Path: 저장 위치 (파티션 디렉토리 또는 CSV 경로)
+    """
+    df = apply_schema(df.assign(stadium_id=stadium_id))
+
+    if not PARQUET_AVAILABLE:
+        csv_path = get_legacy_csv_path(stadium_id, kind)
+        _atomic_write(df, csv_path, _write_csv)
+        return csv_path
+
+    written = set()
+    for (year, month), part in _split_partitions(df):
+        path = get_partition_path(stadium_id, kind, year, month)
+        _atomic_write(
+            part.drop(columns="stadium_id").reset_index(drop=True), path, _write_parquet
+        )
+        written.add(path)
+
+    for path in _partition_files(stadium_id, kind):
+        if path not in written:
+            path.unlink()
+
+    return get_dataset_dir(stadium_id, kind)
+
+
+def upsert_dataset(df_new, stadium_id, kind):
+    """
+    키(date, home, away) 기준 upsert
+
+    신규 행이 속한 (연, 월) 파티션만 읽어 병합한 뒤 원자적으로 교체합니다.
+    pyarrow 미설치 시 CSV 전체를 병합하여 다시 씁니다.
+
+    Returns:
+        dict: {"inserted": 신규 키 수, "updated": 갱신 키 수, "partitions": 갱신 파티션 수}
+    """
+    df_new = apply_schema(df_new.assign(stadium_id=stadium_id))
+    stats = {"inserted": 0, "updated": 0, "partitions": 0}
+
+    if not PARQUET_AVAILABLE:
+        csv_path = get_legacy_csv_path(stadium_id, kind)
+        df_existing = load_dataset(stadium_id, kind)
+        if df_existing is None:
+            df_existing = df_new.iloc[:0]
+        _count_upserts(df_existing, df_new, stats)
+        _atomic_write(merge_games(df_existing, df_new), csv_path, _write_csv)
+        stats["partitions"] = 1
+        return stats
+
+    # 기존 CSV만 있는 경우 먼저 파티션으로 변환
+    if not _has_partitions(stadium_id, kind) and get_legacy_csv_path(stadium_id, kind).exists():
+        save_dataset(load_dataset(stadium_id, kind), stadium_id, kind)
+
+    for (year, month), part in _split_partitions(df_new):
+        path = get_partition_path(stadium_id, kind, year, month)
+        part = part.drop(columns="stadium_id")
+        if path.exists():
+            df_existing = _read_partition(path)
+            _count_upserts(df_existing, part, stats)
+            merged = merge_games(df_existing, part)
+        else:
+            stats["inserted"] += len(part.drop_duplicates(subset=KEY_COLUMNS))
+            merged = merge_games(part.iloc[:0], part)
+        _atomic_write(merged, path, _write_parquet)
+        stats["partitions"] += 1
+
+    return stats
+
+
+def replace_partitions(df, stadium_id, kind, units):
+    """
+    지정한 (연, 월) 파티션만 교체 (재파싱 등)
+
+    units에 속한 파티션은 df 내용으로 교체하고, df에 해당 월 행이 없으면 삭제합니다.
+    나머지 파티션은 건드리지 않습니다. pyarrow 미설치 시 CSV에서 해당 월 행만 교체합니다.
+
+    Args:
+        df: 새 데이터 (units 밖의 행은 무시, 비어 있으면 units 파티션 삭제)
+        units: [(연, 월)] 교체 대상
+
+    Returns:
+        dict: {"replaced": 교체 파티션 수, "removed": 삭제 파티션 수}
+    """
+    units = {(int(year), int(month)) for year, month in units}
+    stats = {"replaced": 0, "removed": 0}
+    parts = {}
+    if len(df):
+        df = apply_schema(df.assign(stadium_id=stadium_id))
+        parts = {
+            (int(year), int(month)): part
+            for (year, month), part in _split_partitions(df)
+            if (int(year), int(month)) in units
+        }
+
+    if not PARQUET_AVAILABLE:
+        df_existing = load_dataset(stadium_id, kind)
+        if df_existing is None and not parts:
+            return stats
+        if df_existing is not None:
+            dates = pd.to_datetime(df_existing["date"])
+            existing_units = pd.Series(list(zip(dates.dt.year, dates.dt.month)), index=df_existing.index)
+            in_units = existing_units.isin(units)
+            stats["removed"] = len(set(existing_units[in_units]) - set(parts))
+            df_existing = df_existing[~in_units]
+        df_new = pd.concat(parts.values(), ignore_index=True) if parts else df_existing.iloc[:0]
+        if df_existing is None:
+            df_existing = df_new.iloc[:0]
+        _atomic_write(merge_games(df_existing, df_new), get_legacy_csv_path(stadium_id, kind), _write_csv)
+        stats["replaced"] = len(parts)
+        return stats
+
+    # 기존 CSV만 있는 경우 먼저 파티션으로 변환
+    if not _has_partitions(stadium_id, kind) and get_legacy_csv_path(stadium_id, kind).exists():
+        save_dataset(load_dataset(stadium_id, kind), stadium_id, kind)
+
+    for year, month in sorted(units):
+        path = get_partition_path(stadium_id, kind, year, month)
+        if (year, month) in parts:
+            merged = merge_games(parts[(year, month)].iloc[:0], parts[(year, month)].drop(columns="stadium_id"))
+            _atomic_write(merged, path, _write_parquet)
+            stats["replaced"] += 1
+        elif path.exists():
+            path.unlink()
+            stats["removed"] += 1
+
+    return stats
+
+
+def delete_rows(df_keys, stadium_id, kind):
+    """
+    키(date, home, away) 기준 행 삭제 (취소 번복 등)
+
+    삭제 대상 행이 속한 (연, 월) 파티션만 다시 쓰고, 비게 된 파티션은 삭제합니다.
+    pyarrow 미설치 시 CSV 전체를 다시 씁니다.
+
+    Returns:
+        int: 삭제한 행 수
+    """
+    df_keys = apply_schema(df_keys[KEY_COLUMNS].assign(stadium_id=stadium_id))
+
+    def drop_keys(df_existing, df_delete):
+        existing_keys = pd.MultiIndex.from_frame(apply_schema(df_existing[KEY_COLUMNS]).astype(str))
+        delete_keys = pd.MultiIndex.from_frame(apply_schema(df_delete[KEY_COLUMNS]).astype(str))
+        return df_existing[~existing_keys.isin(delete_keys)]
+
+    if not PARQUET_AVAILABLE:
+        df_existing = load_dataset(stadium_id, kind)
+        if df_existing is None:
+            return 0
+        df_kept = drop_keys(df_existing, df_keys)
+        if len(df_kept) < len(df_existing):
+            _atomic_write(df_kept, get_legacy_csv_path(stadium_id, kind), _write_csv)
+        return len(df_existing) - len(df_kept)
+
+    # 기존 CSV만 있는 경우 먼저 파티션으로 변환
+    if not _has_partitions(stadium_id, kind) and get_legacy_csv_path(stadium_id, kind).exists():
+        save_dataset(load_dataset(stadium_id, kind), stadium_id, kind)
+
+    deleted = 0
+    for (year, month), part in _split_partitions(df_keys):
+        path = get_partition_path(stadium_id, kind, year, month)
+        if not path.exists():
+            continue
+        df_existing = _read_partition(path)
+        df_kept = drop_keys(df_existing, part)
+        if len(df_kept) == len(df_existing):
+            continue
+        deleted += len(df_existing) - len(df_kept)
+        if len(df_kept):
+            _atomic_write(df_kept.reset_index(drop=True), path, _write_parquet)
+        else:
+            path.unlink()
+
+    return deleted
+
+
+def _count_upserts(df_existing, df_new, stats):
+    """신규/갱신 키 수 집계"""
+    existing_keys = pd.MultiIndex.from_frame(apply_schema(df_existing[KEY_COLUMNS]).astype(str))
+    new_keys = pd.MultiIndex.from_frame(
+        apply_schema(df_new[KEY_COLUMNS]).drop_duplicates().astype(str)
+    )
+    updated = int(new_keys.isin(existing_keys).sum())
+    stats["updated"] += updated
+    stats["inserted"] += len(new_keys) - updated
+
+
+def merge_games(df_existing, df_new):
+    """
+    기존 데이터와 신규 데이터 병합
+
+    날짜 + 홈팀 + 원정팀 기준으로 중복을 제거(신규 우선)하고 날짜순 정렬합니다.
+    """
+    df = pd.concat([apply_schema(df_existing), apply_schema(df_new)], ignore_index=True)
+    df = df.drop_duplicates(subset=KEY_COLUMNS, keep="last")
+    return apply_schema(df.sort_values("date", kind="stable").reset_index(drop=True))
+
+
+def migrate_stadium_to_columnar(stadium_id):
+    """
+    구장의 기존 CSV 데이터셋을 Parquet 파티션으로 변환
+
+    Returns:
+        dict: {kind: 파티션 디렉토리}
+    """
+    if not PARQUET_AVAILABLE:
+        raise RuntimeError("pyarrow가 설치되지 않았습니다. 설치: pip install pyarrow")
+
+    converted = {}
+    for kind in DATASET_KINDS:
+        csv_path = get_legacy_csv_path(stadium_id, kind)
+        if not csv_path.exists():
+            continue
+        df = pd.read_csv(csv_path, encoding="utf-8-sig")
+        converted[kind] = save_dataset(df, stadium_id, kind)
+    return converted
+
+
+# ============================================
+# 전 구장 통합 쿼리
+# ============================================
+_FILTER_OPS = {
+    "==": lambda s, v: s == v,
+    "=": lambda s, v: s == v,
+    "!=": lambda s, v: s != v,
+    ">": lambda s, v: s > v,
+    ">=": lambda s, v: s >= v,
+    "<": lambda s, v: s < v,
+    "<=": lambda s, v: s <= v,
+    "in": lambda s, v: s.isin(v),
+    "not in": lambda s, v: ~s.isin(v),
+}
+
+
+def _filters_to_mask(df, filters):
+    """(컬럼, 연산자, 값) 필터 리스트를 pandas 마스크로 변환 (AND)"""
+    mask = pd.Series(True, index=df.index)
+    for col, op, value in filters:
+        mask &= _FILTER_OPS[op](df[col], value)
+    return mask
+
+
+def _query_partitions(kind, columns, filters, exclude=()):
+    """data/store/<kind> 전체를 하나의 hive 파티션 데이터셋으로 스캔 (exclude 구장 제외)"""
+    import pyarrow as pa
+    import pyarrow.dataset as ds
+    import pyarrow.parquet as pq
+
+    partitioning = ds.partitioning(
+        pa.schema([("stadium_id", pa.string()), ("year", pa.int32()), ("month", pa.int32())]),
+        flavor="hive",
+    )
+    dataset = _open_partitions(STORE_DIR / kind, partitioning)
+    read_columns = None
+    if columns is not None:
+        read_columns = [c for c in columns if c in dataset.schema.names]
+    if exclude:
+        filters = filters + [("stadium_id", "not in", list(exclude))]
+    expression = pq.filters_to_expression(filters) if filters else None
+    return dataset.to_table(columns=read_columns, filter=expression).to_pandas()
+
+
+def _query_csv(kind, columns, filters, stadium_ids):
+    """구장별 CSV를 읽어 pandas로 필터링 (파티션 저장소가 없는 구장)"""
+    frames = []
+    for stadium_id in stadium_ids:
+        df = load_dataset(stadium_id, kind)
+        if df is None:
+            continue
+        dates = pd.to_datetime(df["date"])
+        frames.append(df.assign(stadium_id=stadium_id, year=dates.dt.year, month=dates.dt.month))
+    if not frames:
+        return None
+    df = pd.concat(frames, ignore_index=True)
+    if filters:
+        df = df[_filters_to_mask(df, filters)]
+    if columns is not None:
+        df = df[[c for c in columns if c in df.columns]]
+    return df
+
+
+def query_dataset(kind, columns=None, filters=None, stadiums=None, years=None, months=None):
+    """
+    전 구장 통합 데이터셋 쿼리 (필터/컬럼 푸시다운)
+
+    data/store/<kind> 전체를 하나의 hive 파티션 데이터셋으로 스캔합니다.
+    stadiums/years/months는 파티션 단위로 가지치기되고,
+    filters는 Parquet row group 통계로 푸시다운됩니다.
+
+    예: 전 구장 7월 경기 중 경기 전 강수량 5mm 초과
+        query_dataset("with_weather", columns=["date", "stadium_id", "reason"],
+                      filters=[("pre_game_precip", ">", 5)], months=[7])
+
+    Args:
+        kind: "all_games" | "cancelled" | "with_weather"
+        columns: 읽을 컬럼 리스트 (None이면 전체, stadium_id/year/month 사용 가능)
+        filters: [(컬럼, 연산자, 값), ...] AND 조건 (연산자: ==, !=, >, >=, <, <=, in, not in)
+        stadiums: 구장 ID 리스트 (None이면 전체)
+        years: 연도 리스트
+        months: 월 리스트
+
+    Returns:
+        DataFrame: 쿼리 결과 (구장, 날짜순 정렬)
+    """
+    _check_kind(kind)
+    filters = list(filters or [])
+    if stadiums is not None:
+        filters.append(("stadium_id", "in", list(stadiums)))
+    if years is not None:
+        filters.append(("year", "in", [int(y) for y in years]))
+    if months is not None:
+        filters.append(("month", "in", [int(m) for m in months]))
+
+    from stadium_config import get_all_stadium_ids
+
+    # 파티션이 있는 구장은 Parquet 스캔, 아직 CSV만 있는 구장(부분 변환 상태)은 CSV로 읽음
+    stadium_ids = list(stadiums) if stadiums is not None else get_all_stadium_ids()
+    csv_stadiums = [stadium_id for stadium_id in stadium_ids if not _has_partitions(stadium_id, kind)]
+
+    frames = []
+    if len(csv_stadiums) < len(stadium_ids):
+        frames.append(_query_partitions(kind, columns, filters, exclude=csv_stadiums))
+    if csv_stadiums:
+        frames.append(_query_csv(kind, columns, filters, csv_stadiums))
+    frames = [frame for frame in frames if frame is not None]
+    if not frames:
+        return pd.DataFrame(columns=columns or [])
+    df = apply_schema(pd.concat(frames, ignore_index=True) if len(frames) > 1 else frames[0])
+
+    sort_cols = [c for c in ("stadium_id", "date") if c in df.columns]
+    if sort_cols:
+        df = df.sort_values(sort_cols, kind="stable")
+    return df.reset_index(drop=True)
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description="KBO 데이터셋 통합 쿼리",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+예시:
+  # 전 구장 7월 경기 중 경기 전 강수량 5mm 초과
+  python dataset_store.py --month 7 --where pre_game_precip ">" 5
+
+  # 잠실/사직 우천취소 경기
+  python dataset_store.py --stadium jamsil busan --where reason == 우천취소
+        """,
+    )
+    parser.add_argument("--kind", default="with_weather", choices=DATASET_KINDS, help="데이터셋 종류")
+    parser.add_argument("--stadium", "-s", nargs="+", default=None, help="구장 ID")
+    parser.add_argument("--year", "-y", type=int, nargs="+", default=None, help="연도")
+    parser.add_argument("--month", "-m", type=int, nargs="+", default=None, help="월")
+    parser.add_argument(
+        "--where",
+        nargs=3,
+        action="append",
+        default=[],
+        metavar=("COLUMN", "OP", "VALUE"),
+        help="필터 조건 (반복 가능, AND)",
+    )
+    parser.add_argument(
+        "--columns",
+        nargs="+",
+        default=["date", "stadium_id", "home", "away", "reason", "pre_game_precip", "daily_precip_sum"],
+        help="출력 컬럼",
+    )
+    args = parser.parse_args()
+
+    filters = []
+    for col, op, value in args.where:
+        try:
+            value = float(value)
+        except ValueError:
+            pass
+        filters.append((col, op, value))
+
+    df = query_dataset(
+        args.kind,
+        columns=args.columns,
+        filters=filters,
+        stadiums=args.stadium,
+        years=args.year,
+        months=args.month,
+    )
+    print(df.to_string(index=False))
+    print(f"\n총 {len(df)}개")
+
+
+if __name__ == "__main__":
+    main()
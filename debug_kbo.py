@@ -1,19 +1,27 @@
 """
 KBO 페이지 구조 확인용 디버그 스크립트
+
+실행: python debug_kbo.py                      # 브라우저로 2024년 5월 페이지 확인
+      python debug_kbo.py --cached --year 2024 --month 5  # 페이지 캐시로 확인 (브라우저 없음)
 """
 
+import argparse
 import time
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait, Select
-from selenium.webdriver.support import expected_conditions as EC
-from webdriver_manager.chrome import ChromeDriverManager
 from bs4 import BeautifulSoup
 
+from kbo_schedule_api import REGULAR_SEASON_SERIES
+from schedule_cache import SchedulePageCache
+
+
+def debug_kbo_page(year=2024, month=5):
+    from selenium import webdriver
+    from selenium.webdriver.chrome.service import Service
+    from selenium.webdriver.chrome.options import Options
+    from selenium.webdriver.common.by import By
+    from selenium.webdriver.support.ui import WebDriverWait, Select
+    from selenium.webdriver.support import expected_conditions as EC
+    from webdriver_manager.chrome import ChromeDriverManager
 
-def debug_kbo_page():
     chrome_options = Options()
     # chrome_options.add_argument("--headless")  # 디버그용으로 브라우저 보이게
     chrome_options.add_argument("--no-sandbox")
@@ -29,17 +37,17 @@ def debug_kbo_page():
         driver.get(url)
         time.sleep(3)
         
-        # 2024년 5월로 이동 (우천취소 많았던 달)
-        print("\n2024년 5월로 이동...")
+        # 기본: 2024년 5월로 이동 (우천취소 많았던 달)
+        print(f"\n{year}년 {month}월로 이동...")
         
         year_dropdown = WebDriverWait(driver, 10).until(
             EC.presence_of_element_located((By.ID, "ddlYear"))
         )
-        Select(year_dropdown).select_by_value("2024")
+        Select(year_dropdown).select_by_value(str(year))
         time.sleep(1)
         
         month_dropdown = driver.find_element(By.ID, "ddlMonth")
-        Select(month_dropdown).select_by_value("05")
+        Select(month_dropdown).select_by_value(str(month).zfill(2))
         time.sleep(2)
         
         # 페이지 소스 저장
@@ -48,64 +56,13 @@ def debug_kbo_page():
             f.write(page_source)
         print("페이지 소스 저장: kbo_page_debug.html")
         
-        # BeautifulSoup으로 파싱
-        soup = BeautifulSoup(page_source, 'html.parser')
-        
-        # 테이블 찾기
-        print("\n=== 테이블 구조 확인 ===")
-        tables = soup.find_all('table')
-        print(f"테이블 개수: {len(tables)}")
+        # 일정 테이블은 크롤러와 같은 페이지 캐시에 저장
+        table = BeautifulSoup(page_source, 'html.parser').find('table', id='tblScheduleList')
+        if table:
+            digest = SchedulePageCache().put(REGULAR_SEASON_SERIES, year, month, str(table))
+            print(f"페이지 캐시 저장: {digest[:12]}")
         
-        for i, table in enumerate(tables):
-            classes = table.get('class', [])
-            print(f"  테이블 {i}: class={classes}")
-        
-        # tbl 클래스 테이블 확인
-        tbl = soup.find('table', class_='tbl')
-        if tbl:
-            print("\n=== tbl 클래스 테이블 발견 ===")
-            tbody = tbl.find('tbody')
-            if tbody:
-                rows = tbody.find_all('tr')
-                print(f"행 개수: {len(rows)}")
-                
-                # 처음 5개 행 출력
-                print("\n처음 5개 행:")
-                for i, row in enumerate(rows[:5]):
-                    print(f"\n--- Row {i} ---")
-                    cells = row.find_all('td')
-                    for j, cell in enumerate(cells):
-                        cell_class = cell.get('class', [])
-                        cell_text = cell.get_text(strip=True)[:50]
-                        print(f"  TD {j}: class={cell_class}, text='{cell_text}'")
-            else:
-                print("tbody 없음")
-        else:
-            print("\ntbl 클래스 테이블 없음")
-            
-            # 다른 테이블 구조 확인
-            print("\n=== 모든 테이블 내용 확인 ===")
-            for i, table in enumerate(tables[:3]):
-                print(f"\n테이블 {i} 내용:")
-                print(table.get_text()[:500])
-        
-        # 스케줄 관련 div 찾기
-        print("\n=== 스케줄 관련 요소 확인 ===")
-        schedule_divs = soup.find_all('div', class_=lambda x: x and 'schedule' in x.lower() if x else False)
-        print(f"schedule 관련 div: {len(schedule_divs)}")
-        
-        # 취소 관련 텍스트 검색
-        print("\n=== '취소' 텍스트 검색 ===")
-        page_text = soup.get_text()
-        if '취소' in page_text:
-            print("'취소' 텍스트 발견!")
-            # 취소가 포함된 부분 찾기
-            for elem in soup.find_all(string=lambda t: t and '취소' in t):
-                parent = elem.parent
-                print(f"  태그: {parent.name}, 클래스: {parent.get('class')}")
-                print(f"  내용: {elem.strip()[:100]}")
-        else:
-            print("'취소' 텍스트 없음")
+        inspect_page(page_source)
         
         input("\n브라우저 확인 후 Enter 누르세요...")
         
@@ -113,5 +70,92 @@ def debug_kbo_page():
         driver.quit()
 
 
+def debug_cached_page(year=2024, month=5):
+    """페이지 캐시의 일정 테이블 구조 확인 (브라우저 없음)"""
+    cached = SchedulePageCache().get(REGULAR_SEASON_SERIES, year, month)
+    if cached is None:
+        print(f"{year}년 {month}월 캐시된 페이지가 없습니다. 먼저 크롤링을 실행하세요.")
+        return
+    
+    page_source, meta = cached
+    print(f"캐시 페이지: {year}년 {month}월 (수집: {meta['fetched_at']}, sha256: {meta['sha256'][:12]})")
+    inspect_page(page_source)
+
+
+def inspect_page(page_source):
+    """페이지 HTML의 테이블/취소 텍스트 구조 출력"""
+    # BeautifulSoup으로 파싱
+    soup = BeautifulSoup(page_source, 'html.parser')
+    
+    # 테이블 찾기
+    print("\n=== 테이블 구조 확인 ===")
+    tables = soup.find_all('table')
+    print(f"테이블 개수: {len(tables)}")
+    
+    for i, table in enumerate(tables):
+        classes = table.get('class', [])
+        print(f"  테이블 {i}: class={classes}")
+    
+    # tbl 클래스 테이블 확인 (캐시 페이지는 일정 테이블만 저장됨)
+    tbl = soup.find('table', class_='tbl') or soup.find('table', id='tblScheduleList')
+    if tbl:
+        print("\n=== tbl 클래스 테이블 발견 ===")
+        tbody = tbl.find('tbody')
+        if tbody:
+            rows = tbody.find_all('tr')
+            print(f"행 개수: {len(rows)}")
+            
+            # 처음 5개 행 출력
+            print("\n처음 5개 행:")
+            for i, row in enumerate(rows[:5]):
+                print(f"\n--- Row {i} ---")
+                cells = row.find_all('td')
+                for j, cell in enumerate(cells):
+                    cell_class = cell.get('class', [])
+                    cell_text = cell.get_text(strip=True)[:50]
+                    print(f"  TD {j}: class={cell_class}, text='{cell_text}'")
+        else:
+            print("tbody 없음")
+    else:
+        print("\ntbl 클래스 테이블 없음")
+        
+        # 다른 테이블 구조 확인
+        print("\n=== 모든 테이블 내용 확인 ===")
+        for i, table in enumerate(tables[:3]):
+            print(f"\n테이블 {i} 내용:")
+            print(table.get_text()[:500])
+    
+    # 스케줄 관련 div 찾기
+    print("\n=== 스케줄 관련 요소 확인 ===")
+    schedule_divs = soup.find_all('div', class_=lambda x: x and 'schedule' in x.lower() if x else False)
+    print(f"schedule 관련 div: {len(schedule_divs)}")
+    
+    # 취소 관련 텍스트 검색
+    print("\n=== '취소' 텍스트 검색 ===")
+    page_text = soup.get_text()
+    if '취소' in page_text:
+        print("'취소' 텍스트 발견!")
+        # 취소가 포함된 부분 찾기
+        for elem in soup.find_all(string=lambda t: t and '취소' in t):
+            parent = elem.parent
+            print(f"  태그: {parent.name}, 클래스: {parent.get('class')}")
+            print(f"  내용: {elem.strip()[:100]}")
+    else:
+        print("'취소' 텍스트 없음")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="KBO 페이지 구조 확인")
+    parser.add_argument("--year", "-y", type=int, default=2024, help="연도 (기본: 2024)")
+    parser.add_argument("--month", "-m", type=int, default=5, help="월 (기본: 5)")
+    parser.add_argument("--cached", action="store_true", help="페이지 캐시로 확인 (브라우저 없음)")
+    args = parser.parse_args()
+
+    if args.cached:
+        debug_cached_page(args.year, args.month)
+    else:
+        debug_kbo_page(args.year, args.month)
+
+
 if __name__ == "__main__":
-    debug_kbo_page()
+    main()
@@ -0,0 +1,314 @@
+"""
+구장별 경량 서빙 모델 증류 (Knowledge Distillation)
+====================================================
+학습된 구장별 모델(교사)의 취소 확률을 작은 LightGBM(학생: 얕은 트리 몇 개,
+--monotone 시 강수 관련 피처 단조 증가 제약)이 따라 하도록 학습합니다.
+
+- 학습 데이터: 실제 경기 + 날씨 피처 공간의 합성 샘플
+  (피처별 분포에서 독립 추출 + 실제 경기에 잡음 추가)
+- 목표: 교사 확률 (소프트 레이블 → 양성/음성 행을 확률/1-확률 가중치로 학습)
+- 정확도 예산: 실제 경기에서 교사와의 평균/최대 확률 차이가 예산 이내인 가장 작은
+  학생 모델을 저장합니다 (예산 초과 시 저장하지 않음).
+- 경량 조건: 학생 모델은 교사보다 파일이 작고 단일 행 추론이 빨라야 합니다
+  (예산을 만족해도 교사보다 크거나 느리면 저장하지 않음).
+- 산출물: models/kbo_<구장>_student.pkl (충실도/추론 지연, 교사 파일 해시 포함)
+
+백엔드는 STUDENT_MODEL_STADIUMS 환경 변수로 구장별로 학생 모델을 선택하며,
+증류 이후 교사 모델이 다시 학습되어 해시가 다르면 교사 모델을 사용합니다.
+
+실행: python distill_model.py --stadium jamsil
+      python distill_model.py --all
+      python distill_model.py --all --mean-gap 0.01 --max-gap 0.2
+"""
+
+import argparse
+import io
+import pickle
+from contextlib import redirect_stdout
+
+import numpy as np
+import pandas as pd
+from lightgbm import LGBMClassifier
+
+from dataset_store import WEATHER_COLUMNS, dataset_exists, query_dataset
+from kbo_rain_model import TRAINING_COLUMNS, measure_inference_cost, preprocess_data
+from stadium_config import STADIUMS, get_data_paths, get_outdoor_stadiums
+from training_cache import hash_file
+
+# 학생 모델 후보 (트리 수, 최대 깊이) - 작은 것부터 예산을 만족하는 첫 모델 사용
+STUDENT_SIZES = ((10, 2), (20, 3), (40, 4), (60, 4), (80, 4), (80, 5))
+STUDENT_LEARNING_RATE = 0.3
+
+# 합성 샘플 수 (절반은 피처별 독립 추출, 절반은 실제 경기 + 잡음)
+N_SYNTHETIC = 20000
+
+# 정확도 예산 (실제 경기 기준 교사-학생 취소 확률 차이)
+MEAN_GAP_BUDGET = 0.02
+MAX_GAP_BUDGET = 0.3
+
+# 값이 클수록 취소 확률이 낮아질 수 없는 피처 (단조 증가 제약)
+MONOTONE_INCREASING = {
+    "daily_precip_sum",
+    "daily_precip_hours",
+    "pre_game_precip",
+    "prev_day_precip",
+    "precip_intensity",
+    "humidity_precip_interaction",
+    "cumulative_precip_2days",
+    "ground_condition_score",
+}
+
+# 음수가 될 수 없는 날씨 컬럼 (기온 제외)
+NON_NEGATIVE_COLUMNS = [col for col in WEATHER_COLUMNS if "temp" not in col]
+
+
+def synthesize_games(df, n_samples, seed=42):
+    """
+    날씨 피처 공간의 합성 경기 생성 (원본 컬럼 형식, preprocess_data로 피처 계산)
+
+    - 절반: 컬럼별 실제 분포에서 독립 추출 + 범위 5% 균등 잡음 (실제로 드문 조합까지 촘촘히)
+    - 절반: 실제 경기 + 컬럼 표준편차 10% 가우시안 잡음 (실제 조합 주변)
+    """
+    rng = np.random.default_rng(seed)
+    n_marginal = n_samples // 2
+    n_jitter = n_samples - n_marginal
+
+    weather = df[WEATHER_COLUMNS].astype(float).fillna(0)
+    value_range = (weather.max() - weather.min()).replace(0, 1)
+
+    marginal = pd.DataFrame(
+        {
+            col: rng.choice(weather[col].to_numpy(), n_marginal)
+            + rng.uniform(-0.05, 0.05, n_marginal) * value_range[col]
+            for col in WEATHER_COLUMNS
+        }
+    )
+    base = weather.iloc[rng.integers(0, len(weather), n_jitter)].reset_index(drop=True)
+    jitter = base + rng.normal(0, 1, base.shape) * (weather.std().fillna(0) * 0.1).to_numpy()
+
+    synthetic = pd.concat([marginal, jitter], ignore_index=True)
+    synthetic[NON_NEGATIVE_COLUMNS] = synthetic[NON_NEGATIVE_COLUMNS].clip(lower=0)
+    synthetic["pre_game_humidity"] = synthetic["pre_game_humidity"].clip(upper=100)
+    synthetic["daily_precip_hours"] = synthetic["daily_precip_hours"].clip(upper=24)
+
+    # 날짜(월/요일)와 경기 시간은 실제 경기에서 추출
+    synthetic["date"] = df["date"].to_numpy()[rng.integers(0, len(df), n_samples)]
+    synthetic["time"] = df["time"].to_numpy()[rng.integers(0, len(df), n_samples)]
+    synthetic["reason"] = "정상진행"
+    synthetic["cancelled"] = False
+    return synthetic
+
+
+def fit_student(X, teacher_prob, n_estimators, max_depth, feature_cols, monotone=False):
+    """
+    교사 확률을 소프트 레이블로 학생 모델 학습
+
+    각 행을 양성(가중치 p)/음성(가중치 1-p) 두 행으로 복제하여 이진 log loss로 학습하면
+    소프트 레이블 교차 엔트로피와 같으므로, 학생도 predict_proba를 그대로 지원합니다.
+    """
+    X_double = pd.concat([X, X], ignore_index=True)
+    y_double = np.r_[np.ones(len(X), dtype=int), np.zeros(len(X), dtype=int)]
+    weights = np.r_[teacher_prob, 1 - teacher_prob]
+
+    student = LGBMClassifier(
+        n_estimators=n_estimators,
+        max_depth=max_depth,
+        num_leaves=2 ** max_depth,
+        learning_rate=STUDENT_LEARNING_RATE,
+        monotone_constraints=[1 if col in MONOTONE_INCREASING else 0 for col in feature_cols] if monotone else None,
+        random_state=42,
+        verbose=-1,
+    )
+    student.fit(X_double, y_double, sample_weight=weights)
+    return student
+
+
+def fidelity(teacher_prob, student_prob):
+    """교사-학생 취소 확률 차이와 결정(0.5 기준) 일치율"""
+    gap = np.abs(teacher_prob - student_prob)
+    return {
+        "max_gap": float(gap.max()),
+        "mean_gap": float(gap.mean()),
+        "agreement": float(np.mean((teacher_prob >= 0.5) == (student_prob >= 0.5))),
+    }
+
+
+def distill_stadium(
+    stadium_id,
+    mean_gap_budget=MEAN_GAP_BUDGET,
+    max_gap_budget=MAX_GAP_BUDGET,
+    n_synthetic=N_SYNTHETIC,
+    monotone=False,
+):
+    """
+    구장 모델을 학생 모델로 증류
+
+    Returns:
+        dict: 저장된 학생 모델 정보 (교사 모델이 없거나 예산을 만족하는 학생이 없으면 None)
+    """
+    stadium_name = STADIUMS[stadium_id]["name"]
+    paths = get_data_paths(stadium_id)
+
+    print("\n" + "=" * 60)
+    print(f"경량 모델 증류 - {stadium_name}")
+    print("=" * 60)
+
+    if not paths["model"].exists() or not dataset_exists(stadium_id, "with_weather"):
+        print(f"[스킵] 교사 모델 또는 날씨 포함 데이터가 없습니다: {paths['model']}")
+        return None
+
+    with open(paths["model"], "rb") as f:
+        teacher_data = pickle.load(f)
+    teacher = teacher_data["model"]
+    feature_cols = teacher_data["feature_cols"]
+
+    # 실제 경기 / 합성 샘플 피처 (전처리 로그 생략)
+    df = query_dataset("with_weather", columns=TRAINING_COLUMNS, stadiums=[stadium_id])
+    synthetic = synthesize_games(df, n_synthetic + n_synthetic // 4)
+    with redirect_stdout(io.StringIO()):
+        X_real, _, _ = preprocess_data(df, stadium_name)
+        X_synthetic, _, _ = preprocess_data(synthetic, stadium_name)
+    X_real = X_real[feature_cols].reset_index(drop=True)
+    X_synthetic = X_synthetic[feature_cols].reset_index(drop=True)
+
+    # 합성 샘플 일부는 학습에 쓰지 않고 충실도 확인용으로 남김
+    X_train = pd.concat([X_real, X_synthetic.iloc[:n_synthetic]], ignore_index=True)
+    X_check = X_synthetic.iloc[n_synthetic:].reset_index(drop=True)
+
+    teacher_train = teacher.predict_proba(X_train)[:, 1]
+    teacher_real = teacher.predict_proba(X_real)[:, 1]
+    teacher_check = teacher.predict_proba(X_check)[:, 1]
+
+    print(f"교사 모델: {teacher_data.get('model_name') or type(teacher).__name__} ({paths['model']})")
+    print(f"학습 샘플: 실제 {len(X_real)}개 + 합성 {n_synthetic}개, 확인용 합성 {len(X_check)}개")
+    print(f"정확도 예산: 평균 차이 ≤ {mean_gap_budget}, 최대 차이 ≤ {max_gap_budget} (실제 경기)")
+    teacher_cost = measure_inference_cost(teacher, X_real)
+    print(f"교사 추론 비용: 단일 {teacher_cost['single_ms']:.2f}ms, 크기 {teacher_cost['size_kb']:.1f}KB")
+    print(
+        f"\n{'학생 모델':<16} {'평균 차이':>9} {'최대 차이':>9} {'결정 일치':>9} {'합성 평균':>9} {'합성 최대':>9}"
+        f" {'단일(ms)':>9} {'크기(KB)':>9}"
+    )
+    print("-" * 90)
+
+    chosen = None
+    for n_estimators, max_depth in STUDENT_SIZES:
+        student = fit_student(X_train, teacher_train, n_estimators, max_depth, feature_cols, monotone)
+        real = fidelity(teacher_real, student.predict_proba(X_real)[:, 1])
+        check = fidelity(teacher_check, student.predict_proba(X_check)[:, 1])
+        student_cost = measure_inference_cost(student, X_real)
+        print(
+            f"{n_estimators:>3} trees x d{max_depth:<6} {real['mean_gap']:>9.4f} {real['max_gap']:>9.4f} "
+            f"{real['agreement']:>9.1%} {check['mean_gap']:>9.4f} {check['max_gap']:>9.4f}"
+            f" {student_cost['single_ms']:>9.2f} {student_cost['size_kb']:>9.1f}"
+        )
+        # 다음 후보는 더 크므로 교사보다 크면 중단, 느리면 (측정 잡음이 있어) 다음 후보 확인
+        if student_cost["size_kb"] >= teacher_cost["size_kb"]:
+            print(f"\n[중단] {n_estimators} trees x d{max_depth} 학생 모델이 교사보다 큽니다.")
+            break
+        if student_cost["single_ms"] >= teacher_cost["single_ms"]:
+            continue
+        if real["mean_gap"] <= mean_gap_budget and real["max_gap"] <= max_gap_budget:
+            chosen = (student, n_estimators, max_depth, real, check, student_cost)
+            break
+
+    if chosen is None:
+        print(f"\n[실패] 예산을 만족하면서 교사보다 가벼운 학생 모델이 없습니다. 교사 모델을 그대로 사용하세요.")
+        # 이전 실행의 학생 모델은 현재 예산을 통과하지 못했으므로 삭제 (백엔드가 교사 사용)
+        if paths["student"].exists():
+            paths["student"].unlink()
+            print(f"[삭제] 기존 학생 모델: {paths['student']}")
+        return None
+
+    student, n_estimators, max_depth, real, check, student_cost = chosen
+
+    print(f"\n{'':<8} {'단일(ms)':>10} {'배치(ms)':>10} {'크기(KB)':>10}")
+    for label, cost in (("교사", teacher_cost), ("학생", student_cost)):
+        print(f"{label:<8} {cost['single_ms']:>10.2f} {cost['batch_ms']:>10.2f} {cost['size_kb']:>10.1f}")
+
+    model_name = f"Student_LightGBM_{n_estimators}x{max_depth}"
+    model_data = {
+        "model": student,
+        "feature_cols": feature_cols,
+        "stadium_id": stadium_id,
+        "stadium_name": stadium_name,
+        "model_name": model_name,
+        "data_through": teacher_data.get("data_through"),
+        "feature_version": teacher_data.get("feature_version"),
+        # 백엔드는 교사 파일 해시가 다르면(교사 재학습) 학생 대신 교사를 사용
+        "teacher": {
+            "path": str(paths["model"]),
+            "model_name": teacher_data.get("model_name") or type(teacher).__name__,
+            "sha256": hash_file(paths["model"]),
+            "data_through": teacher_data.get("data_through"),
+        },
+        "fidelity": {"real": real, "synthetic": check},
+        "latency": {"teacher": teacher_cost, "student": student_cost},
+    }
+    with open(paths["student"], "wb") as f:
+        pickle.dump(model_data, f)
+    print(f"\n[저장] {paths['student']} ({model_name})")
+
+    return {
+        "path": paths["student"],
+        "model_name": model_name,
+        "fidelity": model_data["fidelity"],
+        "latency": model_data["latency"],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="구장별 모델을 경량 서빙 모델로 증류",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+예시:
+  python distill_model.py --stadium jamsil
+  python distill_model.py --all
+  python distill_model.py --all --mean-gap 0.01 --max-gap 0.2
+  python distill_model.py --all --monotone   # 강수 피처 단조 증가 제약 (충실도는 낮아질 수 있음)
+
+참고:
+  - 먼저 kbo_rain_model.py로 구장별 모델을 학습해야 합니다.
+  - 백엔드는 STUDENT_MODEL_STADIUMS=jamsil,busan (또는 all)로 학생 모델을 사용합니다.
+        """,
+    )
+    parser.add_argument("--stadium", "-s", type=str, default=None, help="구장 ID (예: jamsil)")
+    parser.add_argument("--all", "-a", action="store_true", help="모든 야외 구장")
+    parser.add_argument("--mean-gap", type=float, default=MEAN_GAP_BUDGET, help="허용 평균 확률 차이")
+    parser.add_argument("--max-gap", type=float, default=MAX_GAP_BUDGET, help="허용 최대 확률 차이")
+    parser.add_argument("--synthetic", type=int, default=N_SYNTHETIC, help="합성 학습 샘플 수")
+    parser.add_argument("--monotone", action="store_true", help="강수 피처 단조 증가 제약")
+    args = parser.parse_args()
+
+    stadium_ids = get_outdoor_stadiums() if args.all else [args.stadium or "jamsil"]
+
+    results = {}
+    for stadium_id in stadium_ids:
+        results[stadium_id] = distill_stadium(
+            stadium_id,
+            mean_gap_budget=args.mean_gap,
+            max_gap_budget=args.max_gap,
+            n_synthetic=args.synthetic,
+            monotone=args.monotone,
+        )
+
+    if len(stadium_ids) > 1:
+        print("\n" + "=" * 60)
+        print("증류 결과")
+        print("=" * 60)
+        print(f"{'구장':<20} {'학생 모델':<26} {'평균 차이':>9} {'최대 차이':>9} {'단일(ms)':>9}")
+        print("-" * 78)
+        for stadium_id, result in results.items():
+            name = STADIUMS[stadium_id]["name"]
+            if result is None:
+                print(f"{name:<20} {'- (교사 모델 사용)':<26}")
+                continue
+            real = result["fidelity"]["real"]
+            print(
+                f"{name:<20} {result['model_name']:<26} {real['mean_gap']:>9.4f} {real['max_gap']:>9.4f} "
+                f"{result['latency']['student']['single_ms']:>9.2f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,224 @@
+"""
+모델 입력 피처 일치 검사 / 벤치마크
+===================================
+피처 계산 본체는 backend/shared/features.py (학습/서빙 공통)에 있으며,
+이 모듈은 루트 스크립트용 import 경로로 다시 내보냅니다.
+
+일치 검사 (전 구장 데이터):
+    - 학습 전처리(preprocess_data) 결과가 공통 모듈 도입 전 pandas 구현과 같은지
+    - 경기 1개씩 계산(서빙)과 전체 데이터 한 번에 계산(학습)이 같은지
+    - 학습 시 예측 함수(create_prediction_function)가 같은 피처로 예측하는지
+
+벤치마크:
+    - 경기 1개 피처 계산 지연 (서빙)
+    - 전체 데이터 피처 계산 처리량 (학습), 기존 pandas 구현과 비교
+
+실행: python features.py --check
+      python features.py --bench --repeat 20
+"""
+
+import argparse
+import io
+import sys
+import time
+from contextlib import redirect_stdout
+
+import numpy as np
+import pandas as pd
+
+from backend.shared.features import (
+    BASE_FEATURES,
+    DEFAULT_GAME_HOUR,
+    DERIVED_FEATURES,
+    FEATURE_COLUMNS,
+    FEATURE_VERSION,
+    INTEGER_FEATURES,
+    RAINY_SEASON_MONTHS,
+    calendar_features,
+    compute_features,
+    parse_game_hours,
+)
+
+
+def load_all_games():
+    """전 구장 날씨 포함 경기 (우천취소/정상진행만)"""
+    from dataset_store import query_dataset
+    from kbo_rain_model import TRAINING_COLUMNS
+    from stadium_config import get_outdoor_stadiums
+
+    df = query_dataset("with_weather", columns=TRAINING_COLUMNS, stadiums=get_outdoor_stadiums())
+    return df[df["reason"].isin(["우천취소", "정상진행"])].reset_index(drop=True)
+
+
+def legacy_features(df):
+    """공통 모듈 도입 전 학습 전처리 (pandas .apply 기반, 비교 기준)"""
+    df_model = df.copy()
+    df_model["month"] = pd.to_datetime(df_model["date"]).dt.month
+    df_model["dayofweek"] = pd.to_datetime(df_model["date"]).dt.dayofweek
+    df_model["is_weekend"] = (df_model["dayofweek"] >= 5).astype(int)
+    df_model["is_rainy_season"] = df_model["month"].apply(lambda x: 1 if x in [7, 8] else 0)
+
+    def parse_game_hour(time_str):
+        try:
+            return int(str(time_str).split(":")[0])
+        except ValueError:
+            return 18
+
+    df_model["game_hour"] = df_model["time"].apply(parse_game_hour)
+    df_model["precip_intensity"] = df_model["daily_precip_sum"] / df_model["daily_precip_hours"].replace(0, 1)
+    df_model["humidity_precip_interaction"] = (
+        df_model["pre_game_humidity"].fillna(50) * df_model["pre_game_precip"].fillna(0) / 100
+    )
+    df_model["cumulative_precip_2days"] = (
+        df_model["daily_precip_sum"].fillna(0) + df_model["prev_day_precip"].fillna(0)
+    )
+    df_model["ground_condition_score"] = (
+        df_model["prev_day_precip"].fillna(0) * 0.5
+        + df_model["pre_game_precip"].fillna(0) * 0.3
+        + (df_model["pre_game_humidity"].fillna(50) - 50) * 0.02
+    )
+    return df_model[FEATURE_COLUMNS].fillna(0)
+
+
+def dataset_columns(df):
+    """데이터셋 → compute_features() 입력 (학습 전처리와 같은 변환)"""
+    columns = {name: df[name].to_numpy(dtype=np.float64) for name in BASE_FEATURES}
+    columns.update(calendar_features(pd.to_datetime(df["date"]).to_numpy()))
+    columns["game_hour"] = parse_game_hours(df["time"].to_numpy())
+    return columns
+
+
+def row_inputs(columns):
+    """컬럼 배열 → 경기별 스칼라 입력 (서빙 요청 형식)"""
+    names = list(columns)
+    return [dict(zip(names, values)) for values in zip(*(columns[name].tolist() for name in names))]
+
+
+def max_abs_diff(left, right):
+    return float(np.max(np.abs(np.asarray(left, dtype=np.float64) - np.asarray(right, dtype=np.float64))))
+
+
+def max_rel_diff(left, right):
+    right = np.asarray(right, dtype=np.float64)
+    return float(np.max(np.abs(np.asarray(left, dtype=np.float64) - right) / np.maximum(np.abs(right), 1)))
+
+
+def run_check(df):
+    """
+    학습/서빙 피처 일치 검사
+
+    Returns:
+        bool: 모든 검사 통과 여부
+    """
+    from kbo_rain_model import create_prediction_function, preprocess_data
+
+    print(f"피처 버전: {FEATURE_VERSION}, 경기 수: {len(df)}")
+    results = []
+
+    # 1. 학습 전처리 vs 기존 pandas 구현
+    with redirect_stdout(io.StringIO()):
+        X, _, feature_cols = preprocess_data(df, "전 구장")
+    legacy = legacy_features(df)
+    results.append(("학습 전처리 = 기존 pandas 구현", max_rel_diff(X[feature_cols], legacy[feature_cols])))
+
+    # 2. 경기 1개씩 (서빙) vs 전체 한 번에 (학습)
+    columns = dataset_columns(df)
+    batch = compute_features(columns)
+    single = [compute_features(row) for row in row_inputs(columns)]
+    results.append(
+        (
+            "경기 1개씩 = 전체 한 번에",
+            max(max_abs_diff(np.concatenate([row[name] for row in single]), batch[name]) for name in FEATURE_COLUMNS),
+        )
+    )
+
+    # 3. 학습 시 예측 함수(원본 입력, 결측 포함) vs 전처리 결과로 직접 예측
+    from sklearn.linear_model import LogisticRegression
+
+    target = (X["pre_game_precip"] > X["pre_game_precip"].median()).astype(int)
+    model = LogisticRegression(max_iter=1000).fit(X, target)
+    predict_fn = create_prediction_function(model, feature_cols)
+    sample = np.random.default_rng(42).choice(len(X), size=min(200, len(X)), replace=False)
+    inputs = row_inputs(columns)
+    via_fn = [float(predict_fn(**inputs[i])["cancellation_probability"].rstrip("%")) / 100 for i in sample]
+    direct = model.predict_proba(X.iloc[sample])[:, 1]
+    results.append(("학습 시 예측 함수 = 직접 예측", max_abs_diff(via_fn, direct)))
+
+    # 1: 저장소 날씨 컬럼이 float32라 기존 구현은 float32로 계산 (공통 모듈은 float64)
+    # 3: 예측 함수는 확률을 0.1% 단위로 반올림해 반환
+    tolerances = [1e-6, 0.0, 0.0005 + 1e-9]
+    print(f"\n{'검사':<40} {'최대 차이':>12} {'결과':>6}")
+    print("-" * 62)
+    passed = True
+    for (name, diff), tolerance in zip(results, tolerances):
+        ok = diff <= tolerance
+        passed &= ok
+        print(f"{name:<40} {diff:>12.2e} {'통과' if ok else '실패':>6}")
+
+    dtypes_ok = all((X[name].dtype.kind == "i") == (name in INTEGER_FEATURES) for name in FEATURE_COLUMNS)
+    passed &= dtypes_ok
+    print(f"{'정수형 피처 dtype':<40} {'':>12} {'통과' if dtypes_ok else '실패':>6}")
+    return passed
+
+
+def run_benchmark(df, repeat=10):
+    """경기 1개 지연(서빙)과 전체 데이터 처리량(학습) 측정"""
+    columns = dataset_columns(df)
+    rows = row_inputs(columns)[:1000]
+
+    # 경기 1개: 백엔드 요청 하나와 같은 스칼라 입력
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for row in rows:
+            compute_features(row)
+    single_us = (time.perf_counter() - start) / (repeat * len(rows)) * 1e6
+
+    print(f"경기 수: {len(df)}, 반복 {repeat}회")
+    print(f"\n경기 1개 피처 계산 (서빙): {single_us:.1f}µs/경기")
+
+    print(f"\n{'전체 데이터 (학습)':<28} {'초':>10} {'rows/s':>14}")
+    print("-" * 54)
+    for name, compute in [
+        ("공통 모듈 (NumPy)", lambda: compute_features(dataset_columns(df))),
+        ("기존 pandas (.apply)", lambda: legacy_features(df)),
+    ]:
+        compute()
+        start = time.perf_counter()
+        for _ in range(repeat):
+            compute()
+        elapsed = time.perf_counter() - start
+        print(f"{name:<28} {elapsed:>10.3f} {len(df) * repeat / elapsed:>14,.0f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="모델 입력 피처 일치 검사 / 벤치마크 (학습/서빙 공통 모듈)",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+예시:
+  python features.py --check
+  python features.py --bench --repeat 20
+        """,
+    )
+    parser.add_argument("--check", action="store_true", help="학습/서빙 피처 일치 검사 (실패 시 종료 코드 1)")
+    parser.add_argument("--bench", action="store_true", help="피처 계산 벤치마크")
+    parser.add_argument("--repeat", type=int, default=10, help="벤치마크 반복 횟수 (기본: 10)")
+    args = parser.parse_args()
+
+    if not args.check and not args.bench:
+        parser.print_help()
+        return
+
+    df = load_all_games()
+    if args.check:
+        passed = run_check(df)
+        if not passed:
+            sys.exit(1)
+    if args.bench:
+        if args.check:
+            print()
+        run_benchmark(df, repeat=args.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -39,6 +39,7 @@ export interface PredictionRequest {
   daily_temp_mean: number
   month: number
   dayofweek: number
+  game_date?: string
 }
 
 // 예측 응답
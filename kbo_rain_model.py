@@ -1,24 +1,36 @@
 """
 KBO 우천취소 예측 모델 (다중 구장 지원)
 ========================================
-1. 탐색적 데이터 분석 (EDA)
+1. 데이터 로드
 2. 데이터 전처리
 3. 모델 학습 (XGBoost, LightGBM, RandomForest)
-4. 모델 평가 및 해석
+4. 모델 평가 및 저장
 
-설치: pip install pandas numpy scikit-learn xgboost lightgbm matplotlib seaborn
+학습은 그래프 없이 실행됩니다. EDA/피처 중요도 그래프는 model_report.py가 별도로 생성합니다
+(--report: 학습 후 백그라운드 실행).
+
+설치: pip install pandas numpy scikit-learn xgboost lightgbm
 실행: python kbo_rain_model.py --stadium jamsil
       python kbo_rain_model.py --stadium busan
       python kbo_rain_model.py --all
+      python kbo_rain_model.py --all --jobs 4  # 구장별 병렬 학습 (프로세스 4개)
+      python kbo_rain_model.py --all --incremental  # 새 경기만 이어서 학습
+      python kbo_rain_model.py --global  # 전 구장 통합 모델 (구장 ID 범주형 피처)
 """
 
 import argparse
+import copy
+import io
+import os
 import pickle
+import time
+import traceback
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from contextlib import redirect_stdout
+from pathlib import Path
 import pandas as pd
 import numpy as np
-import matplotlib.pyplot as plt
-import seaborn as sns
-from sklearn.model_selection import train_test_split, cross_val_score, StratifiedKFold
+from sklearn.model_selection import train_test_split, StratifiedKFold
 from sklearn.preprocessing import StandardScaler
 from sklearn.metrics import (
     classification_report,
@@ -27,22 +39,39 @@ from sklearn.metrics import (
     precision_recall_curve,
     f1_score,
     accuracy_score,
+    log_loss,
 )
+from sklearn.base import clone
 from sklearn.ensemble import RandomForestClassifier
 from xgboost import XGBClassifier
 from lightgbm import LGBMClassifier
+from joblib import Parallel, delayed
+from threadpoolctl import threadpool_limits
 import warnings
 
 # Optuna for hyperparameter tuning
 try:
     import optuna
     from optuna.samplers import TPESampler
+    from optuna.study import MaxTrialsCallback
+    from optuna.trial import TrialState
     OPTUNA_AVAILABLE = True
 except ImportError:
     OPTUNA_AVAILABLE = False
 
 warnings.filterwarnings("ignore")
 
+from backend.shared import features as shared_features
+from backend.shared.features import (
+    BASE_FEATURES,
+    FEATURE_COLUMNS,
+    FEATURE_VERSION,
+    calendar_features,
+    compute_features,
+    parse_game_hours,
+)
+from dataset_store import WEATHER_COLUMNS, dataset_exists, query_dataset
+from training_cache import TrainingCache, combine_hash, hash_dataframe, hash_file, hash_sources, library_versions
 from stadium_config import (
     STADIUMS,
     get_stadium_config,
@@ -53,21 +82,78 @@ from stadium_config import (
 )
 
 
-# 한글 폰트 설정 (macOS)
-plt.rcParams["font.family"] = "AppleGothic"
-plt.rcParams["axes.unicode_minus"] = False
+# 학습/EDA에 필요한 컬럼 (데이터셋에서 이 컬럼만 로드)
+TRAINING_COLUMNS = ["date", "time", "cancelled", "reason"] + WEATHER_COLUMNS
+
+# 병렬 학습 시 구장별 학습 로그 디렉토리
+TRAINING_LOG_DIR = MODELS_DIR / "logs"
+
+# 교차 검증 폴드 수
+CV_FOLDS = 5
+
+# 전 구장 통합 모델 (구장 ID를 범주형 피처로 사용)
+GLOBAL_MODEL_PATH = MODELS_DIR / "kbo_global_model.pkl"
+STADIUM_FEATURE = "stadium_id"
+
+# Optuna study 저장소 (중단 후 재개, 여러 프로세스 공유)
+OPTUNA_STORAGE = f"sqlite:///{MODELS_DIR / 'optuna_studies.db'}"
+PRUNERS = ("hyperband", "median", "none")
+
+# 튜닝 시 폴드별 XGBoost 조기 종료 라운드, 조기 종료 기준으로 폴드 학습 데이터에서 떼어 둘 비율
+# (F1을 재는 검증 폴드로 조기 종료하면 CV F1이 낙관적으로 편향됨)
+EARLY_STOPPING_ROUNDS = 20
+EARLY_STOPPING_FRACTION = 0.2
+
+# 추론 비용 측정: 배치 크기, 단일 행 측정 반복 횟수 (중앙값 사용)
+LATENCY_BATCH_SIZE = 256
+LATENCY_REPEATS = 30
+
+# 모델 선택 지연 예산 (단일 행 추론 ms, 배포 환경별로 KBO_LATENCY_BUDGET_MS로 설정, 미설정 시 제한 없음)
+LATENCY_BUDGET_MS = float(os.environ["KBO_LATENCY_BUDGET_MS"]) if os.environ.get("KBO_LATENCY_BUDGET_MS") else None
+
+# 튜닝 목표: CV F1 단일 목표 / CV F1 vs 단일 행 추론 지연 다목적
+OBJECTIVES = ("f1", "f1_latency")
+LATENCY_STUDY_SUFFIX = "_latency"
+# study 이름 = <구장/분할/목표>-<학습 데이터 지문> (데이터가 바뀌면 새 study)
+STUDY_FINGERPRINT_SEP = "-"
+STUDY_FINGERPRINT_LENGTH = 10
+
+# XGBoost 탐색 공간: 파라미터 -> (타입, 하한, 상한, 로그 스케일)
+XGB_SEARCH_SPACE = {
+    "n_estimators": ("int", 50, 300, False),
+    "max_depth": ("int", 2, 10, False),
+    "learning_rate": ("float", 0.01, 0.3, True),
+    "min_child_weight": ("int", 1, 10, False),
+    "subsample": ("float", 0.6, 1.0, False),
+    "colsample_bytree": ("float", 0.6, 1.0, False),
+    "gamma": ("float", 0.0, 5.0, False),
+    "reg_alpha": ("float", 0.0, 2.0, False),
+    "reg_lambda": ("float", 0.0, 2.0, False),
+}
+
+# 웜 스타트: study당 가져올 상위 trial 수, 탐색 공간 축소 시 여유 (전체 범위 대비 비율)
+SEED_TOP_K = 2
+NARROW_MARGIN = 0.15
+
+# 증분 학습: 이어서 추가할 트리 수, 부스팅 학습률 배율 (새 경기에 과적합 방지), 최소 새 경기 수,
+# 검증(holdout)으로 남길 최근 새 경기 비율, 기존 모델 대비 허용 log loss 증가율
+INCREMENTAL_ROUNDS = 10
+INCREMENTAL_LEARNING_RATE_SCALE = 0.3
+INCREMENTAL_MIN_NEW_GAMES = 10
+INCREMENTAL_HOLDOUT_FRACTION = 0.3
+INCREMENTAL_TOLERANCE = 0.05
 
 
 # ============================================
 # 1. 데이터 로드 및 확인
 # ============================================
-def load_and_explore_data(filepath, stadium_name):
-    """데이터 로드 및 기본 탐색"""
+def load_and_explore_data(stadium_id, stadium_name):
+    """데이터 로드 및 기본 탐색 (학습에 필요한 컬럼만 로드)"""
     print("=" * 60)
     print(f"1. 데이터 로드 및 탐색 ({stadium_name})")
     print("=" * 60)
 
-    df = pd.read_csv(filepath)
+    df = query_dataset("with_weather", columns=TRAINING_COLUMNS, stadiums=[stadium_id])
 
     print(f"\n데이터 shape: {df.shape}")
     print(f"\n컬럼 목록:\n{df.columns.tolist()}")
@@ -83,205 +169,230 @@ def load_and_explore_data(filepath, stadium_name):
 
 
 # ============================================
-# 2. 탐색적 데이터 분석 (EDA)
+# 2. 데이터 전처리
 # ============================================
-def perform_eda(df, stadium_id, stadium_name):
-    """탐색적 데이터 분석"""
+def preprocess_data(df, stadium_name):
+    """모델 학습을 위한 데이터 전처리"""
     print("\n" + "=" * 60)
-    print(f"2. 탐색적 데이터 분석 - {stadium_name}")
+    print(f"2. 데이터 전처리 - {stadium_name}")
     print("=" * 60)
 
-    # 우천취소만 필터링 (미세먼지 제외)
-    df_rain = df[df["reason"].isin(["우천취소", "정상진행"])].copy()
-    df_rain["is_cancelled"] = (df_rain["reason"] == "우천취소").astype(int)
-
-    cancelled = df_rain[df_rain["is_cancelled"] == 1]
-    normal = df_rain[df_rain["is_cancelled"] == 0]
-
-    print(f"\n분석 대상: {len(df_rain)}개 경기")
-    print(f"  - 우천취소: {len(cancelled)}개")
-    print(f"  - 정상진행: {len(normal)}개")
-
-    # 취소 경기가 너무 적으면 EDA 스킵
-    if len(cancelled) < 3:
-        print(f"\n[경고] 우천취소 경기가 {len(cancelled)}개로 너무 적어 EDA를 스킵합니다.")
-        return df_rain
-
-    # 날씨 변수 비교
-    weather_cols = [
-        "daily_precip_sum",
-        "daily_precip_hours",
-        "daily_rain_sum",
-        "pre_game_precip",
-        "pre_game_humidity",
-        "pre_game_temp",
-        "prev_day_precip",
-        "daily_wind_max",
-    ]
-
-    print("\n[날씨 변수 비교: 취소 vs 정상]")
-    print("-" * 60)
-    print(f"{'변수':<25} {'취소 평균':>12} {'정상 평균':>12} {'차이':>10}")
-    print("-" * 60)
-
-    for col in weather_cols:
-        if col in df_rain.columns:
-            c_mean = cancelled[col].mean()
-            n_mean = normal[col].mean()
-            diff = c_mean - n_mean
-            print(f"{col:<25} {c_mean:>12.2f} {n_mean:>12.2f} {diff:>10.2f}")
-
-    # 시각화
-    fig, axes = plt.subplots(2, 3, figsize=(15, 10))
-    fig.suptitle(f"{stadium_name} - 우천취소 vs 정상경기 날씨 비교", fontsize=14)
-
-    plot_cols = [
-        "daily_precip_sum",
-        "pre_game_precip",
-        "pre_game_humidity",
-        "prev_day_precip",
-        "daily_precip_hours",
-        "pre_game_temp",
-    ]
-
-    for ax, col in zip(axes.flatten(), plot_cols):
-        if col in df_rain.columns:
-            data_cancelled = cancelled[col].dropna()
-            data_normal = normal[col].dropna()
-
-            if len(data_cancelled) > 0 and len(data_normal) > 0:
-                ax.boxplot([data_normal, data_cancelled], labels=["정상", "취소"])
-            ax.set_title(col)
-            ax.set_ylabel("값")
+    # 우천취소만 대상 (미세먼지 제외)
+    df_model = df[df["reason"].isin(["우천취소", "정상진행"])].copy()
+    df_model["is_cancelled"] = (df_model["reason"] == "우천취소").astype(int)
 
-    plt.tight_layout()
-    eda_path = MODELS_DIR / f"eda_{stadium_id}_weather_comparison.png"
-    eda_path.parent.mkdir(parents=True, exist_ok=True)
-    plt.savefig(eda_path, dpi=150, bbox_inches="tight")
-    plt.close()
-    print(f"\n[저장] {eda_path}")
+    # 기본 날씨 피처 + 월/요일/경기 시간 → 파생 피처 (backend/shared/features.py, 서빙과 공통)
+    columns = {name: df_model[name].to_numpy(dtype=np.float64) for name in BASE_FEATURES}
+    columns.update(calendar_features(pd.to_datetime(df_model["date"]).to_numpy()))
+    columns["game_hour"] = parse_game_hours(df_model["time"].to_numpy())
+    features = compute_features(columns)
 
-    # 월별 취소 분포
-    df_rain["month"] = pd.to_datetime(df_rain["date"]).dt.month
-    monthly_cancel = df_rain.groupby("month")["is_cancelled"].agg(["sum", "count"])
-    monthly_cancel["rate"] = monthly_cancel["sum"] / monthly_cancel["count"] * 100
+    feature_cols = list(FEATURE_COLUMNS)
+    X = pd.DataFrame(features, index=df_model.index)[feature_cols]
+    y = df_model["is_cancelled"]
 
-    print("\n[월별 우천취소 현황]")
-    print(monthly_cancel)
+    print(f"\n피처 수: {len(feature_cols)} (기존 11개 + 신규 7개)")
+    print(f"피처 목록: {feature_cols}")
+    print(f"\n신규 파생 피처:")
+    print(f"  - is_weekend, is_rainy_season, game_hour")
+    print(f"  - precip_intensity, humidity_precip_interaction")
+    print(f"  - cumulative_precip_2days, ground_condition_score")
+    print(f"\n데이터 shape: X={X.shape}, y={y.shape}")
+    print(f"클래스 분포: 정상={sum(y==0)}, 취소={sum(y==1)}")
 
-    return df_rain
+    return X, y, feature_cols
 
 
 # ============================================
-# 헬퍼 함수
+# 교차 검증 (폴드 사전 계산, 모델 간 공유)
 # ============================================
-def parse_game_hour(time_str):
-    """경기 시간에서 시간 추출"""
-    try:
-        return int(str(time_str).split(":")[0])
-    except:
-        return 18  # 기본값
+def split_train_test(X, y, df_dates=None, temporal_split=False):
+    """
+    학습/테스트 분할
 
+    temporal_split이면 2025년 경기를 테스트셋으로, 아니면 층화 무작위 분할(20%)
 
-# ============================================
-# 3. 데이터 전처리
-# ============================================
-def preprocess_data(df, stadium_name):
-    """모델 학습을 위한 데이터 전처리"""
-    print("\n" + "=" * 60)
-    print(f"3. 데이터 전처리 - {stadium_name}")
-    print("=" * 60)
+    Returns:
+        tuple: (X_train, X_test, y_train, y_test)
+    """
+    if temporal_split and df_dates is not None:
+        years = pd.to_datetime(df_dates).dt.year
+        train_mask = years < 2025
+        test_mask = years >= 2025
+        return X[train_mask], X[test_mask], y[train_mask], y[test_mask]
+    return train_test_split(X, y, test_size=0.2, random_state=42, stratify=y)
 
-    # 우천취소만 대상 (미세먼지 제외)
-    df_model = df[df["reason"].isin(["우천취소", "정상진행"])].copy()
-    df_model["is_cancelled"] = (df_model["reason"] == "우천취소").astype(int)
 
-    # 기본 피처
-    base_feature_cols = [
-        "daily_precip_sum",  # 일 강수량
-        "daily_precip_hours",  # 강수 시간
-        "pre_game_precip",  # 경기 전 강수량
-        "pre_game_humidity",  # 경기 전 습도
-        "pre_game_temp",  # 경기 전 기온
-        "pre_game_wind",  # 경기 전 풍속
-        "prev_day_precip",  # 전날 강수량
-        "daily_wind_max",  # 최대 풍속
-        "daily_temp_mean",  # 평균 기온
+def make_cv_folds(X, y, n_splits=CV_FOLDS):
+    """
+    교차 검증 폴드 사전 계산
+
+    폴드 인덱스와 폴드별 학습/검증 배열을 한 번만 만들어 여러 모델이 재사용합니다.
+
+    Returns:
+        list: [(X_train, y_train, X_valid, y_valid)] numpy 배열 (폴드 순)
+    """
+    X_values = np.ascontiguousarray(X.to_numpy() if hasattr(X, "to_numpy") else X)
+    y_values = np.asarray(y)
+    cv = StratifiedKFold(n_splits=n_splits, shuffle=True, random_state=42)
+    return [
+        (X_values[train_idx], y_values[train_idx], X_values[valid_idx], y_values[valid_idx])
+        for train_idx, valid_idx in cv.split(X_values, y_values)
     ]
 
-    # 월, 요일 추가
-    df_model["month"] = pd.to_datetime(df_model["date"]).dt.month
-    df_model["dayofweek"] = pd.to_datetime(df_model["date"]).dt.dayofweek
 
-    # ========================================
-    # 신규 파생 피처 생성
-    # ========================================
-    # 1. 주말 여부 (토=5, 일=6)
-    df_model["is_weekend"] = (df_model["dayofweek"] >= 5).astype(int)
+def _fit_and_score_fold(model, fold):
+    """폴드 하나 학습 후 모든 지표 계산"""
+    X_train, y_train, X_valid, y_valid = fold
+    model.fit(X_train, y_train)
+    y_pred = model.predict(X_valid)
+    y_prob = model.predict_proba(X_valid)[:, 1]
+    has_both_classes = 0 < y_valid.sum() < len(y_valid)
+    return {
+        "f1": f1_score(y_valid, y_pred),
+        "accuracy": accuracy_score(y_valid, y_pred),
+        "roc_auc": roc_auc_score(y_valid, y_prob) if has_both_classes else np.nan,
+    }
 
-    # 2. 장마철 여부 (7-8월)
-    df_model["is_rainy_season"] = df_model["month"].apply(lambda x: 1 if x in [7, 8] else 0)
 
-    # 3. 경기 시작 시간
-    df_model["game_hour"] = df_model["time"].apply(parse_game_hour)
+def cross_validate_folds(model, folds, n_jobs=None):
+    """
+    사전 계산된 폴드로 교차 검증 (한 번에 모든 지표)
 
-    # 4. 강수 강도 (mm/시간) - 0으로 나누기 방지
-    df_model["precip_intensity"] = df_model["daily_precip_sum"] / df_model["daily_precip_hours"].replace(0, 1)
+    폴드는 joblib으로 병렬 학습하며, 코어를 (병렬 폴드 수 x 모델 스레드 수)로 나눕니다.
 
-    # 5. 습도 × 강수량 상호작용
-    df_model["humidity_precip_interaction"] = (
-        df_model["pre_game_humidity"].fillna(50) * df_model["pre_game_precip"].fillna(0) / 100
+    Args:
+        model: 학습 전 모델 (폴드마다 복제)
+        folds: make_cv_folds() 결과
+        n_jobs: 사용할 코어 수 (None이면 전체)
+
+    Returns:
+        dict: {"f1" | "accuracy" | "roc_auc": 폴드별 점수 배열}
+    """
+    n_cores = n_jobs or os.cpu_count() or 1
+    fold_jobs = min(len(folds), n_cores)
+    estimator = clone(model)
+    if fold_jobs > 1 and "n_jobs" in estimator.get_params():
+        estimator.set_params(n_jobs=max(1, n_cores // fold_jobs))
+
+    fold_scores = Parallel(n_jobs=fold_jobs)(
+        delayed(_fit_and_score_fold)(clone(estimator), fold) for fold in folds
     )
+    return {metric: np.array([scores[metric] for scores in fold_scores]) for metric in fold_scores[0]}
 
-    # 6. 2일 누적 강수량
-    df_model["cumulative_precip_2days"] = (
-        df_model["daily_precip_sum"].fillna(0) + df_model["prev_day_precip"].fillna(0)
+
+def print_cv_scores(cv_scores):
+    """교차 검증 결과 출력"""
+    print(f"\n{len(cv_scores['f1'])}-Fold CV F1: {cv_scores['f1'].mean():.4f} (+/- {cv_scores['f1'].std()*2:.4f})")
+    print(
+        f"{len(cv_scores['f1'])}-Fold CV ROC-AUC: {np.nanmean(cv_scores['roc_auc']):.4f}, "
+        f"Accuracy: {cv_scores['accuracy'].mean():.4f}"
     )
 
-    # 7. 그라운드 상태 점수 (높을수록 취소 위험)
-    df_model["ground_condition_score"] = (
-        df_model["prev_day_precip"].fillna(0) * 0.5 +
-        df_model["pre_game_precip"].fillna(0) * 0.3 +
-        (df_model["pre_game_humidity"].fillna(50) - 50) * 0.02
+
+# ============================================
+# 3. 모델 학습 및 평가
+# ============================================
+def measure_inference_cost(model, X, batch_size=LATENCY_BATCH_SIZE, repeats=LATENCY_REPEATS):
+    """
+    모델 추론 비용 측정
+
+    Returns:
+        dict: {"single_ms": 단일 행 predict_proba 지연 중앙값,
+               "batch_ms": batch_size행 predict_proba 지연 중앙값,
+               "size_kb": pickle 직렬화 크기}
+    """
+    row = X.iloc[:1]
+    batch = X.sample(n=batch_size, replace=len(X) < batch_size, random_state=42)
+
+    def median_ms(data, n):
+        model.predict_proba(data)  # 워밍업
+        timings = []
+        for _ in range(n):
+            start = time.perf_counter()
+            model.predict_proba(data)
+            timings.append(time.perf_counter() - start)
+        return float(np.median(timings)) * 1000
+
+    return {
+        "single_ms": median_ms(row, repeats),
+        "batch_ms": median_ms(batch, max(3, repeats // 5)),
+        "size_kb": len(pickle.dumps(model)) / 1024,
+    }
+
+
+def print_inference_cost(cost):
+    print(
+        f"추론 비용: 단일 {cost['single_ms']:.2f}ms, 배치 {LATENCY_BATCH_SIZE}행 {cost['batch_ms']:.2f}ms, "
+        f"크기 {cost['size_kb']:.0f}KB"
     )
 
-    # 전체 피처 목록
-    feature_cols = base_feature_cols + [
-        "month",
-        "dayofweek",
-        # 신규 파생 피처
-        "is_weekend",
-        "is_rainy_season",
-        "game_hour",
-        "precip_intensity",
-        "humidity_precip_interaction",
-        "cumulative_precip_2days",
-        "ground_condition_score",
-    ]
 
-    # 결측치 처리
-    X = df_model[feature_cols].copy()
-    y = df_model["is_cancelled"]
+def select_best_model(results, latency_budget_ms=None):
+    """
+    지연 예산을 고려한 최고 모델 선택
 
-    # 결측치를 0으로 채움 (강수량 관련)
-    X = X.fillna(0)
+    단일 행 추론 지연이 예산 이내인 모델 중 F1이 가장 높은 모델을 고르고
+    (F1이 같으면 더 빠른 모델), 예산 이내 모델이 없으면 가장 빠른 모델을 고릅니다.
 
-    print(f"\n피처 수: {len(feature_cols)} (기존 11개 + 신규 7개)")
-    print(f"피처 목록: {feature_cols}")
-    print(f"\n신규 파생 피처:")
-    print(f"  - is_weekend, is_rainy_season, game_hour")
-    print(f"  - precip_intensity, humidity_precip_interaction")
-    print(f"  - cumulative_precip_2days, ground_condition_score")
-    print(f"\n데이터 shape: X={X.shape}, y={y.shape}")
-    print(f"클래스 분포: 정상={sum(y==0)}, 취소={sum(y==1)}")
+    Args:
+        results: {모델명: {"f1", "single_ms", ...}}
+        latency_budget_ms: 단일 행 추론 지연 예산 (None이면 제한 없음)
 
-    return X, y, feature_cols
+    Returns:
+        str: 선택된 모델명
+    """
+    within = {
+        name: metrics for name, metrics in results.items()
+        if latency_budget_ms is None or metrics["single_ms"] <= latency_budget_ms
+    }
+    if not within:
+        name = min(results, key=lambda n: results[n]["single_ms"])
+        print(f"\n[지연 예산] {latency_budget_ms}ms 이내 모델이 없어 가장 빠른 {name} 선택")
+        return name
+    return max(within, key=lambda n: (within[n]["f1"], -within[n]["single_ms"]))
 
 
-# ============================================
-# 4. 모델 학습 및 평가
-# ============================================
-def train_and_evaluate(X, y, feature_cols, stadium_name, df_dates=None, temporal_split=False):
+def build_candidate_models(scale_pos_weight, n_jobs=None):
+    """
+    후보 모델 정의 (학습/백테스트 공용)
+
+    Args:
+        scale_pos_weight: 음성/양성 비율 (XGBoost 클래스 가중치)
+        n_jobs: 모델 내부 스레드 수 (None이면 라이브러리 기본값)
+
+    Returns:
+        dict: {모델 이름: 학습 전 모델}
+    """
+    return {
+        "XGBoost": XGBClassifier(
+            n_estimators=100,
+            max_depth=4,
+            learning_rate=0.1,
+            scale_pos_weight=scale_pos_weight,
+            random_state=42,
+            eval_metric="logloss",
+            n_jobs=n_jobs,
+        ),
+        "LightGBM": LGBMClassifier(
+            n_estimators=100,
+            max_depth=4,
+            learning_rate=0.1,
+            class_weight="balanced",
+            random_state=42,
+            verbose=-1,
+            n_jobs=n_jobs,
+        ),
+        "RandomForest": RandomForestClassifier(
+            n_estimators=100, max_depth=6, class_weight="balanced", random_state=42, n_jobs=n_jobs
+        ),
+    }
+
+
+def train_and_evaluate(
+    X, y, feature_cols, stadium_name, df_dates=None, temporal_split=False, n_jobs=None,
+    latency_budget_ms=LATENCY_BUDGET_MS,
+):
     """
     여러 모델 학습 및 비교
     
@@ -292,9 +403,11 @@ def train_and_evaluate(X, y, feature_cols, stadium_name, df_dates=None, temporal
         stadium_name: 구장명
         df_dates: 날짜 시리즈 (temporal split 용)
         temporal_split: True면 2025년 데이터를 테스트셋으로 사용
+        n_jobs: 모델 내부 스레드 수 (None이면 라이브러리 기본값)
+        latency_budget_ms: 모델 선택 시 단일 행 추론 지연 예산 (None이면 F1만으로 선택)
     """
     print("\n" + "=" * 60)
-    print(f"4. 모델 학습 및 평가 - {stadium_name}")
+    print(f"3. 모델 학습 및 평가 - {stadium_name}")
     print("=" * 60)
 
     # 취소 경기가 너무 적으면 학습 불가
@@ -304,15 +417,9 @@ def train_and_evaluate(X, y, feature_cols, stadium_name, df_dates=None, temporal
         return None, None, None, None, None
 
     # 데이터 분할
+    X_train, X_test, y_train, y_test = split_train_test(X, y, df_dates, temporal_split)
     if temporal_split and df_dates is not None:
         # Temporal Split: 2025년 데이터를 테스트셋으로 사용
-        years = pd.to_datetime(df_dates).dt.year
-        train_mask = years < 2025
-        test_mask = years >= 2025
-        
-        X_train, X_test = X[train_mask], X[test_mask]
-        y_train, y_test = y[train_mask], y[test_mask]
-        
         print(f"\n[테스트 방식] Temporal Split (2019-2024 학습, 2025 테스트)")
         
         if len(X_test) == 0:
@@ -320,9 +427,6 @@ def train_and_evaluate(X, y, feature_cols, stadium_name, df_dates=None, temporal
             return None, None, None, None, None
     else:
         # Random Split (기존 방식)
-        X_train, X_test, y_train, y_test = train_test_split(
-            X, y, test_size=0.2, random_state=42, stratify=y
-        )
         print(f"\n[테스트 방식] Random Split (80% 학습, 20% 테스트)")
 
     print(f"학습 데이터: {len(X_train)}개 (취소: {sum(y_train)}개)")
@@ -340,32 +444,12 @@ def train_and_evaluate(X, y, feature_cols, stadium_name, df_dates=None, temporal
     print(f"\n클래스 가중치 (scale_pos_weight): {scale_pos_weight:.2f}")
 
     # 모델 정의
-    models = {
-        "XGBoost": XGBClassifier(
-            n_estimators=100,
-            max_depth=4,
-            learning_rate=0.1,
-            scale_pos_weight=scale_pos_weight,
-            random_state=42,
-            eval_metric="logloss",
-        ),
-        "LightGBM": LGBMClassifier(
-            n_estimators=100,
-            max_depth=4,
-            learning_rate=0.1,
-            class_weight="balanced",
-            random_state=42,
-            verbose=-1,
-        ),
-        "RandomForest": RandomForestClassifier(
-            n_estimators=100, max_depth=6, class_weight="balanced", random_state=42
-        ),
-    }
+    models = build_candidate_models(scale_pos_weight, n_jobs=n_jobs)
+
+    # 교차 검증 폴드 (모든 모델이 공유)
+    folds = make_cv_folds(X, y)
 
     results = {}
-    best_model = None
-    best_f1 = 0
-    best_model_name = None
 
     for name, model in models.items():
         print(f"\n{'='*40}")
@@ -400,26 +484,42 @@ def train_and_evaluate(X, y, feature_cols, stadium_name, df_dates=None, temporal
         cm = confusion_matrix(y_test, y_pred)
         print(cm)
 
-        # 교차 검증
-        cv = StratifiedKFold(n_splits=5, shuffle=True, random_state=42)
-        cv_scores = cross_val_score(model, X, y, cv=cv, scoring="f1")
-        print(f"\n5-Fold CV F1: {cv_scores.mean():.4f} (+/- {cv_scores.std()*2:.4f})")
+        # 교차 검증 (사전 계산 폴드, 병렬)
+        cv_scores = cross_validate_folds(model, folds, n_jobs=n_jobs)
+        print_cv_scores(cv_scores)
+
+        # 추론 지연/크기
+        cost = measure_inference_cost(model, X_test)
+        print_inference_cost(cost)
 
         results[name] = {
             "model": model,
             "accuracy": accuracy,
             "f1": f1,
             "roc_auc": roc_auc,
-            "cv_f1_mean": cv_scores.mean(),
+            "cv_f1_mean": cv_scores["f1"].mean(),
+            "cv_f1_std": cv_scores["f1"].std(),
+            "cv_roc_auc_mean": float(np.nanmean(cv_scores["roc_auc"])),
+            "cv_accuracy_mean": cv_scores["accuracy"].mean(),
+            **cost,
         }
 
-        if f1 > best_f1:
-            best_f1 = f1
-            best_model = model
-            best_model_name = name
-
     print(f"\n{'='*60}")
-    print(f"최고 성능 모델: {best_model_name} (F1: {best_f1:.4f})")
+    print(f"{'모델':<14} {'F1':>8} {'단일(ms)':>10} {'배치(ms)':>10} {'크기(KB)':>10}")
+    for name, metrics in results.items():
+        print(
+            f"{name:<14} {metrics['f1']:>8.4f} {metrics['single_ms']:>10.2f} "
+            f"{metrics['batch_ms']:>10.2f} {metrics['size_kb']:>10.0f}"
+        )
+    if latency_budget_ms is not None:
+        print(f"지연 예산: 단일 행 {latency_budget_ms}ms")
+
+    best_model_name = select_best_model(results, latency_budget_ms)
+    if results[best_model_name]["f1"] <= 0:
+        print("\n[오류] 테스트셋에서 취소를 맞힌 모델이 없습니다.")
+        return results, None, None, X_test, y_test
+    best_model = results[best_model_name]["model"]
+    print(f"최고 성능 모델: {best_model_name} (F1: {results[best_model_name]['f1']:.4f})")
     print("=" * 60)
 
     return results, best_model, best_model_name, X_test, y_test
@@ -428,88 +528,393 @@ def train_and_evaluate(X, y, feature_cols, stadium_name, df_dates=None, temporal
 # ============================================
 # 4-1. Optuna 하이퍼파라미터 튜닝
 # ============================================
-def tune_with_optuna(X_train, y_train, scale_pos_weight, n_trials=50):
+def suggest_params(trial, space):
+    """탐색 공간에서 trial 파라미터 제안"""
+    params = {}
+    for name, (kind, low, high, log) in space.items():
+        if kind == "int":
+            params[name] = trial.suggest_int(name, low, high, log=log)
+        else:
+            params[name] = trial.suggest_float(name, low, high, log=log)
+    return params
+
+
+def _in_space(params, space):
+    return all(
+        name in params and low <= params[name] <= high
+        for name, (_, low, high, _) in space.items()
+    )
+
+
+def collect_seed_params(study_name, storage, space=XGB_SEARCH_SPACE, top_k=SEED_TOP_K):
+    """
+    같은 저장소의 다른 study에서 상위 trial 파라미터 수집 (웜 스타트용)
+
+    같은 구장의 이전 study(이전 데이터, 다른 분할 방식) → 같은 분할 방식의 다른 구장 →
+    나머지 순으로, study마다 점수 상위 top_k개 완료 trial을 가져옵니다.
+    탐색 공간을 벗어나거나 중복된 파라미터는 제외합니다.
+
+    다목적(F1 vs 지연) study는 첫 번째 목표(CV F1) 기준으로 정렬합니다.
+
+    Args:
+        study_name: 현재 study 이름 (kbo_<구장>_<분할 방식>[_latency][-<데이터 지문>])
+
+    Returns:
+        list: [(출처 study 이름, CV F1, 파라미터)]
+    """
+    def base_name(name):
+        # 데이터 지문, 다목적 접미사 제거 (kbo_<구장>_<분할 방식>)
+        return name.split(STUDY_FINGERPRINT_SEP)[0].removesuffix(LATENCY_STUDY_SUFFIX)
+
+    stadium_prefix, split = base_name(study_name).rsplit("_", 1)
+    names = [
+        name for name in optuna.study.get_all_study_names(storage)
+        if name != study_name and name.startswith("kbo_")
+    ]
+    # 같은 구장 > 같은 분할 방식 > 나머지 (같은 조건이면 이름순)
+    names.sort(
+        key=lambda name: (
+            not name.startswith(stadium_prefix + "_"),
+            not base_name(name).endswith("_" + split),
+            name,
+        )
+    )
+
+    seeds = []
+    seen = set()
+    for name in names:
+        study = optuna.load_study(study_name=name, storage=storage)
+        trials = [t for t in study.get_trials(deepcopy=False, states=(TrialState.COMPLETE,)) if t.values]
+        trials.sort(key=lambda t: t.values[0], reverse=True)
+        for trial in trials[:top_k]:
+            params = {key: trial.params[key] for key in space if key in trial.params}
+            key = tuple(sorted(params.items()))
+            if key in seen or not _in_space(params, space):
+                continue
+            seen.add(key)
+            seeds.append((name, trial.values[0], params))
+    return seeds
+
+
+def narrow_search_space(space, seed_params, margin=NARROW_MARGIN):
+    """
+    시드 파라미터 주변으로 탐색 공간 축소
+
+    파라미터마다 시드 값의 [최소, 최대] 구간을 전체 범위의 margin 비율만큼
+    (로그 스케일 파라미터는 로그 공간에서) 넓힌 뒤 원래 범위로 자릅니다.
+    """
+    narrowed = {}
+    for name, (kind, low, high, log) in space.items():
+        values = [params[name] for params in seed_params if name in params]
+        if not values:
+            narrowed[name] = (kind, low, high, log)
+            continue
+
+        scale = np.log if log else (lambda v: v)
+        unscale = np.exp if log else (lambda v: v)
+        width = (scale(high) - scale(low)) * margin
+        new_low = max(low, float(unscale(scale(min(values)) - width)))
+        new_high = min(high, float(unscale(scale(max(values)) + width)))
+
+        if kind == "int":
+            new_low, new_high = int(np.floor(new_low)), int(np.ceil(new_high))
+            if new_low == new_high:
+                new_low, new_high = max(low, new_low - 1), min(high, new_high + 1)
+        narrowed[name] = (kind, new_low, new_high, log)
+    return narrowed
+
+
+def make_pruner(name):
+    """
+    Optuna 가지치기(pruner) 생성
+
+    Args:
+        name: "median" | "hyperband" | "none"
+    """
+    if name == "median":
+        # 처음 5회는 비교 기준 확보를 위해 끝까지 실행, 첫 폴드 이후부터 판정
+        return optuna.pruners.MedianPruner(n_startup_trials=5, n_warmup_steps=1)
+    if name == "hyperband":
+        return optuna.pruners.HyperbandPruner(min_resource=1, max_resource=CV_FOLDS)
+    if name == "none":
+        return optuna.pruners.NopPruner()
+    raise ValueError(f"지원하지 않는 pruner: {name}. 가능한 값: {', '.join(PRUNERS)}")
+
+
+def select_pareto_trial(trials, latency_budget_ms=None):
+    """
+    파레토 최적 trial 중 지연 예산 이내에서 CV F1이 가장 높은 trial 선택
+
+    예산 이내 trial이 없으면 가장 빠른 trial을 고릅니다.
+
+    Args:
+        trials: 다목적 study의 파레토 최적 trial (values = [CV F1, 단일 행 지연 ms])
+    """
+    trials = sorted(trials, key=lambda t: t.values[1])
+
+    print(f"\n파레토 최적 trial {len(trials)}개 (지연 순):")
+    print(f"  {'trial':>5} {'CV F1':>8} {'단일(ms)':>9} {'배치(ms)':>9} {'크기(KB)':>9} {'트리':>5} {'깊이':>4}")
+    for t in trials:
+        print(
+            f"  {t.number:>5} {t.values[0]:>8.4f} {t.values[1]:>9.2f} "
+            f"{t.user_attrs.get('batch_ms', float('nan')):>9.2f} {t.user_attrs.get('size_kb', float('nan')):>9.0f} "
+            f"{t.params.get('n_estimators', '-'):>5} {t.params.get('max_depth', '-'):>4}"
+        )
+
+    within = [t for t in trials if latency_budget_ms is None or t.values[1] <= latency_budget_ms]
+    if not within:
+        print(f"\n[지연 예산] {latency_budget_ms}ms 이내 trial이 없어 가장 빠른 trial 선택")
+        return trials[0]
+    best = max(within, key=lambda t: (t.values[0], -t.values[1]))
+    budget = f" (지연 예산 {latency_budget_ms}ms)" if latency_budget_ms is not None else ""
+    print(f"\n선택: trial {best.number}{budget}")
+    return best
+
+
+def tune_with_optuna(
+    X_train,
+    y_train,
+    scale_pos_weight,
+    n_trials=50,
+    n_jobs=None,
+    study_name=None,
+    storage=OPTUNA_STORAGE,
+    pruner="hyperband",
+    trial_jobs=1,
+    early_stopping_rounds=EARLY_STOPPING_ROUNDS,
+    warm_start=False,
+    narrow_space=False,
+    objective="f1",
+    latency_budget_ms=LATENCY_BUDGET_MS,
+):
     """
     Optuna를 사용한 하이퍼파라미터 튜닝
     
+    각 trial은 폴드별로 XGBoost를 조기 종료(폴드 학습 데이터에서 떼어 둔 일부의 logloss 기준,
+    F1을 재는 검증 폴드는 사용하지 않음)하며 학습하고,
+    폴드마다 누적 평균 F1을 보고하여 pruner가 가망 없는 trial을 중간에 중단합니다.
+    study는 SQLite에 저장되므로 중단 후 같은 명령으로 이어서 실행할 수 있고,
+    여러 프로세스가 같은 storage/study_name으로 동시에 trial을 나눠 실행할 수도 있습니다.
+    study 이름에는 학습 데이터/튜닝 설정 지문이 붙으므로, 새 경기가 추가되면 이전 데이터로
+    점수를 매긴 study를 이어서 쓰지 않고 새 study를 시작합니다 (이전 study는 웜 스타트 시드로 사용).
+
+    웜 스타트(warm_start, 기본 꺼짐)를 켜면 새 study의 첫 trial들로 같은 저장소의 다른 study
+    (같은 구장의 이전 실행, 다른 구장)의 상위 파라미터를 실행하고, narrow_space면
+    탐색 공간도 그 주변으로 좁힙니다.
+
+    objective="f1_latency"면 CV F1(최대화)과 단일 행 추론 지연(최소화)의 다목적 study로
+    파레토 최적 trial을 찾고, 그중 지연 예산 이내에서 F1이 가장 높은 trial을 고릅니다.
+    다목적 study는 가지치기를 지원하지 않으므로 pruner는 사용하지 않습니다.
+    
     Args:
         X_train: 학습 피처
         y_train: 학습 타겟
         scale_pos_weight: 클래스 가중치
-        n_trials: 튜닝 시도 횟수
+        n_trials: 목표 trial 수 (완료+가지치기 기준, 이전 실행 포함)
+        n_jobs: XGBoost 내부 스레드 수 (None이면 라이브러리 기본값)
+        study_name: study 이름 접두어 (학습 데이터 지문이 붙음, None이면 저장하지 않는 메모리 study)
+        storage: Optuna storage URL (기본: models/optuna_studies.db)
+        pruner: "hyperband" | "median" | "none"
+        trial_jobs: 프로세스 내 병렬 trial 수
+        early_stopping_rounds: 폴드별 조기 종료 라운드 (0이면 사용 안 함)
+        warm_start: 다른 study의 상위 trial로 시작 (저장소 사용 시)
+        narrow_space: 웜 스타트 시드 주변으로 탐색 공간 축소
+        objective: "f1" | "f1_latency"
+        latency_budget_ms: 다목적 튜닝에서 trial 선택 시 단일 행 추론 지연 예산
         
     Returns:
         dict: 최적 파라미터
     """
     if not OPTUNA_AVAILABLE:
-        print("\\n[오류] Optuna가 설치되지 않았습니다.")
+        print("\n[오류] Optuna가 설치되지 않았습니다.")
         print("설치: pip install optuna")
         return None
+    if objective not in OBJECTIVES:
+        raise ValueError(f"지원하지 않는 objective: {objective}. 가능한 값: {', '.join(OBJECTIVES)}")
+    multi_objective = objective == "f1_latency"
+    if multi_objective:
+        pruner = "none"
         
-    print("\\n" + "=" * 60)
+    # 병렬 trial 간 코어 배분 (모델 스레드 수 미지정 시)
+    if trial_jobs > 1 and n_jobs is None:
+        n_jobs = max(1, (os.cpu_count() or 1) // trial_jobs)
+
+    print("\n" + "=" * 60)
     print("Optuna 하이퍼파라미터 튜닝")
     print("=" * 60)
-    print(f"\\n모델: XGBoost")
-    print(f"시도 횟수: {n_trials}회")
-    print(f"최적화 지표: 5-Fold CV F1 Score")
+    print(f"\n모델: XGBoost")
+    print(f"시도 횟수: {n_trials}회 (병렬 trial {trial_jobs}개, pruner: {pruner})")
+    if multi_objective:
+        print(f"최적화 지표: {CV_FOLDS}-Fold CV F1 Score (최대화) vs 단일 행 추론 지연 (최소화)")
+    else:
+        print(f"최적화 지표: {CV_FOLDS}-Fold CV F1 Score")
     
     # Optuna 로깅 레벨 조정
     optuna.logging.set_verbosity(optuna.logging.WARNING)
+
+    # 폴드별 학습/검증 배열은 모든 trial이 공유
+    folds = make_cv_folds(X_train, y_train)
+    if early_stopping_rounds:
+        # 조기 종료 기준 데이터는 폴드 학습 데이터에서 분리 (검증 폴드는 F1 평가에만 사용)
+        folds = [
+            (*train_test_split(
+                X_fold_train, y_fold_train, test_size=EARLY_STOPPING_FRACTION,
+                random_state=42, stratify=y_fold_train,
+            ), X_fold_valid, y_fold_valid)
+            for X_fold_train, y_fold_train, X_fold_valid, y_fold_valid in folds
+        ]
     
-    def objective(trial):
+    search_space = XGB_SEARCH_SPACE
+
+    def objective_fn(trial):
         params = {
-            "n_estimators": trial.suggest_int("n_estimators", 50, 300),
-            "max_depth": trial.suggest_int("max_depth", 2, 10),
-            "learning_rate": trial.suggest_float("learning_rate", 0.01, 0.3, log=True),
-            "min_child_weight": trial.suggest_int("min_child_weight", 1, 10),
-            "subsample": trial.suggest_float("subsample", 0.6, 1.0),
-            "colsample_bytree": trial.suggest_float("colsample_bytree", 0.6, 1.0),
-            "gamma": trial.suggest_float("gamma", 0, 5),
-            "reg_alpha": trial.suggest_float("reg_alpha", 0, 2),
-            "reg_lambda": trial.suggest_float("reg_lambda", 0, 2),
+            **suggest_params(trial, search_space),
             "scale_pos_weight": scale_pos_weight,
             "random_state": 42,
             "eval_metric": "logloss",
+            "n_jobs": n_jobs,
         }
+        if early_stopping_rounds:
+            params["early_stopping_rounds"] = early_stopping_rounds
         
-        model = XGBClassifier(**params)
-        
-        # 5-Fold CV
-        cv = StratifiedKFold(n_splits=5, shuffle=True, random_state=42)
-        scores = cross_val_score(model, X_train, y_train, cv=cv, scoring="f1")
-        
-        return scores.mean()
+        # 폴드별 학습 + 중간 보고
+        scores = []
+        best_iterations = []
+        for fold, fold_arrays in enumerate(folds):
+            model = XGBClassifier(**params)
+            if early_stopping_rounds:
+                X_fold_train, X_fold_stop, y_fold_train, y_fold_stop, X_fold_valid, y_fold_valid = fold_arrays
+                model.fit(
+                    X_fold_train, y_fold_train,
+                    eval_set=[(X_fold_stop, y_fold_stop)], verbose=False,
+                )
+                best_iterations.append(model.best_iteration + 1)
+            else:
+                X_fold_train, y_fold_train, X_fold_valid, y_fold_valid = fold_arrays
+                model.fit(X_fold_train, y_fold_train)
+            scores.append(f1_score(y_fold_valid, model.predict(X_fold_valid), zero_division=0))
+
+            # 다목적 study는 중간 보고/가지치기 미지원
+            if not multi_objective:
+                trial.report(float(np.mean(scores)), fold)
+                if trial.should_prune():
+                    raise optuna.TrialPruned()
+
+        if best_iterations:
+            trial.set_user_attr("n_estimators_early_stopped", int(np.mean(best_iterations)))
+        if not multi_objective:
+            return float(np.mean(scores))
+
+        # 마지막 폴드 모델로 추론 비용 측정
+        cost = measure_inference_cost(model, pd.DataFrame(X_fold_valid, columns=X_train.columns))
+        trial.set_user_attr("batch_ms", cost["batch_ms"])
+        trial.set_user_attr("size_kb", cost["size_kb"])
+        return float(np.mean(scores)), cost["single_ms"]
     
-    # 튜닝 실행
-    sampler = TPESampler(seed=42)
-    study = optuna.create_study(direction="maximize", sampler=sampler)
-    
-    print("\\n튜닝 진행 중...")
-    study.optimize(objective, n_trials=n_trials, show_progress_bar=True)
+    # 튜닝 실행 (같은 데이터/설정의 저장된 study가 있으면 이어서 실행)
+    if study_name is not None:
+        fingerprint = combine_hash(
+            X=hash_dataframe(X_train),
+            y=hash_dataframe(y_train.to_frame()),
+            feature_version=FEATURE_VERSION,
+            cv_folds=CV_FOLDS,
+            early_stopping=[early_stopping_rounds, EARLY_STOPPING_FRACTION],
+            search_space=XGB_SEARCH_SPACE,
+        )[:STUDY_FINGERPRINT_LENGTH]
+        study_name = f"{study_name}{STUDY_FINGERPRINT_SEP}{fingerprint}"
+        print(f"study: {study_name} ({storage})")
+    sampler = TPESampler(seed=42, constant_liar=True)
+    if study_name is not None and storage is not None and storage.startswith("sqlite:///"):
+        Path(storage[len("sqlite:///"):]).parent.mkdir(parents=True, exist_ok=True)
+    study = optuna.create_study(
+        study_name=study_name,
+        storage=storage if study_name is not None else None,
+        directions=["maximize", "minimize"] if multi_objective else ["maximize"],
+        sampler=sampler,
+        pruner=make_pruner(pruner),
+        load_if_exists=True,
+    )
+
+    finished_states = (TrialState.COMPLETE, TrialState.PRUNED)
+    n_done = len(study.get_trials(deepcopy=False, states=finished_states))
+    if n_done:
+        print(f"\n저장된 study에서 이어서 실행: 완료된 trial {n_done}개")
+
+    # 웜 스타트: 다른 study의 상위 파라미터를 먼저 실행
+    if warm_start and study_name is not None and storage is not None:
+        seeds = collect_seed_params(study_name, storage)
+        if seeds:
+            if narrow_space:
+                search_space = narrow_search_space(XGB_SEARCH_SPACE, [params for _, _, params in seeds])
+                print("\n탐색 공간 축소 (시드 주변):")
+                for name, (_, low, high, _) in search_space.items():
+                    print(f"  {name}: {low:g} ~ {high:g}")
+            if n_done == 0:
+                # 완료 목표 수의 절반까지만 시드로 사용
+                seeds = seeds[: max(1, n_trials // 2)]
+                for _, _, params in seeds:
+                    study.enqueue_trial(params, skip_if_exists=True)
+                sources = sorted({source for source, _, _ in seeds})
+                print(f"\n웜 스타트: 시드 {len(seeds)}개 ({', '.join(sources)})")
+
+    print("\n튜닝 진행 중...")
+    start_time = time.perf_counter()
+    if n_done < n_trials:
+        study.optimize(
+            objective_fn,
+            n_trials=n_trials - n_done,
+            n_jobs=trial_jobs,
+            callbacks=[MaxTrialsCallback(n_trials, states=finished_states)],
+            show_progress_bar=True,
+        )
+    elapsed = time.perf_counter() - start_time
+
+    n_complete = len(study.get_trials(deepcopy=False, states=(TrialState.COMPLETE,)))
+    n_pruned = len(study.get_trials(deepcopy=False, states=(TrialState.PRUNED,)))
     
-    print(f"\\n{'='*60}")
+    print(f"\n{'='*60}")
     print("튜닝 결과")
     print("=" * 60)
-    print(f"\\n최고 CV F1 Score: {study.best_value:.4f}")
-    print(f"\\n최적 파라미터:")
-    for key, value in study.best_params.items():
+    print(f"\n소요 시간: {elapsed:.1f}초 (완료 {n_complete}개, 가지치기 {n_pruned}개)")
+
+    if multi_objective:
+        best_trial = select_pareto_trial(study.best_trials, latency_budget_ms)
+    else:
+        best_trial = study.best_trial
+    print(f"\n최고 CV F1 Score: {best_trial.values[0]:.4f}")
+    print(f"\n최적 파라미터:")
+    for key, value in best_trial.params.items():
         if isinstance(value, float):
             print(f"  {key}: {value:.4f}")
         else:
             print(f"  {key}: {value}")
     
     # 최적 파라미터에 고정값 추가
-    best_params = study.best_params.copy()
+    best_params = best_trial.params.copy()
+    # 조기 종료를 사용했다면 폴드 평균 최적 반복 수로 전체 학습
+    early_stopped = best_trial.user_attrs.get("n_estimators_early_stopped")
+    if early_stopped:
+        print(f"\n조기 종료 기준 n_estimators: {best_params['n_estimators']} -> {early_stopped}")
+        best_params["n_estimators"] = early_stopped
     best_params["scale_pos_weight"] = scale_pos_weight
     best_params["random_state"] = 42
     best_params["eval_metric"] = "logloss"
+    best_params["n_jobs"] = n_jobs
     
     return best_params
 
 
-def train_with_tuned_params(X_train, X_test, y_train, y_test, best_params, feature_cols, stadium_name):
-    """최적 파라미터로 모델 재학습 및 평가"""
-    print("\\n" + "=" * 60)
+def train_with_tuned_params(
+    X_train, X_test, y_train, y_test, best_params, feature_cols, stadium_name, folds=None, n_jobs=None
+):
+    """
+    최적 파라미터로 모델 재학습 및 평가
+
+    Args:
+        folds: 전체 데이터 교차 검증 폴드 (make_cv_folds 결과, None이면 학습+테스트로 생성)
+        n_jobs: 교차 검증에 사용할 코어 수
+    """
+    print("\n" + "=" * 60)
     print(f"최적 파라미터로 재학습 - {stadium_name}")
     print("=" * 60)
     
@@ -526,68 +931,31 @@ def train_with_tuned_params(X_train, X_test, y_train, y_test, best_params, featu
     f1 = f1_score(y_test, y_pred)
     roc_auc = roc_auc_score(y_test, y_prob) if sum(y_test) > 0 else 0.0
     
-    print(f"\\n[Tuned XGBoost 결과]")
+    print(f"\n[Tuned XGBoost 결과]")
     print(f"Accuracy: {accuracy:.4f}")
     print(f"F1 Score: {f1:.4f}")
     print(f"ROC-AUC: {roc_auc:.4f}")
     
-    print(f"\\nClassification Report:")
+    print(f"\nClassification Report:")
     print(classification_report(y_test, y_pred, target_names=["정상", "취소"]))
     
     print("Confusion Matrix:")
     print(confusion_matrix(y_test, y_pred))
     
-    # 교차 검증
-    cv = StratifiedKFold(n_splits=5, shuffle=True, random_state=42)
-    cv_scores = cross_val_score(model, pd.concat([X_train, X_test]), 
-                                 pd.concat([y_train, y_test]), cv=cv, scoring="f1")
-    print(f"\\n5-Fold CV F1: {cv_scores.mean():.4f} (+/- {cv_scores.std()*2:.4f})")
+    # 교차 검증 (사전 계산 폴드, 병렬)
+    if folds is None:
+        folds = make_cv_folds(pd.concat([X_train, X_test]), pd.concat([y_train, y_test]))
+    print_cv_scores(cross_validate_folds(model, folds, n_jobs=n_jobs))
+
+    # 추론 지연/크기
+    cost = measure_inference_cost(model, X_test)
+    print_inference_cost(cost)
     
-    return model, f1
+    return model, f1, cost
 
 
 # ============================================
-# 5. 피처 중요도 분석
-# ============================================
-def analyze_feature_importance(model, feature_cols, model_name, stadium_id, stadium_name):
-    """피처 중요도 분석 및 시각화"""
-    print("\n" + "=" * 60)
-    print(f"5. 피처 중요도 분석 - {stadium_name}")
-    print("=" * 60)
-
-    # 피처 중요도 추출
-    if hasattr(model, "feature_importances_"):
-        importance = model.feature_importances_
-    else:
-        importance = model.coef_[0]
-
-    # 데이터프레임 생성
-    feat_imp = pd.DataFrame(
-        {"feature": feature_cols, "importance": importance}
-    ).sort_values("importance", ascending=False)
-
-    print(f"\n[{model_name} 피처 중요도]")
-    print(feat_imp.to_string(index=False))
-
-    # 시각화
-    plt.figure(figsize=(10, 6))
-    sns.barplot(data=feat_imp, x="importance", y="feature", palette="viridis")
-    plt.title(f"{stadium_name} - {model_name} 피처 중요도")
-    plt.xlabel("중요도")
-    plt.ylabel("피처")
-    plt.tight_layout()
-
-    fig_path = MODELS_DIR / f"feature_importance_{stadium_id}.png"
-    fig_path.parent.mkdir(parents=True, exist_ok=True)
-    plt.savefig(fig_path, dpi=150, bbox_inches="tight")
-    plt.close()
-    print(f"\n[저장] {fig_path}")
-
-    return feat_imp
-
-
-# ============================================
-# 6. 예측 함수
+# 4. 예측 함수
 # ============================================
 def create_prediction_function(model, feature_cols):
     """실제 사용을 위한 예측 함수 생성"""
@@ -628,44 +996,25 @@ def create_prediction_function(model, feature_cols):
         --------
         dict: 예측 결과 (확률, 판정)
         """
-        # 파생 피처 자동 계산
-        is_weekend = 1 if dayofweek >= 5 else 0
-        is_rainy_season = 1 if month in [7, 8] else 0
-        precip_intensity = daily_precip_sum / max(daily_precip_hours, 1)
-        humidity_precip_interaction = pre_game_humidity * pre_game_precip / 100
-        cumulative_precip_2days = daily_precip_sum + prev_day_precip
-        ground_condition_score = (
-            prev_day_precip * 0.5 +
-            pre_game_precip * 0.3 +
-            (pre_game_humidity - 50) * 0.02
-        )
-
-        input_data = pd.DataFrame(
-            [
-                [
-                    daily_precip_sum,
-                    daily_precip_hours,
-                    pre_game_precip,
-                    pre_game_humidity,
-                    pre_game_temp,
-                    pre_game_wind,
-                    prev_day_precip,
-                    daily_wind_max,
-                    daily_temp_mean,
-                    month,
-                    dayofweek,
-                    # 신규 파생 피처
-                    is_weekend,
-                    is_rainy_season,
-                    game_hour,
-                    precip_intensity,
-                    humidity_precip_interaction,
-                    cumulative_precip_2days,
-                    ground_condition_score,
-                ]
-            ],
-            columns=feature_cols,
+        # 파생 피처 자동 계산 (학습/서빙 공통 모듈)
+        features = compute_features(
+            {
+                "daily_precip_sum": daily_precip_sum,
+                "daily_precip_hours": daily_precip_hours,
+                "pre_game_precip": pre_game_precip,
+                "pre_game_humidity": pre_game_humidity,
+                "pre_game_temp": pre_game_temp,
+                "pre_game_wind": pre_game_wind,
+                "prev_day_precip": prev_day_precip,
+                "daily_wind_max": daily_wind_max,
+                "daily_temp_mean": daily_temp_mean,
+                "month": month,
+                "dayofweek": dayofweek,
+                "game_hour": game_hour,
+            },
+            feature_cols,
         )
+        input_data = pd.DataFrame(features)
 
         prob = model.predict_proba(input_data)[0][1]
         prediction = "취소 가능성 높음" if prob >= 0.5 else "정상 진행 예상"
@@ -680,10 +1029,17 @@ def create_prediction_function(model, feature_cols):
 
 
 # ============================================
-# 7. 모델 저장
+# 5. 모델 저장
 # ============================================
-def save_model(model, feature_cols, stadium_id, stadium_name):
-    """학습된 모델 저장"""
+def save_model(model, feature_cols, stadium_id, stadium_name, model_name=None, data_through=None, f1=None):
+    """
+    학습된 모델 저장
+
+    Args:
+        model_name: 모델 종류 (XGBoost, LightGBM 등)
+        data_through: 학습에 사용한 마지막 경기 날짜 (증분 학습 기준)
+        f1: 모델 선택 시 검증 F1 (증분 학습 holdout F1)
+    """
     paths = get_data_paths(stadium_id)
     model_path = paths["model"]
     model_path.parent.mkdir(parents=True, exist_ok=True)
@@ -693,6 +1049,10 @@ def save_model(model, feature_cols, stadium_id, stadium_name):
         "feature_cols": feature_cols,
         "stadium_id": stadium_id,
         "stadium_name": stadium_name,
+        "model_name": model_name,
+        "data_through": data_through,
+        "feature_version": FEATURE_VERSION,
+        "f1": f1,
     }
 
     with open(model_path, "wb") as f:
@@ -703,10 +1063,242 @@ def save_model(model, feature_cols, stadium_id, stadium_name):
     return model_path
 
 
+# ============================================
+# 증분 학습
+# ============================================
+def continue_training(model, X_new, y_new, rounds=INCREMENTAL_ROUNDS):
+    """
+    기존 모델에 새 경기로 이어서 학습 (기존 모델 객체는 변경하지 않음)
+
+    - XGBoost: 기존 부스터에서 이어서 부스팅 (xgb_model=, 학습률은 INCREMENTAL_LEARNING_RATE_SCALE배)
+    - LightGBM: 기존 부스터에서 이어서 부스팅 (init_model=, 학습률 동일 배율)
+    - RandomForest: 새 경기로 학습한 트리 추가 (warm_start)
+
+    부스팅 모델은 학습 후 learning_rate/n_estimators를 원래 값으로 되돌립니다
+    (저장된 모델의 파라미터가 다음 증분 학습의 기준이므로, 되돌리지 않으면 갱신마다 학습률이 계속 줄어듦).
+
+    Returns:
+        이어서 학습한 모델 (지원하지 않는 모델이면 None)
+    """
+    if isinstance(model, (XGBClassifier, LGBMClassifier)):
+        params = model.get_params()
+        base = {"learning_rate": params["learning_rate"], "n_estimators": params["n_estimators"]}
+        updated = clone(model).set_params(
+            n_estimators=rounds, learning_rate=base["learning_rate"] * INCREMENTAL_LEARNING_RATE_SCALE
+        )
+        if isinstance(model, XGBClassifier):
+            updated.set_params(early_stopping_rounds=None)
+            updated.fit(X_new, y_new, xgb_model=model.get_booster())
+        else:
+            updated.fit(X_new, y_new, init_model=model.booster_)
+        updated.set_params(**base)
+    elif isinstance(model, RandomForestClassifier):
+        updated = copy.deepcopy(model)
+        updated.set_params(warm_start=True, n_estimators=len(model.estimators_) + rounds)
+        updated.fit(X_new, y_new)
+        updated.set_params(warm_start=False)
+    else:
+        return None
+    return updated
+
+
+def update_model_incrementally(stadium_id, stadium_name, X, y, feature_cols, df_dates):
+    """
+    저장된 모델에 마지막 학습 이후 경기만 이어서 학습 (증분 학습)
+
+    새 경기를 날짜순으로 나눠 앞부분으로 이어서 학습하고, 최근 경기(holdout)의
+    log loss를 기존 모델과 비교합니다. holdout 경기는 다음 갱신 때 학습에 사용됩니다.
+
+    Returns:
+        dict: {"model", "model_name", "data_through", "updated", "metrics"}
+              (updated=False면 새 경기가 부족해 기존 모델 유지)
+              기존 모델을 쓸 수 없거나 검증 성능이 떨어지면 None (전체 재학습 필요)
+    """
+    print("\n" + "=" * 60)
+    print(f"3. 증분 학습 - {stadium_name}")
+    print("=" * 60)
+
+    model_path = get_data_paths(stadium_id)["model"]
+    if not model_path.exists():
+        print("\n[증분 학습] 저장된 모델이 없습니다.")
+        return None
+
+    with open(model_path, "rb") as f:
+        model_data = pickle.load(f)
+
+    model = model_data["model"]
+    model_name = model_data.get("model_name")
+    data_through = model_data.get("data_through")
+    if data_through is None or model_data["feature_cols"] != feature_cols:
+        print("\n[증분 학습] 기존 모델에 학습 범위 기록이 없거나 피처가 다릅니다.")
+        return None
+
+    dates = pd.to_datetime(df_dates)
+    new_index = dates[dates > pd.Timestamp(data_through)].sort_values(kind="stable").index
+    print(f"\n기존 모델: {model_name} ({data_through}까지 학습)")
+    print(f"새 경기: {len(new_index)}개 (취소: {int(y.loc[new_index].sum())}개)")
+
+    # 기존 모델 유지 시 저장 당시 F1 (이전 버전 모델 파일에는 없음)
+    unchanged = {
+        "model": model, "model_name": model_name, "data_through": data_through,
+        "updated": False, "metrics": {"f1": model_data.get("f1", float("nan"))},
+    }
+    if len(new_index) < INCREMENTAL_MIN_NEW_GAMES:
+        print(f"\n[증분 학습] 새 경기가 {INCREMENTAL_MIN_NEW_GAMES}개 미만이라 기존 모델을 유지합니다.")
+        return unchanged
+
+    # 최근 경기를 holdout으로 남기고 앞부분으로 이어서 학습
+    # (날짜 경계로 나눠 더블헤더가 학습/holdout에 걸치지 않게 함: data_through 이후는 모두 다음 갱신에 포함)
+    n_holdout = max(1, round(len(new_index) * INCREMENTAL_HOLDOUT_FRACTION))
+    holdout_start = dates.loc[new_index[-n_holdout]]
+    is_holdout = dates.loc[new_index] >= holdout_start
+    train_index, holdout_index = new_index[~is_holdout.to_numpy()], new_index[is_holdout.to_numpy()]
+    if y.loc[train_index].nunique() < 2:
+        print("\n[증분 학습] 새 학습 경기에 취소/정상 경기가 모두 있어야 합니다. 기존 모델을 유지합니다.")
+        return unchanged
+
+    start = time.perf_counter()
+    updated = continue_training(model, X.loc[train_index], y.loc[train_index])
+    if updated is None:
+        print(f"\n[증분 학습] 이어서 학습할 수 없는 모델입니다: {type(model).__name__}")
+        return None
+    elapsed = time.perf_counter() - start
+
+    X_holdout, y_holdout = X.loc[holdout_index], y.loc[holdout_index]
+    previous_loss = log_loss(y_holdout, model.predict_proba(X_holdout)[:, 1], labels=[0, 1])
+    updated_loss = log_loss(y_holdout, updated.predict_proba(X_holdout)[:, 1], labels=[0, 1])
+    updated_f1 = f1_score(y_holdout, updated.predict(X_holdout), zero_division=0)
+
+    print(f"\n이어서 학습: {len(train_index)}개 경기, {elapsed:.2f}초")
+    print(f"Holdout ({len(holdout_index)}개, {dates.loc[holdout_index].min():%Y-%m-%d} 이후)")
+    print(f"  기존 모델 log loss: {previous_loss:.4f}")
+    print(f"  갱신 모델 log loss: {updated_loss:.4f} (F1: {updated_f1:.4f})")
+
+    if updated_loss > previous_loss * (1 + INCREMENTAL_TOLERANCE):
+        print(f"\n[증분 학습] 검증 성능 하락 (허용 {INCREMENTAL_TOLERANCE:.0%} 초과)")
+        return None
+
+    return {
+        "model": updated,
+        "model_name": model_name,
+        "data_through": dates.loc[train_index].max().strftime("%Y-%m-%d"),
+        "updated": True,
+        "metrics": {"f1": updated_f1, "holdout_log_loss": updated_loss, "previous_log_loss": previous_loss},
+    }
+
+
+# ============================================
+# 학습 캐시
+# ============================================
+def feature_cache_key(df):
+    """전처리 결과 캐시 키 (학습 데이터 내용 + 피처 정의 코드)"""
+    # 피처 모듈은 파일 전체 해시 (보조 함수/상수 변경도 반영)
+    return combine_hash(
+        data=hash_dataframe(df),
+        code=hash_sources(preprocess_data),
+        features_module=hash_file(shared_features.__file__),
+        feature_version=FEATURE_VERSION,
+    )
+
+
+def training_cache_keys(
+    df, temporal_split, tune, n_trials, tune_options, incremental=False, latency_budget_ms=None
+):
+    """
+    학습 캐시 키 계산
+
+    Returns:
+        tuple: (피처 키, 학습 키, 학습 키 구성 요소)
+    """
+    features_key = feature_cache_key(df)
+    parts = {
+        "features": features_key,
+        "code": hash_sources(
+            train_stadium_model,
+            split_train_test,
+            make_cv_folds,
+            _fit_and_score_fold,
+            cross_validate_folds,
+            build_candidate_models,
+            train_and_evaluate,
+            suggest_params,
+            collect_seed_params,
+            narrow_search_space,
+            make_pruner,
+            measure_inference_cost,
+            select_best_model,
+            select_pareto_trial,
+            tune_with_optuna,
+            train_with_tuned_params,
+            continue_training,
+            update_model_incrementally,
+            create_prediction_function,
+            save_model,
+        ),
+        "constants": {
+            "cv_folds": CV_FOLDS,
+            "search_space": XGB_SEARCH_SPACE,
+            "early_stopping_rounds": EARLY_STOPPING_ROUNDS,
+            "seed_top_k": SEED_TOP_K,
+            "narrow_margin": NARROW_MARGIN,
+            "incremental": [
+                INCREMENTAL_ROUNDS,
+                INCREMENTAL_LEARNING_RATE_SCALE,
+                INCREMENTAL_MIN_NEW_GAMES,
+                INCREMENTAL_HOLDOUT_FRACTION,
+                INCREMENTAL_TOLERANCE,
+            ],
+        },
+        # 병렬 실행 수는 결과에 영향이 없으므로 제외
+        "options": {
+            "temporal_split": temporal_split,
+            "tune": tune,
+            "incremental": incremental,
+            "latency_budget_ms": latency_budget_ms,
+            **(
+                {"n_trials": n_trials, **{k: v for k, v in tune_options.items() if k != "trial_jobs"}}
+                if tune
+                else {}
+            ),
+        },
+        "versions": library_versions(),
+    }
+    return features_key, combine_hash(**parts), parts
+
+
+def load_cached_result(cached, stadium_name):
+    """캐시된 학습 결과로 모델/예측 함수 복원"""
+    with open(cached["model_path"], "rb") as f:
+        model_data = pickle.load(f)
+
+    print(f"\n[캐시] {stadium_name}: 학습 데이터/피처/학습 코드/설정/라이브러리 변경 없음 - 기존 모델 재사용")
+    print(f"  모델: {cached['model_path']} ({cached['best_model_name']}, F1 {cached['best_f1']:.4f})")
+
+    return {
+        **cached,
+        "model": model_data["model"],
+        "feature_cols": model_data["feature_cols"],
+        "predict_fn": create_prediction_function(model_data["model"], model_data["feature_cols"]),
+        "model_path": Path(cached["model_path"]),
+        "artifacts": [Path(path) for path in cached["artifacts"]],
+        "cached": True,
+    }
+
+
 # ============================================
 # 구장별 모델 학습
 # ============================================
-def train_stadium_model(stadium_id, temporal_split=False, tune=False, n_trials=50):
+def train_stadium_model(
+    stadium_id,
+    temporal_split=False,
+    tune=False,
+    n_trials=50,
+    n_jobs=None,
+    use_cache=True,
+    incremental=False,
+    latency_budget_ms=LATENCY_BUDGET_MS,
+    **tune_options,
+):
     """
     특정 구장의 모델 학습
     
@@ -715,10 +1307,15 @@ def train_stadium_model(stadium_id, temporal_split=False, tune=False, n_trials=5
         temporal_split: True면 2025년 데이터를 테스트셋으로 사용
         tune: True면 Optuna로 하이퍼파라미터 튜닝
         n_trials: 튜닝 시도 횟수
+        n_jobs: 모델 내부 스레드 수 (None이면 라이브러리 기본값)
+        use_cache: True면 입력/코드/설정이 그대로일 때 학습을 건너뛰고 기존 모델 재사용
+        incremental: True면 저장된 모델에 새 경기만 이어서 학습
+                     (검증 성능이 떨어지거나 이어서 학습할 수 없으면 전체 재학습)
+        latency_budget_ms: 모델/trial 선택 시 단일 행 추론 지연 예산 (ms, None이면 제한 없음)
+        **tune_options: tune_with_optuna() 인자 (storage, pruner, trial_jobs, warm_start, objective 등)
     """
     stadium_config = get_stadium_config(stadium_id)
     stadium_name = stadium_config["name"]
-    paths = get_data_paths(stadium_id)
 
     print("\n" + "=" * 60)
     print(f"KBO {stadium_name} 우천취소 예측 모델")
@@ -726,25 +1323,41 @@ def train_stadium_model(stadium_id, temporal_split=False, tune=False, n_trials=5
         print("[Temporal Validation] 2019-2024 학습, 2025 테스트")
     if tune:
         print(f"[Optuna Tuning] {n_trials}회 시도")
+    if incremental:
+        print("[Incremental] 저장된 모델에 새 경기만 이어서 학습")
     print("=" * 60)
 
     # 데이터 파일 확인
-    data_file = paths["with_weather"]
-    if not data_file.exists():
-        print(f"\n[오류] {data_file} 파일이 없습니다!")
+    if not dataset_exists(stadium_id, "with_weather"):
+        print(f"\n[오류] {stadium_id} 날씨 포함 데이터가 없습니다!")
         print(f"먼저 다음 명령을 실행하세요:")
         print(f"  1. python cancel_crawler.py --stadium {stadium_id}")
         print(f"  2. python weather_collector_openmeteo.py --stadium {stadium_id}")
         return None
 
     # 1. 데이터 로드
-    df = load_and_explore_data(data_file, stadium_name)
-
-    # 2. EDA
-    df_rain = perform_eda(df, stadium_id, stadium_name)
-
-    # 3. 전처리
-    X, y, feature_cols = preprocess_data(df, stadium_name)
+    df = load_and_explore_data(stadium_id, stadium_name)
+
+    # 학습 캐시 확인 (변경 없으면 기존 모델 재사용)
+    cache = TrainingCache(stadium_id) if use_cache else None
+    if cache is not None:
+        features_key, training_key, key_parts = training_cache_keys(
+            df, temporal_split, tune, n_trials, tune_options,
+            incremental=incremental, latency_budget_ms=latency_budget_ms,
+        )
+        cached = cache.get_result(training_key)
+        if cached is not None:
+            return load_cached_result(cached, stadium_name)
+
+    # 2. 전처리 (피처 키가 같으면 캐시된 행렬 재사용)
+    cached_features = cache.get_features(features_key) if cache is not None else None
+    if cached_features is not None:
+        X, y, feature_cols = cached_features
+        print(f"\n[캐시] 전처리 결과 재사용: X={X.shape}, 취소={int(y.sum())}개")
+    else:
+        X, y, feature_cols = preprocess_data(df, stadium_name)
+        if cache is not None:
+            cache.put_features(features_key, X, y, feature_cols)
     
     # 날짜 시리즈 추출 (temporal split 용)
     df_model = df[df["reason"].isin(["우천취소", "정상진행"])].copy()
@@ -755,20 +1368,25 @@ def train_stadium_model(stadium_id, temporal_split=False, tune=False, n_trials=5
         print(f"\n[스킵] {stadium_name}: 우천취소 경기가 {sum(y)}개로 너무 적습니다.")
         return None
 
-    # 4. 모델 학습
-    if tune:
+    # 3. 모델 학습
+    incremental_result = None
+    if incremental:
+        incremental_result = update_model_incrementally(
+            stadium_id, stadium_name, X, y, feature_cols, df_dates
+        )
+        if incremental_result is None:
+            print("\n[증분 학습] 전체 재학습으로 전환합니다.")
+
+    if incremental_result is not None:
+        best_model = incremental_result["model"]
+        best_model_name = incremental_result["model_name"]
+        data_through = incremental_result["data_through"]
+        # 갱신 시 holdout F1, 유지 시 기존 모델의 F1
+        model_metrics = {best_model_name: incremental_result["metrics"]}
+    elif tune:
         # Optuna 튜닝 플로우
         # 데이터 분할 먼저 수행
-        if temporal_split and df_dates is not None:
-            years = pd.to_datetime(df_dates).dt.year
-            train_mask = years < 2025
-            test_mask = years >= 2025
-            X_train, X_test = X[train_mask], X[test_mask]
-            y_train, y_test = y[train_mask], y[test_mask]
-        else:
-            X_train, X_test, y_train, y_test = train_test_split(
-                X, y, test_size=0.2, random_state=42, stratify=y
-            )
+        X_train, X_test, y_train, y_test = split_train_test(X, y, df_dates, temporal_split)
         
         # 클래스 가중치 계산
         n_neg = len(y_train[y_train == 0])
@@ -776,40 +1394,58 @@ def train_stadium_model(stadium_id, temporal_split=False, tune=False, n_trials=5
         scale_pos_weight = n_neg / n_pos
         
         # Optuna 튜닝
-        best_params = tune_with_optuna(X_train, y_train, scale_pos_weight, n_trials=n_trials)
+        # 구장/분할 방식별 study (같은 명령으로 재실행하면 이어서 튜닝)
+        study_name = f"kbo_{stadium_id}_{'temporal' if temporal_split else 'random'}"
+        if tune_options.get("objective") == "f1_latency":
+            study_name += LATENCY_STUDY_SUFFIX
+        best_params = tune_with_optuna(
+            X_train, y_train, scale_pos_weight, n_trials=n_trials, n_jobs=n_jobs,
+            study_name=study_name, latency_budget_ms=latency_budget_ms, **tune_options,
+        )
         
         if best_params is None:
             return None
         
         # 최적 파라미터로 재학습
-        best_model, best_f1 = train_with_tuned_params(
-            X_train, X_test, y_train, y_test, best_params, feature_cols, stadium_name
+        best_model, best_f1, cost = train_with_tuned_params(
+            X_train, X_test, y_train, y_test, best_params, feature_cols, stadium_name,
+            folds=make_cv_folds(X, y), n_jobs=n_jobs,
         )
+        if latency_budget_ms is not None and cost["single_ms"] > latency_budget_ms:
+            print(f"\n[지연 예산] 튜닝 모델 단일 행 지연 {cost['single_ms']:.2f}ms > {latency_budget_ms}ms "
+                  f"(--objective f1_latency로 지연을 함께 최적화하세요)")
         best_model_name = "Tuned_XGBoost"
-        
-        # 5. 피처 중요도
-        feat_imp = analyze_feature_importance(
-            best_model, feature_cols, best_model_name, stadium_id, stadium_name
-        )
+        model_metrics = {best_model_name: {"f1": best_f1, **cost}}
+        data_through = pd.to_datetime(df_dates.loc[X_train.index]).max().strftime("%Y-%m-%d")
     else:
         # 기존 플로우
         results, best_model, best_model_name, X_test, y_test = train_and_evaluate(
-            X, y, feature_cols, stadium_name, df_dates=df_dates, temporal_split=temporal_split
+            X, y, feature_cols, stadium_name, df_dates=df_dates, temporal_split=temporal_split,
+            n_jobs=n_jobs, latency_budget_ms=latency_budget_ms,
         )
 
         if best_model is None:
             return None
 
-        # 5. 피처 중요도
-        feat_imp = analyze_feature_importance(
-            best_model, feature_cols, best_model_name, stadium_id, stadium_name
-        )
+        # 모델 객체를 제외한 모델별 지표 (요약/프로세스 간 전달용)
+        model_metrics = {
+            name: {key: value for key, value in metrics.items() if key != "model"}
+            for name, metrics in results.items()
+        }
+
+        # 테스트셋을 제외한 실제 학습 경기의 마지막 날짜 (증분 학습 기준)
+        train_index = X.index.difference(X_test.index)
+        data_through = pd.to_datetime(df_dates.loc[train_index]).max().strftime("%Y-%m-%d")
 
-    # 6. 예측 함수 생성
+    # 4. 예측 함수 생성
     predict_fn = create_prediction_function(best_model, feature_cols)
 
-    # 7. 모델 저장
-    model_path = save_model(best_model, feature_cols, stadium_id, stadium_name)
+    # 5. 모델 저장
+    model_path = save_model(
+        best_model, feature_cols, stadium_id, stadium_name,
+        model_name=best_model_name, data_through=data_through,
+        f1=model_metrics[best_model_name]["f1"],
+    )
 
     # 예측 테스트
     print("\n" + "=" * 60)
@@ -832,17 +1468,98 @@ def train_stadium_model(stadium_id, temporal_split=False, tune=False, n_trials=5
 
     print(f"\n{stadium_name} 모델 학습 완료!")
 
+    # 학습 산출물 (그래프는 model_report.py가 별도로 생성)
+    artifacts = [model_path]
+
+    summary = {
+        "model_path": model_path,
+        "best_model_name": best_model_name,
+        "best_f1": model_metrics[best_model_name]["f1"],
+        "results": model_metrics,
+        "artifacts": artifacts,
+    }
+    if cache is not None:
+        cache.put_result(training_key, key_parts, summary)
+
     return {
+        **summary,
         "model": best_model,
         "feature_cols": feature_cols,
         "predict_fn": predict_fn,
-        "model_path": model_path,
-        "best_model_name": best_model_name,
+        "cached": False,
+    }
+
+
+def plan_parallel_training(n_stadiums, jobs=None, cpu_count=None):
+    """
+    병렬 학습 코어 배분
+
+    전체 코어를 (프로세스 수 x 프로세스당 모델 스레드 수)로 나누어
+    프로세스와 모델 내부 스레드(n_jobs/nthread)가 코어를 초과 점유하지 않도록 합니다.
+
+    Args:
+        n_stadiums: 학습할 구장 수
+        jobs: 프로세스 수 (None 또는 0이면 코어 수와 구장 수 중 작은 값)
+        cpu_count: 전체 코어 수 (기본: os.cpu_count())
+
+    Returns:
+        tuple: (프로세스 수, 프로세스당 스레드 수)
+    """
+    cpu_count = cpu_count or os.cpu_count() or 1
+    workers = max(1, min(n_stadiums, jobs or cpu_count, cpu_count))
+    return workers, max(1, cpu_count // workers)
+
+
+def _train_stadium_worker(stadium_id, n_threads, train_kwargs):
+    """
+    병렬 학습 작업 (하위 프로세스)
+
+    학습 출력은 구장별 로그 파일에 저장하고, 프로세스 간 전달 가능한 요약만 반환합니다.
+    """
+    buffer = io.StringIO()
+    error = None
+    result = None
+    start = time.perf_counter()
+
+    # BLAS/OpenMP 스레드 풀도 배분된 스레드 수로 제한
+    with threadpool_limits(limits=n_threads), redirect_stdout(buffer):
+        try:
+            result = train_stadium_model(stadium_id, n_jobs=n_threads, **train_kwargs)
+        except Exception:
+            error = traceback.format_exc()
+            print(error)
+
+    log_path = TRAINING_LOG_DIR / f"train_{stadium_id}.log"
+    log_path.parent.mkdir(parents=True, exist_ok=True)
+    log_path.write_text(buffer.getvalue(), encoding="utf-8")
+
+    summary = None
+    if result is not None:
+        summary = {
+            key: result[key]
+            for key in ("model_path", "best_model_name", "best_f1", "results", "artifacts", "cached")
+        }
+    return {
+        "result": summary,
+        "error": error,
+        "elapsed": time.perf_counter() - start,
+        "log_path": log_path,
     }
 
 
-def train_all_stadiums(outdoor_only=True):
-    """모든 구장 모델 학습"""
+def train_all_stadiums(outdoor_only=True, jobs=1, **train_kwargs):
+    """
+    모든 구장 모델 학습
+
+    Args:
+        outdoor_only: True면 야외 구장만 학습
+        jobs: 병렬 학습 프로세스 수 (1이면 순차 학습, 0이면 코어 수 기준 자동)
+        **train_kwargs: train_stadium_model() 인자 (temporal_split, tune, n_trials, use_cache 등)
+
+    Returns:
+        dict: {stadium_id: 학습 결과 (실패 시 None)}
+              병렬 학습 결과에는 모델 객체/예측 함수 대신 모델 경로와 지표만 포함됩니다.
+    """
     if outdoor_only:
         stadium_ids = get_outdoor_stadiums()
         print(f"야외 구장 {len(stadium_ids)}개 모델 학습 시작...")
@@ -851,44 +1568,318 @@ def train_all_stadiums(outdoor_only=True):
         print(f"전체 구장 {len(stadium_ids)}개 모델 학습 시작...")
 
     results = {}
-    for i, stadium_id in enumerate(stadium_ids, 1):
-        print(f"\n{'#'*60}")
-        print(f"# [{i}/{len(stadium_ids)}] {STADIUMS[stadium_id]['name']}")
-        print("#" * 60)
-
-        try:
-            result = train_stadium_model(stadium_id)
-            results[stadium_id] = result
-        except Exception as e:
-            print(f"[오류] {stadium_id} 모델 학습 실패: {e}")
-            import traceback
-
-            traceback.print_exc()
-            results[stadium_id] = None
+    elapsed = {}
+    start_time = time.perf_counter()
+
+    if jobs == 1:
+        for i, stadium_id in enumerate(stadium_ids, 1):
+            print(f"\n{'#'*60}")
+            print(f"# [{i}/{len(stadium_ids)}] {STADIUMS[stadium_id]['name']}")
+            print("#" * 60)
+
+            stadium_start = time.perf_counter()
+            try:
+                result = train_stadium_model(stadium_id, **train_kwargs)
+                results[stadium_id] = result
+            except Exception as e:
+                print(f"[오류] {stadium_id} 모델 학습 실패: {e}")
+                traceback.print_exc()
+                results[stadium_id] = None
+            elapsed[stadium_id] = time.perf_counter() - stadium_start
+    else:
+        workers, n_threads = plan_parallel_training(len(stadium_ids), jobs)
+        print(f"병렬 학습: 프로세스 {workers}개 x 모델 스레드 {n_threads}개 (로그: {TRAINING_LOG_DIR})")
+
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = {
+                executor.submit(_train_stadium_worker, stadium_id, n_threads, train_kwargs): stadium_id
+                for stadium_id in stadium_ids
+            }
+            for done, future in enumerate(as_completed(futures), 1):
+                stadium_id = futures[future]
+                try:
+                    outcome = future.result()
+                except Exception as e:
+                    # 하위 프로세스 비정상 종료 등
+                    print(f"[오류] {stadium_id} 모델 학습 실패: {e}")
+                    results[stadium_id] = None
+                    continue
+
+                results[stadium_id] = outcome["result"]
+                elapsed[stadium_id] = outcome["elapsed"]
+                if outcome["error"]:
+                    status = "오류"
+                elif outcome["result"] is None:
+                    status = "스킵"
+                elif outcome["result"]["cached"]:
+                    status = "캐시 재사용"
+                else:
+                    status = "완료"
+                print(
+                    f"  [{done}/{len(stadium_ids)}] {STADIUMS[stadium_id]['name']}: {status} "
+                    f"({outcome['elapsed']:.1f}초, 로그: {outcome['log_path']})"
+                )
+
+        # 요약은 구장 순서대로 출력
+        results = {stadium_id: results.get(stadium_id) for stadium_id in stadium_ids}
 
     # 전체 요약
     print("\n" + "=" * 60)
     print("전체 모델 학습 결과")
     print("=" * 60)
-    print(f"{'구장':<25} {'상태':<10} {'Best Model':<15} {'F1 Score'}")
-    print("-" * 60)
+    print(f"{'구장':<25} {'상태':<10} {'Best Model':<15} {'F1 Score':<10} {'시간'}")
+    print("-" * 70)
 
     for stadium_id, result in results.items():
         name = STADIUMS[stadium_id]["name"]
+        seconds = f"{elapsed[stadium_id]:.1f}초" if stadium_id in elapsed else "-"
         if result is not None:
-            best_name = None
-            best_f1 = 0
-            for model_name, model_result in result["results"].items():
-                if model_result["f1"] > best_f1:
-                    best_f1 = model_result["f1"]
-                    best_name = model_name
-            print(f"{name:<25} {'✓ 성공':<10} {best_name:<15} {best_f1:.4f}")
+            status = "✓ 캐시" if result.get("cached") else "✓ 성공"
+            print(
+                f"{name:<25} {status:<10} {result['best_model_name']:<15} "
+                f"{result['best_f1']:<10.4f} {seconds}"
+            )
         else:
-            print(f"{name:<25} {'✗ 실패':<10} {'-':<15} {'-'}")
+            print(f"{name:<25} {'✗ 실패':<10} {'-':<15} {'-':<10} {seconds}")
+
+    print(f"\n전체 학습 시간: {time.perf_counter() - start_time:.1f}초")
 
     return results
 
 
+# ============================================
+# 전 구장 통합 모델
+# ============================================
+def load_global_training_data(stadium_ids, temporal_split=False):
+    """
+    구장별 전처리/분할 후 하나로 합친 학습 데이터
+
+    구장별 모델과 같은 전처리와 같은 분할(split_train_test)을 사용하므로
+    구장별 테스트셋이 구장별 모델 학습 때와 동일합니다.
+
+    Returns:
+        tuple: (X_train, X_test, y_train, y_test, feature_cols, data_through)
+               X에는 범주형 STADIUM_FEATURE 컬럼이 포함됨, data_through는 구장별 학습 마지막 날짜
+    """
+    df_all = query_dataset("with_weather", columns=TRAINING_COLUMNS + [STADIUM_FEATURE], stadiums=stadium_ids)
+
+    train_parts, test_parts, data_through = [], [], {}
+    feature_cols = None
+    for stadium_id in stadium_ids:
+        stadium_name = STADIUMS[stadium_id]["name"]
+        df = df_all[df_all[STADIUM_FEATURE] == stadium_id].drop(columns=STADIUM_FEATURE).reset_index(drop=True)
+        if df.empty:
+            continue
+
+        # 구장별 전처리 로그는 생략
+        with redirect_stdout(io.StringIO()):
+            X, y, feature_cols = preprocess_data(df, stadium_name)
+        df_dates = df.loc[X.index, "date"]
+
+        # 층화 분할에는 취소 경기가 최소 2개 필요
+        if y.sum() < 2:
+            print(f"[스킵] {stadium_name}: 우천취소 경기 {int(y.sum())}개")
+            continue
+
+        X_train, X_test, y_train, y_test = split_train_test(X, y, df_dates, temporal_split)
+        data_through[stadium_id] = pd.to_datetime(df_dates.loc[X_train.index]).max().strftime("%Y-%m-%d")
+
+        for part, X_part, y_part in ((train_parts, X_train, y_train), (test_parts, X_test, y_test)):
+            X_part = X_part.assign(**{STADIUM_FEATURE: stadium_id})
+            part.append((X_part, y_part))
+
+        print(
+            f"  {stadium_name:<20} 학습 {len(X_train):>4}개 (취소 {int(y_train.sum()):>3}) | "
+            f"테스트 {len(X_test):>4}개 (취소 {int(y_test.sum()):>3})"
+        )
+
+    categories = list(data_through)
+
+    def combine(parts):
+        X = pd.concat([X_part for X_part, _ in parts], ignore_index=True)
+        X[STADIUM_FEATURE] = pd.Categorical(X[STADIUM_FEATURE], categories=categories)
+        y = pd.concat([y_part for _, y_part in parts], ignore_index=True)
+        return X, y
+
+    X_train, y_train = combine(train_parts)
+    X_test, y_test = combine(test_parts)
+    return X_train, X_test, y_train, y_test, feature_cols, data_through
+
+
+def compare_with_stadium_models(model, X_test, y_test, feature_cols, data_through):
+    """
+    구장별 테스트셋에서 통합 모델과 구장별 모델(models/kbo_<구장>_model.pkl) 비교
+
+    구장별 모델의 학습 마지막 날짜(data_through)가 통합 모델 학습 데이터와 다르면
+    같은 분할로 학습된 모델이 아니므로 비교에 *를 표시합니다.
+
+    Returns:
+        dict: {구장 ID: {"test", "cancelled", "global_f1", "global_roc_auc", "stadium_f1", ...}}
+    """
+    global_prob = model.predict_proba(X_test)[:, 1]
+    global_pred = (global_prob >= 0.5).astype(int)
+
+    comparison = {}
+    pooled_stadium_pred = np.full(len(y_test), -1)
+    for stadium_id in X_test[STADIUM_FEATURE].cat.categories:
+        mask = (X_test[STADIUM_FEATURE] == stadium_id).to_numpy()
+        y_s = y_test[mask]
+        row = {
+            "test": int(mask.sum()),
+            "cancelled": int(y_s.sum()),
+            "global_f1": f1_score(y_s, global_pred[mask], zero_division=0),
+            "global_roc_auc": roc_auc_score(y_s, global_prob[mask]) if 0 < y_s.sum() < len(y_s) else float("nan"),
+            "stadium_f1": float("nan"),
+            "stadium_roc_auc": float("nan"),
+            "stadium_model": None,
+            "same_split": False,
+        }
+
+        model_path = get_data_paths(stadium_id)["model"]
+        if model_path.exists():
+            with open(model_path, "rb") as f:
+                stadium_data = pickle.load(f)
+            X_s = X_test.loc[mask, stadium_data["feature_cols"]]
+            stadium_prob = stadium_data["model"].predict_proba(X_s)[:, 1]
+            stadium_pred = (stadium_prob >= 0.5).astype(int)
+            pooled_stadium_pred[mask] = stadium_pred
+            row.update(
+                stadium_f1=f1_score(y_s, stadium_pred, zero_division=0),
+                stadium_roc_auc=roc_auc_score(y_s, stadium_prob) if 0 < y_s.sum() < len(y_s) else float("nan"),
+                stadium_model=stadium_data.get("model_name") or type(stadium_data["model"]).__name__,
+                same_split=stadium_data.get("data_through") == data_through[stadium_id],
+            )
+        comparison[stadium_id] = row
+
+    print("\n" + "=" * 60)
+    print("구장별 비교: 통합 모델 vs 구장별 모델 (같은 테스트셋)")
+    print("=" * 60)
+    print(f"{'구장':<20} {'테스트(취소)':>12} {'통합 F1':>9} {'구장별 F1':>10} {'통합 AUC':>9} {'구장별 AUC':>10}  구장별 모델")
+    print("-" * 95)
+    for stadium_id, row in comparison.items():
+        marker = "" if row["same_split"] else " *"
+        print(
+            f"{STADIUMS[stadium_id]['name']:<20} {row['test']:>6} ({row['cancelled']:>3}) "
+            f"{row['global_f1']:>9.4f} {row['stadium_f1']:>10.4f} "
+            f"{row['global_roc_auc']:>9.4f} {row['stadium_roc_auc']:>10.4f}  {row['stadium_model'] or '-'}{marker}"
+        )
+
+    # 구장별 모델이 있는 구장만 모아서 전체 F1 비교
+    covered = pooled_stadium_pred >= 0
+    if covered.any():
+        print("-" * 95)
+        print(
+            f"{'전체 (micro F1)':<20} {int(covered.sum()):>6} ({int(y_test[covered].sum()):>3}) "
+            f"{f1_score(y_test[covered], global_pred[covered]):>9.4f} "
+            f"{f1_score(y_test[covered], pooled_stadium_pred[covered]):>10.4f}"
+        )
+    if not all(row["same_split"] for row in comparison.values()):
+        print("\n* 구장별 모델의 학습 범위가 달라(다른 분할/증분 학습/데이터 갱신) 공정한 비교가 아닙니다.")
+
+    return comparison
+
+
+def train_global_model(outdoor_only=True, temporal_split=False, n_jobs=None):
+    """
+    전 구장 통합 모델 학습 (구장 ID를 범주형 피처로 사용)
+
+    XGBoost(enable_categorical)와 LightGBM(범주형 컬럼 자동 인식)을 학습하여
+    전체 테스트셋 F1이 높은 모델을 GLOBAL_MODEL_PATH에 저장하고, 구장별 지표를
+    구장별 모델과 비교합니다.
+
+    Args:
+        outdoor_only: True면 야외 구장만
+        temporal_split: True면 2025년 데이터를 테스트셋으로 사용
+        n_jobs: 모델 내부 스레드 수 (None이면 라이브러리 기본값)
+    """
+    stadium_ids = get_outdoor_stadiums() if outdoor_only else list(STADIUMS.keys())
+    stadium_ids = [sid for sid in stadium_ids if dataset_exists(sid, "with_weather")]
+
+    print("\n" + "=" * 60)
+    print(f"KBO 전 구장 통합 우천취소 예측 모델 ({len(stadium_ids)}개 구장)")
+    if temporal_split:
+        print("[Temporal Validation] 2019-2024 학습, 2025 테스트")
+    print("=" * 60)
+
+    if not stadium_ids:
+        print("\n[오류] 날씨 포함 데이터가 있는 구장이 없습니다.")
+        return None
+
+    X_train, X_test, y_train, y_test, feature_cols, data_through = load_global_training_data(
+        stadium_ids, temporal_split
+    )
+    if len(X_test) == 0 or y_train.sum() == 0:
+        print("\n[오류] 학습/테스트 데이터가 부족합니다.")
+        return None
+
+    model_cols = feature_cols + [STADIUM_FEATURE]
+    print(f"\n학습 데이터: {len(X_train)}개 (취소: {int(y_train.sum())}개)")
+    print(f"테스트 데이터: {len(X_test)}개 (취소: {int(y_test.sum())}개)")
+
+    scale_pos_weight = (y_train == 0).sum() / (y_train == 1).sum()
+    models = {
+        "XGBoost": XGBClassifier(
+            n_estimators=100,
+            max_depth=4,
+            learning_rate=0.1,
+            scale_pos_weight=scale_pos_weight,
+            random_state=42,
+            eval_metric="logloss",
+            tree_method="hist",
+            enable_categorical=True,
+            n_jobs=n_jobs,
+        ),
+        "LightGBM": LGBMClassifier(
+            n_estimators=100,
+            max_depth=4,
+            learning_rate=0.1,
+            class_weight="balanced",
+            random_state=42,
+            verbose=-1,
+            n_jobs=n_jobs,
+        ),
+    }
+
+    best_model, best_model_name, best_f1 = None, None, -1.0
+    for name, model in models.items():
+        model.fit(X_train[model_cols], y_train)
+        y_prob = model.predict_proba(X_test[model_cols])[:, 1]
+        f1 = f1_score(y_test, (y_prob >= 0.5).astype(int))
+        print(f"\n[{name}] F1: {f1:.4f}, ROC-AUC: {roc_auc_score(y_test, y_prob):.4f}")
+        if f1 > best_f1:
+            best_model, best_model_name, best_f1 = model, name, f1
+
+    print(f"\n최고 성능 모델: {best_model_name} (F1: {best_f1:.4f})")
+
+    comparison = compare_with_stadium_models(
+        best_model, X_test[model_cols], y_test, feature_cols, data_through
+    )
+
+    model_data = {
+        "model": best_model,
+        "feature_cols": model_cols,
+        "stadium_id": "global",
+        "stadium_name": "전 구장 통합",
+        "stadiums": list(data_through),
+        "model_name": best_model_name,
+        "data_through": data_through,
+        "feature_version": FEATURE_VERSION,
+    }
+    GLOBAL_MODEL_PATH.parent.mkdir(parents=True, exist_ok=True)
+    with open(GLOBAL_MODEL_PATH, "wb") as f:
+        pickle.dump(model_data, f)
+    print(f"\n[저장] {GLOBAL_MODEL_PATH}")
+
+    return {
+        "model": best_model,
+        "feature_cols": model_cols,
+        "model_path": GLOBAL_MODEL_PATH,
+        "best_model_name": best_model_name,
+        "best_f1": best_f1,
+        "comparison": comparison,
+    }
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="KBO 우천취소 예측 모델 학습",
@@ -898,7 +1889,15 @@ def main():
   python kbo_rain_model.py --stadium jamsil
   python kbo_rain_model.py --stadium busan
   python kbo_rain_model.py --all
+  python kbo_rain_model.py --all --jobs 0   # 코어 수 기준 병렬 학습
+  python kbo_rain_model.py --all --report   # 학습 후 EDA/피처 중요도 그래프 백그라운드 생성
   python kbo_rain_model.py --list
+  python kbo_rain_model.py --stadium jamsil --tune --trials 100 --tune-jobs 4
+  python kbo_rain_model.py --stadium jamsil --tune --pruner hyperband  # 중단 후 재실행 시 이어서 튜닝
+  python kbo_rain_model.py --all --incremental  # 새 경기만 이어서 학습 (시즌 중 갱신)
+  python kbo_rain_model.py --global  # 전 구장 통합 모델 + 구장별 모델 비교
+  python kbo_rain_model.py --all --latency-budget 2  # 단일 행 추론 2ms 이내 모델 중 선택
+  python kbo_rain_model.py --stadium jamsil --tune --objective f1_latency --latency-budget 2
 
 참고:
   - 먼저 cancel_crawler.py와 weather_collector_openmeteo.py를 실행해야 합니다.
@@ -942,6 +1941,81 @@ def main():
         default=50,
         help="튜닝 시도 횟수 (기본값: 50)",
     )
+    parser.add_argument(
+        "--tune-jobs",
+        type=int,
+        default=1,
+        help="프로세스 내 병렬 trial 수 (기본값: 1)",
+    )
+    parser.add_argument(
+        "--pruner",
+        type=str,
+        choices=PRUNERS,
+        default="hyperband",
+        help="가망 없는 trial 중단 방식 (기본값: hyperband)",
+    )
+    parser.add_argument(
+        "--objective",
+        type=str,
+        choices=OBJECTIVES,
+        default="f1",
+        help="튜닝 목표: f1 또는 f1_latency (F1 vs 추론 지연 다목적, 기본값: f1)",
+    )
+    parser.add_argument(
+        "--latency-budget",
+        type=float,
+        default=LATENCY_BUDGET_MS,
+        help="모델 선택 시 단일 행 추론 지연 예산 ms (기본값: 환경 변수 KBO_LATENCY_BUDGET_MS, 없으면 제한 없음)",
+    )
+    parser.add_argument(
+        "--storage",
+        type=str,
+        default=OPTUNA_STORAGE,
+        help="Optuna study 저장소 URL (같은 저장소를 쓰는 여러 프로세스가 trial을 나눠 실행)",
+    )
+    parser.add_argument(
+        "--no-storage",
+        action="store_true",
+        help="study를 저장하지 않음 (재개 불가)",
+    )
+    parser.add_argument(
+        "--global",
+        dest="global_model",
+        action="store_true",
+        help="전 구장 통합 모델 하나 학습 (구장 ID를 범주형 피처로 사용) 후 구장별 모델과 비교",
+    )
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="저장된 모델에 새 경기만 이어서 학습 (검증 성능 하락 시 전체 재학습)",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="학습 캐시를 사용하지 않고 항상 재학습",
+    )
+    parser.add_argument(
+        "--warm-start",
+        action="store_true",
+        help="같은 구장 이전 study/다른 구장의 상위 파라미터로 시작 (기본: 꺼짐)",
+    )
+    parser.add_argument(
+        "--narrow-space",
+        action="store_true",
+        help="웜 스타트 시드 주변으로 탐색 공간 축소 (--warm-start 포함)",
+    )
+    parser.add_argument(
+        "--report",
+        action="store_true",
+        help="학습 후 EDA/피처 중요도 리포트를 백그라운드로 생성 (model_report.py)",
+    )
+    parser.add_argument(
+        "--jobs",
+        "-j",
+        type=int,
+        default=1,
+        help="--all 병렬 학습 프로세스 수 (기본값: 1=순차, 0=코어 수 기준 자동)",
+    )
 
     args = parser.parse_args()
 
@@ -953,13 +2027,46 @@ def main():
         return
 
     # 모든 구장 학습
-    if args.all:
-        train_all_stadiums()
+    tune_options = {
+        "storage": None if args.no_storage else args.storage,
+        "pruner": args.pruner,
+        "trial_jobs": args.tune_jobs,
+        # 20 trial 비교에서 웜 스타트가 콜드 스타트보다 낮아(0.728 vs 0.738) 명시할 때만 사용
+        "warm_start": args.warm_start or args.narrow_space,
+        "narrow_space": args.narrow_space,
+        "objective": args.objective,
+    }
+
+    if args.global_model:
+        # 통합 모델은 한 프로세스에서 학습하므로 코어 전체를 모델 내부 스레드로 사용
+        _, n_threads = plan_parallel_training(1, args.jobs)
+        train_global_model(temporal_split=args.temporal, n_jobs=n_threads)
         return
 
-    # 특정 구장 학습
-    stadium_id = args.stadium or DEFAULT_STADIUM
-    train_stadium_model(stadium_id, temporal_split=args.temporal, tune=args.tune, n_trials=args.trials)
+    if args.all:
+        results = train_all_stadiums(
+            jobs=args.jobs, temporal_split=args.temporal, tune=args.tune, n_trials=args.trials,
+            use_cache=not args.no_cache, incremental=args.incremental,
+            latency_budget_ms=args.latency_budget, **tune_options,
+        )
+    else:
+        # 특정 구장 학습
+        stadium_id = args.stadium or DEFAULT_STADIUM
+        results = {
+            stadium_id: train_stadium_model(
+                stadium_id, temporal_split=args.temporal, tune=args.tune, n_trials=args.trials,
+                use_cache=not args.no_cache, incremental=args.incremental,
+                latency_budget_ms=args.latency_budget, **tune_options,
+            )
+        }
+
+    # 리포트는 학습이 끝난 뒤 별도 프로세스로 (학습 프로세스는 기다리지 않고 종료)
+    trained = [stadium_id for stadium_id, result in results.items() if result is not None]
+    if args.report and trained:
+        from model_report import REPORT_LOG_PATH, launch_report_process
+
+        process = launch_report_process(trained)
+        print(f"\n[리포트] 백그라운드 생성 시작 (PID {process.pid}, 로그: {REPORT_LOG_PATH})")
 
 
 if __name__ == "__main__":
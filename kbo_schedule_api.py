@@ -0,0 +1,291 @@
+"""
+KBO 경기 일정 HTTP 클라이언트 (브라우저 없이 일정 데이터 요청)
+============================================================
+KBO 일정 페이지(Schedule.aspx)는 드롭다운 변경 시
+ws/Schedule.asmx/GetScheduleList 로 POST 요청을 보내 JSON 행 데이터를 받아
+표를 그립니다. 이 모듈은 해당 요청을 직접 호출하고, 응답을 페이지와 같은
+tblScheduleList 테이블 HTML로 변환하여 cancel_crawler의 행 파서를 그대로 재사용합니다.
+
+녹화/재생:
+    - record=True 이면 응답 JSON을 fixture_dir/<시리즈>/<연>-<월>.json 으로 저장
+    - fixture_dir만 지정하면 네트워크 없이 저장된 응답으로 재생
+
+실행 (녹화):
+    python kbo_schedule_api.py --years 2024 --months 5 6 --record
+
+재생 검사 (네트워크 없음):
+    python kbo_schedule_api.py --check
+    - fixture를 재생해 만든 테이블을 lxml 파서(수집기)와 BeautifulSoup 행 파서
+      (Selenium 경로)로 각각 파싱하여 결과가 같은지 확인합니다.
+"""
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+import requests
+from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from backend.shared.schedule_parser import schedule_json_to_html
+from stadium_config import DATA_DIR, DEFAULT_YEARS, DEFAULT_MONTHS
+
+SCHEDULE_URL = "https://www.koreabaseball.com/Schedule/Schedule.aspx"
+SCHEDULE_API_URL = "https://www.koreabaseball.com/ws/Schedule.asmx/GetScheduleList"
+
+# 정규시즌 시리즈 값
+REGULAR_SEASON_SERIES = "0,9,6"
+
+# 녹화된 응답 (오프라인 재생용)
+SCHEDULE_FIXTURE_DIR = DATA_DIR / "fixtures" / "schedule"
+
+# 요청 간 대기 (재생 모드에서는 대기하지 않음)
+REQUEST_INTERVAL = 0.3
+
+USER_AGENT = "Mozilla/5.0 (Macintosh; Apple Silicon Mac OS X) AppleWebKit/537.36"
+
+
+def create_session(pool_size=4):
+    """커넥션 풀/재시도가 설정된 requests 세션 생성"""
+    session = requests.Session()
+    retry = Retry(
+        total=3,
+        backoff_factor=0.5,
+        status_forcelist=(429, 500, 502, 503, 504),
+        allowed_methods=frozenset(["GET", "POST"]),
+    )
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers.update(
+        {
+            "User-Agent": USER_AGENT,
+            "Referer": SCHEDULE_URL,
+            "X-Requested-With": "XMLHttpRequest",
+            "Accept": "application/json, text/javascript, */*; q=0.01",
+        }
+    )
+    return session
+
+
+def extract_schedule_rows(html):
+    """
+    일정 테이블 HTML에서 tbody 행 추출
+
+    Args:
+        html: tblScheduleList 테이블을 포함한 HTML (페이지 전체 또는 테이블만)
+
+    Returns:
+        list: tbody의 tr 요소 리스트 (데이터 없음 시 None)
+
+    Raises:
+        RuntimeError: 일정 테이블이 없는 경우
+    """
+    soup = BeautifulSoup(html, "html.parser")
+
+    table = soup.find("table", id="tblScheduleList")
+    if not table:
+        raise RuntimeError("테이블(tblScheduleList)을 찾을 수 없음")
+
+    tbody = table.find("tbody")
+    if not tbody:
+        raise RuntimeError("tbody를 찾을 수 없음")
+
+    rows = tbody.find_all("tr")
+
+    # "데이터가 없습니다" 체크
+    if not rows or (len(rows) == 1 and "데이터가 없습니다" in rows[0].get_text()):
+        return None
+    return rows
+
+
+class ScheduleClient:
+    """KBO 일정 데이터 HTTP 클라이언트 (녹화/재생 지원)"""
+
+    def __init__(
+        self,
+        fixture_dir=None,
+        record=False,
+        session=None,
+        timeout=10,
+        request_interval=REQUEST_INTERVAL,
+    ):
+        """
+        Args:
+            fixture_dir: 녹화 응답 디렉토리 (record=False면 재생 전용)
+            record: True면 네트워크 응답을 fixture_dir에 저장
+            session: 공유할 requests 세션 (기본: 새 풀 세션)
+            timeout: 요청 타임아웃 (초)
+            request_interval: 요청 후 대기 시간 (초, 외부에서 속도 제한 시 0)
+        """
+        self.record = record
+        self.fixture_dir = fixture_dir or (SCHEDULE_FIXTURE_DIR if record else None)
+        self.replay = self.fixture_dir is not None and not record
+        self.session = session
+        self.timeout = timeout
+        self.request_interval = request_interval
+
+    def _fixture_path(self, year, month, series):
+        series_dir = series.replace(",", "_")
+        return self.fixture_dir / series_dir / f"{year}-{month:02d}.json"
+
+    def fetch_month_json(self, year, month, series=REGULAR_SEASON_SERIES):
+        """
+        월별 일정 JSON 조회
+
+        Returns:
+            dict: GetScheduleList 응답 ({"rows": [...], ...})
+        """
+        if self.replay:
+            path = self._fixture_path(year, month, series)
+            return json.loads(path.read_text(encoding="utf-8"))
+
+        if self.session is None:
+            self.session = create_session()
+
+        payload = {
+            "leId": "1",
+            "srIdList": series,
+            "seasonId": str(year),
+            "gameMonth": str(month).zfill(2),
+            "teamId": "",
+        }
+        response = self.session.post(SCHEDULE_API_URL, data=payload, timeout=self.timeout)
+        response.raise_for_status()
+        data = response.json()
+
+        # ASP.NET 래핑 응답 ({"d": "<json 문자열>"}) 처리
+        if isinstance(data, dict) and isinstance(data.get("d"), str):
+            data = json.loads(data["d"])
+
+        if self.record:
+            path = self._fixture_path(year, month, series)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(json.dumps(data, ensure_ascii=False), encoding="utf-8")
+
+        if self.request_interval:
+            time.sleep(self.request_interval)
+        return data
+
+    def fetch_table_html(self, year, month, series=REGULAR_SEASON_SERIES):
+        """월별 일정 테이블 HTML 조회 (페이지 캐시 저장 형식)"""
+        return schedule_json_to_html(self.fetch_month_json(year, month, series))
+
+    def fetch_rows(self, year, month, series=REGULAR_SEASON_SERIES):
+        """
+        월별 일정 테이블 행 조회 (cancel_crawler.parse_schedule_rows 입력 형식)
+
+        Returns:
+            list: tbody의 tr 요소 리스트 (데이터 없음 시 None)
+        """
+        return extract_schedule_rows(self.fetch_table_html(year, month, series))
+
+    def close(self):
+        if self.session is not None:
+            self.session.close()
+            self.session = None
+
+
+def list_fixtures(fixture_dir, series=REGULAR_SEASON_SERIES):
+    """
+    녹화된 (연, 월) 목록
+
+    Returns:
+        list: [(연, 월)] 정렬
+    """
+    series_dir = Path(fixture_dir) / series.replace(",", "_")
+    units = []
+    for path in sorted(series_dir.glob("*.json")):
+        year, month = path.stem.split("-")
+        units.append((int(year), int(month)))
+    return units
+
+
+def check_fixtures(fixture_dir=SCHEDULE_FIXTURE_DIR, series=REGULAR_SEASON_SERIES):
+    """
+    녹화 응답 재생 검사
+
+    fixture마다 재생 → 테이블 HTML → lxml 파서(수집기)와 BeautifulSoup 행 파서(Selenium 경로)
+    결과가 같은지 확인합니다.
+
+    Returns:
+        bool: 모든 fixture 통과 여부 (fixture가 없으면 False)
+    """
+    from backend.shared.schedule_parser import parse_schedule_html
+    from cancel_crawler import parse_schedule_rows
+
+    units = list_fixtures(fixture_dir, series)
+    if not units:
+        print(f"{fixture_dir}에 녹화된 응답이 없습니다. 먼저 --record로 녹화하세요.")
+        return False
+
+    client = ScheduleClient(fixture_dir=Path(fixture_dir))
+    print(f"fixture: {fixture_dir} ({len(units)}개 월)")
+    print(f"\n{'연-월':<10} {'경기':>6} {'취소':>6} {'Selenium 파서 일치':>20}")
+    print("-" * 46)
+
+    passed = True
+    for year, month in units:
+        html = client.fetch_table_html(year, month, series)
+        games = [game.to_dict() for game in parse_schedule_html(html, year)]
+        rows = extract_schedule_rows(html)
+        legacy_games = list(parse_schedule_rows(rows, year)) if rows else []
+
+        ok = bool(games) and games == legacy_games
+        passed &= ok
+        cancelled = sum(game["cancelled"] for game in games)
+        print(f"{year}-{month:02d}    {len(games):>6} {cancelled:>6} {'통과' if ok else '실패':>20}")
+        if not ok:
+            for game, legacy in zip(games, legacy_games):
+                if game != legacy:
+                    print(f"  첫 불일치: {game} != {legacy}")
+                    break
+    return passed
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="KBO 경기 일정 HTTP 클라이언트 (응답 녹화)",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+예시:
+  python kbo_schedule_api.py --years 2024 --months 5 --record
+  python kbo_schedule_api.py --years 2024 --months 5 --fixtures data/fixtures/schedule
+  python kbo_schedule_api.py --check   # 녹화 응답 재생 → 파서 일치 검사 (실패 시 종료 코드 1)
+        """,
+    )
+    parser.add_argument("--years", "-y", type=int, nargs="+", default=None, help="연도")
+    parser.add_argument("--months", "-m", type=int, nargs="+", default=None, help="월")
+    parser.add_argument("--record", action="store_true", help="응답을 fixture 디렉토리에 저장")
+    parser.add_argument("--fixtures", type=str, default=None, help="fixture 디렉토리 (재생)")
+    parser.add_argument(
+        "--check", action="store_true", help="녹화 응답 재생 검사 (기본 fixture: data/fixtures/schedule)"
+    )
+
+    args = parser.parse_args()
+
+    fixture_dir = Path(args.fixtures) if args.fixtures else None
+    if args.check:
+        if not check_fixtures(fixture_dir or SCHEDULE_FIXTURE_DIR):
+            sys.exit(1)
+        return
+
+    client = ScheduleClient(fixture_dir=fixture_dir, record=args.record)
+
+    try:
+        for year in args.years or DEFAULT_YEARS:
+            for month in args.months or DEFAULT_MONTHS:
+                rows = client.fetch_rows(year, month)
+                print(f"{year}년 {month}월: {len(rows) if rows else 0}개 행")
+    finally:
+        client.close()
+
+    if args.record:
+        print(f"\n응답 저장: {client.fixture_dir}")
+
+
+if __name__ == "__main__":
+    main()
@@ -13,8 +13,17 @@
   - data/kbo_jamsil_cancelled_games.csv
   - data/kbo_jamsil_with_weather.csv
   - models/kbo_jamsil_model.pkl
+
+--columnar 옵션:
+  구장별 CSV(all_games/cancelled_games/with_weather)를
+  구장/연/월 파티션의 타입 지정 Parquet으로 변환합니다 (dataset_store 스키마 적용).
+  - data/store/<kind>/stadium_id=<stadium>/year=<YYYY>/month=<M>/part-0.parquet
+
+실행: python migrate_legacy_data.py
+      python migrate_legacy_data.py --columnar
 """
 
+import argparse
 import shutil
 from pathlib import Path
 
@@ -93,5 +102,43 @@ def migrate():
     print("  rm kbo_jamsil_*.csv kbo_rain_model.pkl")
 
 
+def migrate_to_columnar():
+    """구장별 CSV 데이터셋을 Parquet으로 변환"""
+    from dataset_store import migrate_stadium_to_columnar
+    from stadium_config import get_all_stadium_ids
+
+    print("=" * 60)
+    print("구장별 CSV -> Parquet 변환")
+    print("=" * 60)
+
+    for stadium_id in get_all_stadium_ids():
+        converted = migrate_stadium_to_columnar(stadium_id)
+        if not converted:
+            print(f"[없음] {stadium_id}: 변환할 CSV 없음")
+            continue
+        for kind, path in converted.items():
+            print(f"[변환] {stadium_id}/{kind} -> {path}")
+
+    print("\n" + "=" * 60)
+    print("변환 완료!")
+    print("=" * 60)
+    print("\n기존 CSV 파일은 삭제되지 않았습니다 (Parquet 파일이 우선 사용됨).")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="KBO 데이터 마이그레이션")
+    parser.add_argument(
+        "--columnar",
+        action="store_true",
+        help="구장별 CSV를 타입 지정 Parquet으로 변환",
+    )
+    args = parser.parse_args()
+
+    if args.columnar:
+        migrate_to_columnar()
+    else:
+        migrate()
+
+
 if __name__ == "__main__":
-    migrate()
+    main()
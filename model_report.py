@@ -0,0 +1,329 @@
+"""
+EDA / 피처 중요도 리포트 (학습과 분리된 단계)
+==============================================
+모델 학습(kbo_rain_model.py)은 그래프를 그리지 않으며, 이 스크립트가 저장된 데이터와
+모델 파일로 리포트를 생성합니다. 학습 후 백그라운드로 실행하거나(--report) 필요할 때 실행합니다.
+
+- EDA 통계: 요청한 모든 구장을 한 번에 로드하여 (구장, 월, 취소 여부) 그룹 집계 한 번으로
+  취소/정상 날씨 평균과 월별 취소율을 계산합니다.
+- 그래프: matplotlib/seaborn은 그래프를 그릴 때만 import하고 화면 없이(Agg) 저장합니다.
+    models/eda_<구장>_weather_comparison.png
+    models/feature_importance_<구장>.png
+
+설치: pip install matplotlib seaborn (리포트 생성 시에만 필요)
+실행: python model_report.py --stadium jamsil
+      python model_report.py --all
+      python model_report.py --all --no-plots   # 통계 표만 출력
+"""
+
+import argparse
+import pickle
+import subprocess
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from dataset_store import dataset_exists, query_dataset
+from stadium_config import DEFAULT_STADIUM, MODELS_DIR, STADIUMS, get_data_paths, get_outdoor_stadiums
+
+REPORT_LOG_PATH = MODELS_DIR / "logs" / "report.log"
+
+# 취소 vs 정상 비교 날씨 변수
+EDA_WEATHER_COLUMNS = [
+    "daily_precip_sum",
+    "daily_precip_hours",
+    "daily_rain_sum",
+    "pre_game_precip",
+    "pre_game_humidity",
+    "pre_game_temp",
+    "prev_day_precip",
+    "daily_wind_max",
+]
+
+# 상자 그림으로 비교할 변수 (2 x 3)
+EDA_PLOT_COLUMNS = [
+    "daily_precip_sum",
+    "pre_game_precip",
+    "pre_game_humidity",
+    "prev_day_precip",
+    "daily_precip_hours",
+    "pre_game_temp",
+]
+
+# 취소 경기가 이보다 적으면 그래프 생략
+MIN_CANCELLED_FOR_PLOTS = 3
+
+
+def _pyplot():
+    """matplotlib을 화면 없이(Agg) 필요할 때만 로드"""
+    import matplotlib
+
+    matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+
+    # 한글 폰트 설정 (macOS)
+    plt.rcParams["font.family"] = "AppleGothic"
+    plt.rcParams["axes.unicode_minus"] = False
+    return plt
+
+
+def load_report_data(stadium_ids):
+    """
+    요청 구장의 우천취소/정상진행 경기 (한 번의 쿼리)
+
+    Returns:
+        pd.DataFrame: stadium_id, is_cancelled, month 컬럼 포함
+    """
+    from kbo_rain_model import TRAINING_COLUMNS
+
+    available = [stadium_id for stadium_id in stadium_ids if dataset_exists(stadium_id, "with_weather")]
+    if not available:
+        return pd.DataFrame()
+
+    df = query_dataset("with_weather", columns=TRAINING_COLUMNS + ["stadium_id"], stadiums=available)
+
+    df = df[df["reason"].isin(["우천취소", "정상진행"])].copy()
+    df["is_cancelled"] = (df["reason"] == "우천취소").astype(int)
+    df["month"] = pd.to_datetime(df["date"]).dt.month
+    return df
+
+
+def compute_eda_stats(df):
+    """
+    구장별 EDA 통계 (그룹 집계 한 번)
+
+    (구장, 월, 취소 여부)별 합계/개수를 한 번에 구한 뒤 다시 더해
+    취소/정상 평균과 월별 취소율을 계산합니다 (평균은 결측치 제외, pandas mean과 동일).
+
+    Returns:
+        dict: {stadium_id: {"counts": 취소/정상 경기 수,
+                            "weather": 변수별 취소/정상 평균 DataFrame,
+                            "monthly": 월별 sum/count/rate DataFrame}}
+    """
+    weather_cols = [col for col in EDA_WEATHER_COLUMNS if col in df.columns]
+    grouped = df.groupby(["stadium_id", "month", "is_cancelled"], observed=True)
+    sums = grouped[weather_cols].sum()
+    non_null = grouped[weather_cols].count()
+    games = grouped.size()
+
+    # 월을 합쳐 (구장, 취소 여부)별 평균
+    class_means = sums.groupby(level=["stadium_id", "is_cancelled"]).sum() / non_null.groupby(
+        level=["stadium_id", "is_cancelled"]
+    ).sum().replace(0, np.nan)
+    class_counts = games.groupby(level=["stadium_id", "is_cancelled"]).sum()
+
+    # 취소 여부를 합쳐 (구장, 월)별 취소율
+    monthly = games.unstack("is_cancelled", fill_value=0).reindex(columns=[0, 1], fill_value=0)
+    monthly = pd.DataFrame({"sum": monthly[1], "count": monthly[0] + monthly[1]})
+    monthly["rate"] = monthly["sum"] / monthly["count"] * 100
+
+    stats = {}
+    for stadium_id in df["stadium_id"].unique():
+        means = class_means.loc[stadium_id].reindex([1, 0])
+        stats[stadium_id] = {
+            "counts": {
+                "cancelled": int(class_counts.get((stadium_id, 1), 0)),
+                "normal": int(class_counts.get((stadium_id, 0), 0)),
+            },
+            "weather": pd.DataFrame(
+                {"cancelled": means.loc[1], "normal": means.loc[0], "diff": means.loc[1] - means.loc[0]}
+            ),
+            "monthly": monthly.loc[stadium_id],
+        }
+    return stats
+
+
+def print_eda_stats(stadium_name, stats):
+    """취소 vs 정상 날씨 비교, 월별 취소 현황 출력"""
+    print("\n" + "=" * 60)
+    print(f"탐색적 데이터 분석 - {stadium_name}")
+    print("=" * 60)
+    counts = stats["counts"]
+    print(f"\n분석 대상: {counts['cancelled'] + counts['normal']}개 경기")
+    print(f"  - 우천취소: {counts['cancelled']}개")
+    print(f"  - 정상진행: {counts['normal']}개")
+
+    print("\n[날씨 변수 비교: 취소 vs 정상]")
+    print("-" * 60)
+    print(f"{'변수':<25} {'취소 평균':>12} {'정상 평균':>12} {'차이':>10}")
+    print("-" * 60)
+    for col, row in stats["weather"].iterrows():
+        print(f"{col:<25} {row['cancelled']:>12.2f} {row['normal']:>12.2f} {row['diff']:>10.2f}")
+
+    print("\n[월별 우천취소 현황]")
+    print(stats["monthly"])
+
+
+def render_eda_figure(stadium_id, stadium_name, df_stadium):
+    """취소 vs 정상 날씨 상자 그림 저장"""
+    plt = _pyplot()
+
+    cancelled = df_stadium[df_stadium["is_cancelled"] == 1]
+    normal = df_stadium[df_stadium["is_cancelled"] == 0]
+
+    fig, axes = plt.subplots(2, 3, figsize=(15, 10))
+    fig.suptitle(f"{stadium_name} - 우천취소 vs 정상경기 날씨 비교", fontsize=14)
+    for ax, col in zip(axes.flatten(), EDA_PLOT_COLUMNS):
+        if col in df_stadium.columns:
+            data_cancelled = cancelled[col].dropna()
+            data_normal = normal[col].dropna()
+            if len(data_cancelled) > 0 and len(data_normal) > 0:
+                ax.boxplot([data_normal, data_cancelled], labels=["정상", "취소"])
+            ax.set_title(col)
+            ax.set_ylabel("값")
+
+    plt.tight_layout()
+    eda_path = MODELS_DIR / f"eda_{stadium_id}_weather_comparison.png"
+    eda_path.parent.mkdir(parents=True, exist_ok=True)
+    plt.savefig(eda_path, dpi=150, bbox_inches="tight")
+    plt.close(fig)
+    print(f"\n[저장] {eda_path}")
+    return eda_path
+
+
+def load_feature_importance(stadium_id):
+    """
+    저장된 구장 모델의 피처 중요도
+
+    Returns:
+        tuple: (모델 이름, 중요도 DataFrame) - 모델 파일이 없으면 None
+    """
+    model_path = get_data_paths(stadium_id)["model"]
+    if not model_path.exists():
+        return None
+
+    with open(model_path, "rb") as f:
+        model_data = pickle.load(f)
+    model = model_data["model"]
+    if hasattr(model, "feature_importances_"):
+        importance = model.feature_importances_
+    else:
+        importance = model.coef_[0]
+
+    feat_imp = pd.DataFrame(
+        {"feature": model_data["feature_cols"], "importance": importance}
+    ).sort_values("importance", ascending=False)
+    return model_data.get("model_name") or type(model).__name__, feat_imp
+
+
+def render_feature_importance(stadium_id, stadium_name, model_name, feat_imp):
+    """피처 중요도 막대 그래프 저장"""
+    plt = _pyplot()
+    import seaborn as sns
+
+    plt.figure(figsize=(10, 6))
+    sns.barplot(data=feat_imp, x="importance", y="feature", palette="viridis")
+    plt.title(f"{stadium_name} - {model_name} 피처 중요도")
+    plt.xlabel("중요도")
+    plt.ylabel("피처")
+    plt.tight_layout()
+
+    fig_path = MODELS_DIR / f"feature_importance_{stadium_id}.png"
+    fig_path.parent.mkdir(parents=True, exist_ok=True)
+    plt.savefig(fig_path, dpi=150, bbox_inches="tight")
+    plt.close()
+    print(f"\n[저장] {fig_path}")
+    return fig_path
+
+
+def generate_reports(stadium_ids, plots=True, eda=True, importance=True):
+    """
+    구장별 EDA / 피처 중요도 리포트 생성
+
+    Args:
+        stadium_ids: 구장 ID 목록
+        plots: False면 통계 표만 출력 (그래프 라이브러리를 로드하지 않음)
+        eda: EDA 통계/그래프 생성
+        importance: 저장된 모델의 피처 중요도 표/그래프 생성
+
+    Returns:
+        dict: {stadium_id: 저장된 그래프 경로 목록}
+    """
+    outputs = {stadium_id: [] for stadium_id in stadium_ids}
+
+    if eda:
+        df = load_report_data(stadium_ids)
+        stats = compute_eda_stats(df) if not df.empty else {}
+        for stadium_id in stadium_ids:
+            stadium_name = STADIUMS[stadium_id]["name"]
+            if stadium_id not in stats:
+                print(f"\n[스킵] {stadium_name}: 날씨 포함 데이터가 없습니다.")
+                continue
+            print_eda_stats(stadium_name, stats[stadium_id])
+            if stats[stadium_id]["counts"]["cancelled"] < MIN_CANCELLED_FOR_PLOTS:
+                print(f"\n[경고] 우천취소 경기가 너무 적어 그래프를 생략합니다.")
+            elif plots:
+                outputs[stadium_id].append(
+                    render_eda_figure(stadium_id, stadium_name, df[df["stadium_id"] == stadium_id])
+                )
+
+    if importance:
+        for stadium_id in stadium_ids:
+            stadium_name = STADIUMS[stadium_id]["name"]
+            loaded = load_feature_importance(stadium_id)
+            if loaded is None:
+                print(f"\n[스킵] {stadium_name}: 학습된 모델이 없습니다.")
+                continue
+            model_name, feat_imp = loaded
+            print("\n" + "=" * 60)
+            print(f"피처 중요도 분석 - {stadium_name}")
+            print("=" * 60)
+            print(f"\n[{model_name} 피처 중요도]")
+            print(feat_imp.to_string(index=False))
+            if plots:
+                outputs[stadium_id].append(render_feature_importance(stadium_id, stadium_name, model_name, feat_imp))
+
+    return outputs
+
+
+def launch_report_process(stadium_ids, log_path=REPORT_LOG_PATH):
+    """
+    리포트 생성을 백그라운드 프로세스로 시작 (학습은 기다리지 않음)
+
+    Returns:
+        subprocess.Popen: 리포트 프로세스 (출력은 log_path)
+    """
+    log_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(log_path, "w", encoding="utf-8") as log_file:
+        return subprocess.Popen(
+            [sys.executable, str(Path(__file__).resolve()), "--stadium", *stadium_ids],
+            stdout=log_file,
+            stderr=subprocess.STDOUT,
+            cwd=Path(__file__).resolve().parent,
+            start_new_session=True,
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="EDA / 피처 중요도 리포트 생성 (학습과 분리된 단계)",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+예시:
+  python model_report.py --stadium jamsil
+  python model_report.py --stadium jamsil busan
+  python model_report.py --all
+  python model_report.py --all --no-plots       # 통계 표만 (matplotlib 불필요)
+  python model_report.py --all --no-importance  # EDA만
+
+참고:
+  - python kbo_rain_model.py --all --report 로 학습 후 백그라운드 실행 (로그: models/logs/report.log)
+        """,
+    )
+    parser.add_argument("--stadium", "-s", type=str, nargs="+", default=None, help="구장 ID (여러 개 가능)")
+    parser.add_argument("--all", "-a", action="store_true", help="모든 야외 구장")
+    parser.add_argument("--no-plots", action="store_true", help="그래프를 그리지 않고 통계 표만 출력")
+    parser.add_argument("--no-eda", action="store_true", help="EDA 생략")
+    parser.add_argument("--no-importance", action="store_true", help="피처 중요도 생략")
+    args = parser.parse_args()
+
+    stadium_ids = get_outdoor_stadiums() if args.all else (args.stadium or [DEFAULT_STADIUM])
+    generate_reports(
+        stadium_ids, plots=not args.no_plots, eda=not args.no_eda, importance=not args.no_importance
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -47,7 +47,7 @@ def run_crawl(stadium_id, years=None, months=None):
     return crawl_stadium(stadium_id, years=years, months=months)
 
 
-def run_weather(stadium_id):
+def run_weather(stadium_id, append=False, refresh_dates=None):
     """2단계: 날씨 데이터 수집"""
     from weather_collector_openmeteo import collect_stadium_weather
 
@@ -55,22 +55,32 @@ def run_weather(stadium_id):
     print(f"[2단계] 날씨 데이터 수집: {STADIUMS[stadium_id]['name']}")
     print("=" * 60)
 
-    return collect_stadium_weather(stadium_id)
+    return collect_stadium_weather(stadium_id, append=append, refresh_dates=refresh_dates)
 
 
-def run_model(stadium_id):
-    """3단계: 모델 학습"""
+def run_model(stadium_id, incremental=False):
+    """
+    3단계: 모델 학습
+
+    Args:
+        incremental: True면 저장된 모델에 새 경기만 이어서 학습
+    """
     from kbo_rain_model import train_stadium_model
 
     print("\n" + "=" * 60)
     print(f"[3단계] 모델 학습: {STADIUMS[stadium_id]['name']}")
     print("=" * 60)
 
-    return train_stadium_model(stadium_id)
+    return train_stadium_model(stadium_id, incremental=incremental)
+
 
+def run_full_pipeline(stadium_id, years=None, months=None, crawl_result=None):
+    """
+    전체 파이프라인 실행
 
-def run_full_pipeline(stadium_id, years=None, months=None):
-    """전체 파이프라인 실행"""
+    Args:
+        crawl_result: 이미 수집된 (전체 경기, 취소 경기) - 지정 시 크롤링 단계 생략
+    """
     stadium_name = STADIUMS[stadium_id]["name"]
     start_time = datetime.now()
 
@@ -88,8 +98,10 @@ def run_full_pipeline(stadium_id, years=None, months=None):
     }
 
     try:
-        # 1단계: 크롤링
-        all_games, cancelled_games = run_crawl(stadium_id, years, months)
+        # 1단계: 크롤링 (전체 구장 일괄 수집 결과가 있으면 재사용)
+        if crawl_result is None:
+            crawl_result = run_crawl(stadium_id, years, months)
+        all_games, cancelled_games = crawl_result
         results["crawl"] = {
             "total": len(all_games),
             "cancelled": len(cancelled_games),
@@ -151,12 +163,22 @@ def run_all_stadiums(years=None, months=None, outdoor_only=True):
     total_start = datetime.now()
     all_results = {}
 
+    # 1단계: 월별 일정 페이지를 한 번만 크롤링하여 모든 구장에 분배
+    from cancel_crawler import crawl_all_stadiums
+
+    print("\n" + "=" * 60)
+    print("[1단계] 전체 구장 경기 데이터 일괄 크롤링")
+    print("=" * 60)
+    crawl_results = crawl_all_stadiums(years=years, months=months, outdoor_only=outdoor_only)
+
     for i, stadium_id in enumerate(stadium_ids, 1):
         print(f"\n{'='*60}")
         print(f"[{i}/{len(stadium_ids)}] {STADIUMS[stadium_id]['name']} 처리 중...")
         print("=" * 60)
 
-        results = run_full_pipeline(stadium_id, years, months)
+        results = run_full_pipeline(
+            stadium_id, years, months, crawl_result=crawl_results[stadium_id]
+        )
         all_results[stadium_id] = results
 
         # 다음 구장 처리 전 잠시 대기 (API 부하 방지)
@@ -188,6 +210,51 @@ def run_all_stadiums(years=None, months=None, outdoor_only=True):
     return all_results
 
 
+def run_incremental(years=None, months=None):
+    """
+    증분 파이프라인 (시즌 중 갱신용)
+
+    확정되지 않은 월만 크롤링하고, 경기 내용이 바뀐 구장만
+    날씨 수집(APPEND)과 모델 증분 학습(새 경기만 이어서 학습)을 실행합니다.
+    """
+    from cancel_crawler import crawl_incremental
+
+    start_time = datetime.now()
+
+    print("\n" + "=" * 60)
+    print("[1단계] 증분 크롤링")
+    print("=" * 60)
+    changed = crawl_incremental(years=years, months=months)
+
+    if not changed:
+        print("\n[스킵] 변경된 경기가 없어 날씨 수집/모델 학습을 건너뜁니다.")
+        return {}
+
+    all_results = {}
+    for stadium_id, (all_games, _) in changed.items():
+        refresh_dates = sorted({game["date"] for game in all_games})
+        results = {"crawl": {"total": len(all_games)}, "weather": None, "model": None}
+
+        weather_df = run_weather(stadium_id, append=True, refresh_dates=refresh_dates)
+        results["weather"] = {"success": weather_df is not None}
+
+        if weather_df is not None:
+            model_result = run_model(stadium_id, incremental=True)
+            results["model"] = {"success": model_result is not None}
+
+        all_results[stadium_id] = results
+
+    skipped = [sid for sid in get_outdoor_stadiums() if sid not in changed]
+    print("\n" + "=" * 60)
+    print(f"증분 파이프라인 완료 (소요 시간: {datetime.now() - start_time})")
+    print(f"갱신: {', '.join(changed)}")
+    if skipped:
+        print(f"변경 없음 (스킵): {', '.join(skipped)}")
+    print("=" * 60)
+
+    return all_results
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="KBO 우천취소 예측 파이프라인",
@@ -201,6 +268,9 @@ def main():
   # 모든 야외 구장
   python run_pipeline.py --all
 
+  # 시즌 중 증분 갱신 (바뀐 월/구장만)
+  python run_pipeline.py --incremental
+
   # 특정 단계만
   python run_pipeline.py --stadium jamsil --step crawl
   python run_pipeline.py --stadium jamsil --step weather
@@ -241,6 +311,11 @@ def main():
         action="store_true",
         help="모든 야외 구장 처리",
     )
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="증분 갱신 (확정되지 않은 월만 크롤링, 바뀐 구장만 날씨/모델 갱신)",
+    )
     parser.add_argument(
         "--step",
         type=str,
@@ -264,6 +339,11 @@ def main():
         print_stadium_info()
         return
 
+    # 증분 갱신
+    if args.incremental:
+        run_incremental(years=args.years, months=args.months)
+        return
+
     # 모든 구장 처리
     if args.all:
         run_all_stadiums(years=args.years, months=args.months)
@@ -0,0 +1,158 @@
+"""
+KBO 일정 페이지 디스크 캐시 (내용 주소 기반)
+============================================
+크롤러가 수집한 월별 일정 테이블 HTML을 내용 해시(SHA-256)로 저장하고,
+(시리즈, 연, 월) → [해시, 수집 시각] 인덱스로 조회합니다.
+
+파서 수정(셀 오프셋, 취소 키워드 등) 후에는 사이트를 다시 크롤링하지 않고
+캐시된 페이지로 전체 구장 데이터를 재생성할 수 있습니다:
+    python cancel_crawler.py --reparse
+
+디렉토리 구조:
+    data/page_cache/
+    ├── index.json               # {"0,9,6/2024-05": [{"sha256", "fetched_at"}, ...]}
+    └── objects/ab/abcdef....html
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import threading
+from datetime import datetime
+
+from stadium_config import DATA_DIR
+
+PAGE_CACHE_DIR = DATA_DIR / "page_cache"
+
+
+def _page_key(series, year, month):
+    return f"{series}/{year}-{int(month):02d}"
+
+
+class SchedulePageCache:
+    """월별 일정 페이지 캐시 (스레드 안전)"""
+
+    def __init__(self, cache_dir=PAGE_CACHE_DIR):
+        self.cache_dir = cache_dir
+        self.index_path = cache_dir / "index.json"
+        self._lock = threading.Lock()
+        self._index = None
+
+    def _load_index(self):
+        if self._index is None:
+            if self.index_path.exists():
+                self._index = json.loads(self.index_path.read_text(encoding="utf-8"))
+            else:
+                self._index = {}
+        return self._index
+
+    def _write_index(self):
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.index_path.with_name(f".{self.index_path.name}.{os.getpid()}.tmp")
+        tmp_path.write_text(json.dumps(self._index, ensure_ascii=False, indent=1), encoding="utf-8")
+        os.replace(tmp_path, self.index_path)
+
+    def _object_path(self, digest):
+        return self.cache_dir / "objects" / digest[:2] / f"{digest}.html"
+
+    def put(self, series, year, month, html):
+        """
+        페이지 저장
+
+        같은 내용이 이미 있으면 객체는 재사용하고 수집 시각만 갱신합니다.
+
+        Returns:
+            str: 페이지 내용 SHA-256
+        """
+        data = html.encode("utf-8")
+        digest = hashlib.sha256(data).hexdigest()
+        object_path = self._object_path(digest)
+        if not object_path.exists():
+            object_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = object_path.with_name(f".{object_path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+            tmp_path.write_bytes(data)
+            os.replace(tmp_path, object_path)
+
+        entry = {"sha256": digest, "fetched_at": datetime.now().isoformat(timespec="seconds")}
+        with self._lock:
+            history = self._load_index().setdefault(_page_key(series, year, month), [])
+            if history and history[-1]["sha256"] == digest:
+                history[-1] = entry
+            else:
+                history.append(entry)
+            self._write_index()
+
+        return digest
+
+    def get(self, series, year, month):
+        """
+        최신 캐시 페이지 조회
+
+        Returns:
+            tuple: (HTML, 메타데이터 {"sha256", "fetched_at"}) - 캐시 없으면 None
+        """
+        with self._lock:
+            history = self._load_index().get(_page_key(series, year, month))
+        if not history:
+            return None
+        entry = history[-1]
+        return self._object_path(entry["sha256"]).read_text(encoding="utf-8"), entry
+
+    def entries(self, series=None):
+        """
+        캐시된 페이지 목록
+
+        Returns:
+            list: [(시리즈, 연, 월, 최신 메타데이터)] - (시리즈, 연, 월) 순
+        """
+        with self._lock:
+            index = dict(self._load_index())
+        result = []
+        for key, history in index.items():
+            key_series, year_month = key.split("/")
+            if series is not None and key_series != series:
+                continue
+            year, month = year_month.split("-")
+            result.append((key_series, int(year), int(month), history[-1]))
+        return sorted(result, key=lambda e: (e[0], e[1], e[2]))
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="KBO 일정 페이지 캐시 조회",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+예시:
+  python schedule_cache.py            # 캐시 목록
+  python schedule_cache.py --show 2024 5
+        """,
+    )
+    parser.add_argument("--series", type=str, default=None, help="시리즈 값 (예: 0,9,6)")
+    parser.add_argument(
+        "--show", type=int, nargs=2, metavar=("YEAR", "MONTH"), default=None, help="페이지 HTML 출력"
+    )
+    args = parser.parse_args()
+
+    cache = SchedulePageCache()
+
+    if args.show:
+        from kbo_schedule_api import REGULAR_SEASON_SERIES
+
+        cached = cache.get(args.series or REGULAR_SEASON_SERIES, *args.show)
+        if cached is None:
+            print("캐시된 페이지가 없습니다.")
+            return
+        html, meta = cached
+        print(f"# sha256={meta['sha256']} fetched_at={meta['fetched_at']}")
+        print(html)
+        return
+
+    entries = cache.entries(series=args.series)
+    print(f"캐시 디렉토리: {cache.cache_dir} ({len(entries)}개 페이지)")
+    for series, year, month, meta in entries:
+        print(f"  {series:<8} {year}-{month:02d}  {meta['fetched_at']}  {meta['sha256'][:12]}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,135 @@
+"""
+KBO 일정 테이블 파서 벤치마크
+=============================
+파서 본체는 backend/shared/schedule_parser.py (수집기/백엔드 공통)에 있으며,
+이 모듈은 기존 import 경로를 유지하기 위해 다시 내보냅니다.
+
+벤치마크 (캐시 페이지 또는 합성 페이지 코퍼스):
+    python schedule_parser.py --bench
+    python schedule_parser.py --bench --corpus data/page_cache --repeat 20
+"""
+
+import argparse
+import time
+from pathlib import Path
+from typing import List
+
+from backend.shared.schedule_parser import (
+    CANCEL_KEYWORDS,
+    CANCEL_PATTERN,
+    DATE_PATTERN,
+    DAY_PATTERN,
+    NORMAL_REASON,
+    TEAMS_PATTERN,
+    ScheduleGame,
+    build_keyword_lookup,
+    classify_cancellation,
+    parse_schedule_html,
+    schedule_json_to_html,
+)
+
+
+# =============================================================================
+# 벤치마크
+# =============================================================================
+def synthetic_month_html(year: int = 2024, month: int = 5, days: int = 26) -> str:
+    """
+    합성 월별 일정 테이블 (캐시 페이지가 없을 때 벤치마크용)
+
+    하루 5경기, 약 7%는 우천취소로 표시합니다.
+    """
+    teams = ["LG", "두산", "KIA", "삼성", "롯데", "NC", "한화", "SSG", "KT", "키움"]
+    stadiums = ["잠실", "광주", "사직", "문학", "고척"]
+    rows = []
+    for day in range(1, days + 1):
+        for game in range(5):
+            cells = []
+            if game == 0:
+                cells.append({"Text": f"<b>{month:02d}.{day:02d}(수)</b>", "Class": "day", "RowSpan": "5"})
+            away, home = teams[game * 2], teams[game * 2 + 1]
+            note = "우천취소" if (day * 5 + game) % 14 == 0 else "-"
+            cells += [
+                {"Text": "<b>18:30</b>", "Class": "time"},
+                {
+                    "Text": f'<span class="lose">{away}</span><em><span>3</span><span>vs</span>'
+                    f'<span>5</span></em><span class="win">{home}</span>',
+                    "Class": "play",
+                },
+                {"Text": '<a href="#">리뷰</a>', "Class": "relay"},
+                {"Text": '<a href="#">하이라이트</a>'},
+                {"Text": "SPO-T"},
+                {"Text": ""},
+                {"Text": stadiums[game]},
+                {"Text": note},
+            ]
+            rows.append({"row": cells})
+    return schedule_json_to_html({"rows": rows})
+
+
+def load_corpus(corpus_dir: Path) -> List[str]:
+    """캐시 디렉토리의 페이지 HTML 목록 (objects/**/*.html)"""
+    return [path.read_text(encoding="utf-8") for path in sorted(corpus_dir.rglob("*.html"))]
+
+
+def run_benchmark(pages: List[str], repeat: int = 10) -> None:
+    """새 파서와 기존 BeautifulSoup 파서의 초당 처리 행 수 비교"""
+    from kbo_schedule_api import extract_schedule_rows
+    from cancel_crawler import parse_schedule_rows
+
+    def new_parser():
+        return sum(len(parse_schedule_html(page, 2024)) for page in pages)
+
+    def legacy_parser():
+        total = 0
+        for page in pages:
+            rows = extract_schedule_rows(page)
+            if rows:
+                total += sum(1 for _ in parse_schedule_rows(rows, 2024))
+        return total
+
+    print(f"코퍼스: {len(pages)}개 페이지, 반복 {repeat}회")
+    print(f"{'파서':<20} {'경기 수':>10} {'초':>10} {'rows/s':>12}")
+    print("-" * 56)
+    for name, parse in [("lxml (schedule_parser)", new_parser), ("BeautifulSoup (기존)", legacy_parser)]:
+        n_rows = parse()
+        start = time.perf_counter()
+        for _ in range(repeat):
+            parse()
+        elapsed = time.perf_counter() - start
+        print(f"{name:<20} {n_rows:>10} {elapsed:>10.3f} {n_rows * repeat / elapsed:>12,.0f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="KBO 일정 테이블 파서 벤치마크",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+예시:
+  python schedule_parser.py --bench
+  python schedule_parser.py --bench --corpus data/page_cache --repeat 20
+        """,
+    )
+    parser.add_argument("--bench", action="store_true", help="파서 벤치마크 실행")
+    parser.add_argument(
+        "--corpus", type=str, default=None, help="페이지 HTML 디렉토리 (기본: data/page_cache)"
+    )
+    parser.add_argument("--repeat", type=int, default=10, help="반복 횟수 (기본: 10)")
+    args = parser.parse_args()
+
+    if not args.bench:
+        parser.print_help()
+        return
+
+    from schedule_cache import PAGE_CACHE_DIR
+
+    corpus_dir = Path(args.corpus) if args.corpus else PAGE_CACHE_DIR
+    pages = load_corpus(corpus_dir) if corpus_dir.exists() else []
+    if not pages:
+        print(f"{corpus_dir}에 캐시된 페이지가 없어 합성 페이지(7개월)로 측정합니다.")
+        pages = [synthetic_month_html(2024, month) for month in range(4, 11)]
+
+    run_benchmark(pages, repeat=args.repeat)
+
+
+if __name__ == "__main__":
+    main()
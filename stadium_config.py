@@ -179,7 +179,8 @@ def get_data_paths(stadium_id: str) -> dict:
             "all_games": 전체 경기 CSV 경로,
             "cancelled": 취소 경기 CSV 경로,
             "with_weather": 날씨 포함 CSV 경로,
-            "model": 모델 파일 경로
+            "model": 모델 파일 경로,
+            "student": 경량(증류) 모델 파일 경로
         }
     """
     # 구장별 데이터 디렉토리 (data/jamsil/, data/daegu/ 등)
@@ -193,6 +194,7 @@ def get_data_paths(stadium_id: str) -> dict:
         "cancelled": stadium_data_dir / "cancelled_games.csv",
         "with_weather": stadium_data_dir / "with_weather.csv",
         "model": MODELS_DIR / f"kbo_{stadium_id}_model.pkl",
+        "student": MODELS_DIR / f"kbo_{stadium_id}_student.pkl",
     }
 
 
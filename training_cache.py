@@ -0,0 +1,258 @@
+"""
+구장별 모델 학습 캐시 (내용 해시 기반)
+======================================
+학습 입력이 바뀌지 않은 구장은 다시 학습하지 않고 기존 모델을 재사용합니다.
+
+캐시 키:
+    - 피처 키: 학습 데이터 내용 해시 + 피처 정의(전처리 코드) 해시
+    - 학습 키: 피처 키 + 학습 코드/하이퍼파라미터 해시 + 학습 옵션 + 라이브러리 버전
+
+학습 키가 같고 모델 파일이 기록된 그대로면 학습을 건너뛰고, 학습 키만 바뀌었으면
+(코드/옵션 변경) 피처 키가 같은 전처리 결과(.npy)를 재사용합니다.
+
+디렉토리 구조:
+    models/cache/<구장>/
+    ├── manifest.json    # 학습 키, 모델 경로/해시, 지표, 산출물
+    ├── features.json    # 피처 키, 컬럼, dtype
+    ├── X.npy / y.npy / index.npy
+
+실행: python training_cache.py            # 구장별 캐시 상태
+      python training_cache.py --clear    # 캐시 삭제 (다음 학습은 전체 재학습)
+"""
+
+import argparse
+import hashlib
+import inspect
+import json
+import os
+import shutil
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from stadium_config import MODELS_DIR
+
+TRAINING_CACHE_DIR = MODELS_DIR / "cache"
+
+# 학습 결과에 영향을 주는 라이브러리
+VERSIONED_LIBRARIES = ("numpy", "pandas", "sklearn", "xgboost", "lightgbm", "optuna")
+
+
+def hash_dataframe(df):
+    """DataFrame 내용 해시 (컬럼 이름/순서 포함, 인덱스 제외)"""
+    digest = hashlib.sha256()
+    digest.update(json.dumps(list(map(str, df.columns))).encode("utf-8"))
+    digest.update(pd.util.hash_pandas_object(df, index=False).to_numpy().tobytes())
+    return digest.hexdigest()
+
+
+def hash_sources(*objects):
+    """함수/클래스 소스 코드 해시"""
+    digest = hashlib.sha256()
+    for obj in objects:
+        digest.update(inspect.getsource(obj).encode("utf-8"))
+    return digest.hexdigest()
+
+
+def hash_file(path):
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def library_versions():
+    """설치된 학습 라이브러리 버전 (없으면 None)"""
+    import importlib
+
+    versions = {}
+    for name in VERSIONED_LIBRARIES:
+        try:
+            versions[name] = importlib.import_module(name).__version__
+        except ImportError:
+            versions[name] = None
+    return versions
+
+
+def combine_hash(**parts):
+    """여러 구성 요소를 하나의 키로 결합"""
+    payload = json.dumps(parts, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def _to_builtin(value):
+    """JSON 저장용 변환 (numpy 스칼라/경로)"""
+    if isinstance(value, dict):
+        return {str(k): _to_builtin(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_to_builtin(v) for v in value]
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, Path):
+        return str(value)
+    return value
+
+
+def _write_json(path, data):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    tmp_path.write_text(json.dumps(data, ensure_ascii=False, indent=1), encoding="utf-8")
+    os.replace(tmp_path, path)
+
+
+def _save_npy(path, array):
+    tmp_path = path.with_name(f".{path.stem}.{os.getpid()}.tmp.npy")
+    np.save(tmp_path, array)
+    os.replace(tmp_path, path)
+
+
+class TrainingCache:
+    """구장 하나의 학습 캐시"""
+
+    def __init__(self, stadium_id, cache_dir=TRAINING_CACHE_DIR):
+        self.stadium_id = stadium_id
+        self.dir = cache_dir / stadium_id
+        self.manifest_path = self.dir / "manifest.json"
+        self.features_path = self.dir / "features.json"
+
+    def _read_json(self, path):
+        if not path.exists():
+            return None
+        try:
+            return json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+
+    def get_result(self, training_key):
+        """
+        학습 결과 조회
+
+        Returns:
+            dict: 저장된 학습 요약 (키 불일치, 모델 파일 변경/누락 시 None)
+        """
+        manifest = self._read_json(self.manifest_path)
+        if manifest is None or manifest.get("training_key") != training_key:
+            return None
+
+        result = manifest["result"]
+        model_path = Path(result["model_path"])
+        if not model_path.exists() or hash_file(model_path) != manifest.get("model_sha256"):
+            return None
+        if not all(Path(path).exists() for path in result.get("artifacts", [])):
+            return None
+        return result
+
+    def put_result(self, training_key, parts, result):
+        """
+        학습 결과 저장
+
+        Args:
+            training_key: 학습 키
+            parts: 키 구성 요소 (확인용으로 함께 기록)
+            result: 학습 요약 (model_path, best_model_name, best_f1, results, artifacts)
+        """
+        _write_json(
+            self.manifest_path,
+            {
+                "stadium_id": self.stadium_id,
+                "training_key": training_key,
+                "parts": _to_builtin(parts),
+                "model_sha256": hash_file(result["model_path"]),
+                "result": _to_builtin(result),
+            },
+        )
+
+    def get_features(self, features_key):
+        """
+        전처리 결과 조회
+
+        Returns:
+            tuple: (X, y, feature_cols) - 피처 키 불일치 시 None
+        """
+        meta = self._read_json(self.features_path)
+        if meta is None or meta.get("features_key") != features_key:
+            return None
+        try:
+            values = np.load(self.dir / "X.npy")
+            target = np.load(self.dir / "y.npy")
+            index = np.load(self.dir / "index.npy")
+        except (OSError, ValueError):
+            return None
+
+        feature_cols = meta["feature_cols"]
+        X = pd.DataFrame(values, columns=feature_cols, index=index).astype(meta["dtypes"])
+        y = pd.Series(target, index=index, name=meta["target_name"])
+        return X, y, feature_cols
+
+    def put_features(self, features_key, X, y, feature_cols):
+        """전처리 결과 저장 (X/y/index를 .npy로)"""
+        self.dir.mkdir(parents=True, exist_ok=True)
+        _save_npy(self.dir / "X.npy", X[feature_cols].to_numpy(dtype=np.float64))
+        _save_npy(self.dir / "y.npy", y.to_numpy())
+        _save_npy(self.dir / "index.npy", X.index.to_numpy())
+        _write_json(
+            self.features_path,
+            {
+                "features_key": features_key,
+                "feature_cols": feature_cols,
+                "dtypes": {col: str(dtype) for col, dtype in X[feature_cols].dtypes.items()},
+                "target_name": y.name,
+                "rows": len(X),
+            },
+        )
+
+    def status(self):
+        """캐시 상태 요약"""
+        manifest = self._read_json(self.manifest_path)
+        features = self._read_json(self.features_path)
+        return {
+            "training_key": manifest["training_key"][:12] if manifest else None,
+            "best_model_name": manifest["result"].get("best_model_name") if manifest else None,
+            "features_key": features["features_key"][:12] if features else None,
+            "rows": features.get("rows") if features else None,
+        }
+
+    def clear(self):
+        shutil.rmtree(self.dir, ignore_errors=True)
+
+
+def main():
+    from stadium_config import STADIUMS
+
+    parser = argparse.ArgumentParser(
+        description="구장별 모델 학습 캐시 조회/삭제",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+예시:
+  python training_cache.py
+  python training_cache.py --clear
+  python training_cache.py --clear --stadium jamsil
+        """,
+    )
+    parser.add_argument("--stadium", "-s", type=str, default=None, help="구장 ID (기본: 전체)")
+    parser.add_argument("--clear", action="store_true", help="캐시 삭제")
+    args = parser.parse_args()
+
+    stadium_ids = [args.stadium] if args.stadium else list(STADIUMS.keys())
+
+    if args.clear:
+        for stadium_id in stadium_ids:
+            TrainingCache(stadium_id).clear()
+        print(f"학습 캐시 삭제: {', '.join(stadium_ids)}")
+        return
+
+    print(f"캐시 디렉토리: {TRAINING_CACHE_DIR}")
+    print(f"{'구장':<12} {'학습 키':<14} {'Best Model':<15} {'피처 키':<14} {'행 수'}")
+    print("-" * 64)
+    for stadium_id in stadium_ids:
+        status = TrainingCache(stadium_id).status()
+        print(
+            f"{stadium_id:<12} {status['training_key'] or '-':<14} {status['best_model_name'] or '-':<15} "
+            f"{status['features_key'] or '-':<14} {status['rows'] if status['rows'] is not None else '-'}"
+        )
+
+
+if __name__ == "__main__":
+    main()
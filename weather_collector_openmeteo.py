@@ -11,17 +11,26 @@ API 키 불필요, 무료, 과거 데이터 지원
 """
 
 import argparse
+import json
+import os
 import requests
 import pandas as pd
 import time
 from datetime import datetime, timedelta
 from pathlib import Path
 
+from backend.shared.weather_window import (
+    HourlyWeatherIndex,
+    hour_anchors,
+    sweep_windows,
+    window_features,
+)
+from dataset_store import dataset_exists, load_dataset, save_dataset, upsert_dataset
 from stadium_config import (
+    DATA_DIR,
     STADIUMS,
     get_stadium_config,
     get_stadium_coordinates,
-    get_data_paths,
     get_outdoor_stadiums,
     DEFAULT_STADIUM,
 )
@@ -30,6 +39,133 @@ from stadium_config import (
 # Open-Meteo Historical API
 HISTORICAL_URL = "https://archive-api.open-meteo.com/v1/archive"
 
+# 조회 변수 (격자 셀 + 날짜당 한 번만 요청하여 경기/전날 강수량 조회에 공유)
+HOURLY_VARIABLES = [
+    "temperature_2m",
+    "relative_humidity_2m",
+    "precipitation",
+    "rain",
+    "weather_code",
+    "wind_speed_10m",
+    "wind_gusts_10m",
+]
+DAILY_VARIABLES = [
+    "temperature_2m_max",
+    "temperature_2m_min",
+    "temperature_2m_mean",
+    "precipitation_sum",
+    "rain_sum",
+    "precipitation_hours",
+    "wind_speed_10m_max",
+    "wind_gusts_10m_max",
+]
+
+# 격자 셀 단위 응답 캐시 (구장 간 공유)
+# - grid_cells.json: 구장 좌표 -> Open-Meteo 격자 셀 좌표
+# - archive/<lat>_<lon>/<date>.json: 격자 셀의 하루치 응답
+WEATHER_CACHE_DIR = DATA_DIR / "weather_cache"
+GRID_CELLS_FILE = WEATHER_CACHE_DIR / "grid_cells.json"
+
+_grid_cells = None
+
+
+def _load_grid_cells():
+    global _grid_cells
+    if _grid_cells is None:
+        if GRID_CELLS_FILE.exists():
+            _grid_cells = json.loads(GRID_CELLS_FILE.read_text(encoding="utf-8"))
+        else:
+            _grid_cells = {}
+    return _grid_cells
+
+
+def _write_json(path, data):
+    """임시 파일에 쓴 뒤 교체"""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    tmp_path.write_text(json.dumps(data, ensure_ascii=False), encoding="utf-8")
+    os.replace(tmp_path, path)
+
+
+def resolve_grid_cell(lat, lon):
+    """
+    구장 좌표를 Open-Meteo 격자 셀 좌표로 해석 (디스크 캐시, 좌표당 1회 요청)
+
+    Open-Meteo는 요청 좌표를 모델 격자 셀로 스냅하므로, 가까운 구장들
+    (예: 잠실/수원/인천)이 같은 셀에 속하면 요청과 캐시를 공유할 수 있습니다.
+
+    Returns:
+        tuple: (격자 위도, 격자 경도) - 해석 실패 시 원래 좌표
+    """
+    cells = _load_grid_cells()
+    key = f"{lat},{lon}"
+    if key not in cells:
+        params = {
+            "latitude": lat,
+            "longitude": lon,
+            "start_date": "2024-01-01",
+            "end_date": "2024-01-01",
+            "daily": ["precipitation_sum"],
+            "timezone": "Asia/Seoul",
+        }
+        try:
+            response = requests.get(HISTORICAL_URL, params=params, timeout=15)
+            response.raise_for_status()
+            data = response.json()
+        except Exception as e:
+            print(f"    격자 셀 해석 실패 ({lat}, {lon}): {e}")
+            return lat, lon
+        cells[key] = [data["latitude"], data["longitude"]]
+        _write_json(GRID_CELLS_FILE, cells)
+    return tuple(cells[key])
+
+
+def fetch_day_response(date_str, cell):
+    """
+    격자 셀의 하루치 아카이브 응답 조회 (디스크 캐시)
+
+    Args:
+        date_str: 날짜 (YYYY-MM-DD)
+        cell: resolve_grid_cell()이 반환한 격자 셀 좌표
+
+    Returns:
+        dict: Open-Meteo 응답 (실패 시 None)
+    """
+    cache_path = WEATHER_CACHE_DIR / "archive" / f"{cell[0]}_{cell[1]}" / f"{date_str}.json"
+    if cache_path.exists():
+        return json.loads(cache_path.read_text(encoding="utf-8"))
+
+    params = {
+        "latitude": cell[0],
+        "longitude": cell[1],
+        "start_date": date_str,
+        "end_date": date_str,
+        "hourly": HOURLY_VARIABLES,
+        "daily": DAILY_VARIABLES,
+        "timezone": "Asia/Seoul",
+    }
+
+    response = requests.get(HISTORICAL_URL, params=params, timeout=15)
+    # API 호출 제한 방지 (캐시 적중 시에는 대기하지 않음)
+    time.sleep(0.3)
+
+    if response.status_code != 200:
+        print(f"    HTTP 오류: {response.status_code}")
+        return None
+
+    data = response.json()
+
+    # 아카이브 반영 전(최근 며칠) 결측 응답은 캐시하지 않음
+    if None not in data.get("daily", {}).get("precipitation_sum", [None]):
+        _write_json(cache_path, data)
+
+    return data
+
+
+def _round_or_none(value, digits=1):
+    """NaN이면 None, 아니면 반올림"""
+    return None if pd.isna(value) else round(value, digits)
+
 
 def get_weather_for_date(date_str, lat, lon, game_hour=18):
     """
@@ -44,79 +180,21 @@ def get_weather_for_date(date_str, lat, lon, game_hour=18):
     Returns:
         dict: 기상 데이터
     """
-    params = {
-        "latitude": lat,
-        "longitude": lon,
-        "start_date": date_str,
-        "end_date": date_str,
-        "hourly": [
-            "temperature_2m",
-            "relative_humidity_2m",
-            "precipitation",
-            "rain",
-            "weather_code",
-            "wind_speed_10m",
-            "wind_gusts_10m",
-        ],
-        "daily": [
-            "temperature_2m_max",
-            "temperature_2m_min",
-            "temperature_2m_mean",
-            "precipitation_sum",
-            "rain_sum",
-            "precipitation_hours",
-            "wind_speed_10m_max",
-            "wind_gusts_10m_max",
-        ],
-        "timezone": "Asia/Seoul",
-    }
-
     try:
-        response = requests.get(HISTORICAL_URL, params=params, timeout=15)
-
-        if response.status_code != 200:
-            print(f"    HTTP 오류: {response.status_code}")
+        data = fetch_day_response(date_str, resolve_grid_cell(lat, lon))
+        if data is None:
             return None
 
-        data = response.json()
-
         # 일별 데이터
         daily = data.get("daily", {})
 
-        # 시간별 데이터에서 경기 전 시간대 추출 (경기 3시간 전 ~ 경기 시작)
+        # 시간별 데이터에서 경기 전 윈도우 피처 계산 (백엔드와 동일한 윈도우 정의)
         hourly = data.get("hourly", {})
-
-        # 경기 전 3시간 데이터 (예: 18시 경기면 15~18시)
-        start_hour = max(0, game_hour - 3)
-        end_hour = game_hour
-
-        pre_game_rain = 0
-        pre_game_temps = []
-        pre_game_humidity = []
-        pre_game_wind = []
-
-        if hourly.get("precipitation"):
-            for h in range(start_hour, min(end_hour + 1, 24)):
-                if (
-                    h < len(hourly["precipitation"])
-                    and hourly["precipitation"][h] is not None
-                ):
-                    pre_game_rain += hourly["precipitation"][h]
-                if (
-                    h < len(hourly.get("temperature_2m", []))
-                    and hourly["temperature_2m"][h] is not None
-                ):
-                    pre_game_temps.append(hourly["temperature_2m"][h])
-                if (
-                    h < len(hourly.get("relative_humidity_2m", []))
-                    and hourly["relative_humidity_2m"][h] is not None
-                ):
-                    pre_game_humidity.append(hourly["relative_humidity_2m"][h])
-                if (
-                    h < len(hourly.get("wind_speed_10m", []))
-                    and hourly["wind_speed_10m"][h] is not None
-                ):
-                    pre_game_wind.append(hourly["wind_speed_10m"][h])
+        index = HourlyWeatherIndex.from_open_meteo(hourly)
+        pre_game = {
+            name: float(values[0])
+            for name, values in window_features(index, [game_hour]).items()
+        }
 
         result = {
             "date": date_str,
@@ -130,22 +208,10 @@ def get_weather_for_date(date_str, lat, lon, game_hour=18):
             "daily_wind_max": daily.get("wind_speed_10m_max", [None])[0],
             "daily_wind_gust_max": daily.get("wind_gusts_10m_max", [None])[0],
             # 경기 전 시간대 데이터
-            "pre_game_precip": round(pre_game_rain, 2),
-            "pre_game_temp": (
-                round(sum(pre_game_temps) / len(pre_game_temps), 1)
-                if pre_game_temps
-                else None
-            ),
-            "pre_game_humidity": (
-                round(sum(pre_game_humidity) / len(pre_game_humidity), 1)
-                if pre_game_humidity
-                else None
-            ),
-            "pre_game_wind": (
-                round(sum(pre_game_wind) / len(pre_game_wind), 1)
-                if pre_game_wind
-                else None
-            ),
+            "pre_game_precip": round(pre_game["pre_game_precip"], 2),
+            "pre_game_temp": _round_or_none(pre_game["pre_game_temp"]),
+            "pre_game_humidity": _round_or_none(pre_game["pre_game_humidity"]),
+            "pre_game_wind": _round_or_none(pre_game["pre_game_wind"]),
         }
 
         return result
@@ -156,22 +222,14 @@ def get_weather_for_date(date_str, lat, lon, game_hour=18):
 
 
 def get_previous_day_rain(date_str, lat, lon):
-    """전날 강수량 조회"""
+    """전날 강수량 조회 (전날 경기와 같은 격자 셀 응답 캐시 공유)"""
     try:
         date_obj = datetime.strptime(date_str, "%Y-%m-%d")
         prev_date = (date_obj - timedelta(days=1)).strftime("%Y-%m-%d")
 
-        params = {
-            "latitude": lat,
-            "longitude": lon,
-            "start_date": prev_date,
-            "end_date": prev_date,
-            "daily": ["precipitation_sum"],
-            "timezone": "Asia/Seoul",
-        }
-
-        response = requests.get(HISTORICAL_URL, params=params, timeout=10)
-        data = response.json()
+        data = fetch_day_response(prev_date, resolve_grid_cell(lat, lon))
+        if data is None:
+            return None
 
         daily = data.get("daily", {})
         return daily.get("precipitation_sum", [None])[0]
@@ -206,7 +264,7 @@ def collect_weather_data(games_df, lat, lon):
     print(f"\n총 {total}개 경기 날씨 데이터 수집 시작...\n")
 
     for i, (idx, row) in enumerate(games_df.iterrows()):
-        date = row["date"]
+        date = pd.Timestamp(row["date"]).strftime("%Y-%m-%d")
         game_hour = parse_game_time(row.get("time", "18:00"))
 
         print(f"[{i+1}/{total}] {date} ({row.get('time', '')}) ", end="")
@@ -226,19 +284,20 @@ def collect_weather_data(games_df, lat, lon):
             results.append({"date": date})
             print("✗ 데이터 없음")
 
-        # API 호출 제한 방지
-        time.sleep(0.3)
-
-    return pd.DataFrame(results)
+    weather_df = pd.DataFrame(results)
+    weather_df["date"] = pd.to_datetime(weather_df["date"])
+    return weather_df
 
 
-def collect_stadium_weather(stadium_id, append=False):
+def collect_stadium_weather(stadium_id, append=False, refresh_dates=None):
     """
     특정 구장의 날씨 데이터 수집
 
     Args:
         stadium_id: 구장 ID
         append: True면 기존 데이터에 신규 데이터만 추가
+        refresh_dates: append 모드에서 기존 데이터가 있어도 다시 병합할 날짜
+                       (증분 수집에서 경기 상태가 바뀐 날짜)
 
     Returns:
         DataFrame: 날씨 포함 경기 데이터
@@ -246,7 +305,6 @@ def collect_stadium_weather(stadium_id, append=False):
     stadium_config = get_stadium_config(stadium_id)
     stadium_name = stadium_config["name"]
     lat, lon = get_stadium_coordinates(stadium_id)
-    paths = get_data_paths(stadium_id)
 
     print("=" * 60)
     print(f"KBO {stadium_name} 날씨 데이터 수집기 (Open-Meteo)")
@@ -256,53 +314,55 @@ def collect_stadium_weather(stadium_id, append=False):
     print("\n• API 키 불필요")
     print(f"• {stadium_name} 좌표 기준")
     print(f"• 위치: {lat}, {lon}")
+    print(f"• Open-Meteo 격자 셀: {resolve_grid_cell(lat, lon)} (같은 셀 구장과 캐시 공유)")
 
     # 경기 데이터 로드
-    games_file = paths["all_games"]
-    if not games_file.exists():
-        print(f"\n[오류] {games_file} 파일이 없습니다!")
+    games_df = load_dataset(stadium_id, "all_games")
+    if games_df is None:
+        print(f"\n[오류] {stadium_id} 경기 데이터가 없습니다!")
         print(f"먼저 cancel_crawler.py --stadium {stadium_id} 를 실행하세요.")
         return None
 
-    print(f"\n경기 데이터 로드: {games_file}")
-    games_df = pd.read_csv(games_file)
+    print(f"\n경기 데이터 로드: {stadium_id}/all_games")
     print(f"총 {len(games_df)}개 경기")
 
-    output_file = paths["with_weather"]
-    
-    if append and output_file.exists():
-        # 기존 with_weather 데이터 로드
-        existing_df = pd.read_csv(output_file)
-        existing_dates = set(existing_df["date"].unique())
-        
-        # 신규 경기만 필터링 (날씨 데이터가 없는 경기)
-        new_games_df = games_df[~games_df["date"].isin(existing_dates)]
-        
+    if append and dataset_exists(stadium_id, "with_weather"):
+        # 기존 with_weather 날짜만 로드
+        existing_dates = load_dataset(stadium_id, "with_weather", columns=["date"])["date"]
+
+        # 신규 경기만 필터링 (날씨 데이터가 없는 경기 + 상태가 바뀐 날짜)
+        is_new = ~games_df["date"].isin(existing_dates)
+        if refresh_dates is not None:
+            is_new |= games_df["date"].isin(pd.to_datetime(pd.Series(list(refresh_dates))))
+        new_games_df = games_df[is_new]
+
         if len(new_games_df) == 0:
             print(f"\n[스킵] 신규 경기가 없습니다. 기존 데이터 유지.")
-            return existing_df
-        
-        print(f"\n[APPEND 모드] 기존 {len(existing_df)}개, 신규 {len(new_games_df)}개 경기 날씨 수집")
-        
+            return load_dataset(stadium_id, "with_weather")
+
+        print(f"\n[APPEND 모드] 기존 {len(existing_dates)}개, 신규 {len(new_games_df)}개 경기 날씨 수집")
+
         # 신규 경기만 날씨 수집
         print("\n" + "=" * 60)
         weather_df = collect_weather_data(new_games_df, lat, lon)
         new_result_df = new_games_df.merge(weather_df, on="date", how="left")
-        
-        # 기존 데이터와 병합
-        result_df = pd.concat([existing_df, new_result_df], ignore_index=True)
-        result_df = result_df.drop_duplicates(subset=["date", "home", "away"], keep="last")
-        result_df = result_df.sort_values("date").reset_index(drop=True)
+
+        # 신규 행이 속한 (연, 월) 파티션만 병합 후 교체
+        stats = upsert_dataset(new_result_df, stadium_id, "with_weather")
+        result_df = load_dataset(stadium_id, "with_weather")
+        print(
+            f"\n저장 완료: 신규 {stats['inserted']}개, 갱신 {stats['updated']}개 "
+            f"({stats['partitions']}개 파티션, 총 {len(result_df)}개)"
+        )
     else:
         # 전체 날씨 수집
         print("\n" + "=" * 60)
         weather_df = collect_weather_data(games_df, lat, lon)
         result_df = games_df.merge(weather_df, on="date", how="left")
 
-    # 결과 저장
-    output_file.parent.mkdir(parents=True, exist_ok=True)
-    result_df.to_csv(output_file, index=False, encoding="utf-8-sig")
-    print(f"\n저장 완료: {output_file} ({len(result_df)}개)")
+        # 결과 저장
+        output_dir = save_dataset(result_df, stadium_id, "with_weather")
+        print(f"\n저장 완료: {output_dir} ({len(result_df)}개)")
 
     # 요약 통계
     print_weather_summary(result_df, stadium_name)
@@ -343,6 +403,81 @@ def print_weather_summary(result_df, stadium_name):
                 print(f"{label:20} | 취소: {c_mean:8.2f} | 정상: {n_mean:8.2f}")
 
 
+def fetch_hourly_index(lat, lon, start_date, end_date, variables=None):
+    """
+    기간 전체의 시간별 기상 시계열을 한 번에 조회하여 윈도우 인덱스 생성
+
+    Returns:
+        HourlyWeatherIndex: 인덱스 0 = start_date 00시 (실패 시 None)
+    """
+    variables = variables or [
+        "temperature_2m",
+        "relative_humidity_2m",
+        "precipitation",
+        "wind_speed_10m",
+    ]
+    params = {
+        "latitude": lat,
+        "longitude": lon,
+        "start_date": start_date,
+        "end_date": end_date,
+        "hourly": variables,
+        "timezone": "Asia/Seoul",
+    }
+
+    try:
+        response = requests.get(HISTORICAL_URL, params=params, timeout=60)
+        response.raise_for_status()
+        return HourlyWeatherIndex.from_open_meteo(response.json().get("hourly", {}))
+    except Exception as e:
+        print(f"    API 오류: {e}")
+        return None
+
+
+def sweep_pre_game_windows(stadium_id, variable="precipitation", offsets=None, lengths=None, agg="sum"):
+    """
+    경기 전 윈도우 크기 탐색 실험
+
+    구장의 전체 경기 기간 시간별 시계열을 한 번 조회한 뒤
+    모든 경기 × (offset, length) 조합을 벡터화하여 한 번에 계산합니다.
+
+    Args:
+        stadium_id: 구장 ID
+        variable: 시간별 변수명 (예: "precipitation")
+        offsets: 경기 시작 기준 시작 오프셋 리스트 (기본값: [-6, -3])
+        lengths: 윈도우 길이 리스트 (기본값: 1~6시간)
+        agg: 집계 방식 ("sum", "mean", "min", "max", "count")
+
+    Returns:
+        DataFrame: 경기별 윈도우 피처 (컬럼: {variable}_{agg}_o{offset}_l{length})
+    """
+    offsets = offsets or [-6, -3]
+    lengths = lengths or list(range(1, 7))
+    lat, lon = get_stadium_coordinates(stadium_id)
+
+    games_df = load_dataset(stadium_id, "all_games")
+    start_date = games_df["date"].min().strftime("%Y-%m-%d")
+    end_date = games_df["date"].max().strftime("%Y-%m-%d")
+
+    print(f"\n[윈도우 탐색] {stadium_id}: {start_date} ~ {end_date}, {len(games_df)}개 경기")
+    cell_lat, cell_lon = resolve_grid_cell(lat, lon)
+    index = fetch_hourly_index(cell_lat, cell_lon, start_date, end_date, variables=[variable])
+    if index is None:
+        return None
+
+    anchors = hour_anchors(
+        games_df["date"], games_df["time"].map(parse_game_time), start_date
+    )
+    values = sweep_windows(index, anchors, variable, offsets, lengths, agg)
+
+    result_df = games_df[["date", "time", "home", "away", "cancelled", "reason"]].copy()
+    for i, offset in enumerate(offsets):
+        for j, length in enumerate(lengths):
+            result_df[f"{variable}_{agg}_o{offset}_l{length}"] = values[:, i, j]
+
+    return result_df
+
+
 def collect_all_stadiums_weather(outdoor_only=True):
     """
     모든 구장 날씨 데이터 수집
@@ -401,6 +536,7 @@ def main():
   python weather_collector_openmeteo.py --stadium busan
   python weather_collector_openmeteo.py --all
   python weather_collector_openmeteo.py --list
+  python weather_collector_openmeteo.py --stadium jamsil --sweep 1 2 3 4 6
 
 참고:
   - 먼저 cancel_crawler.py로 경기 데이터를 수집해야 합니다.
@@ -432,6 +568,14 @@ def main():
         action="store_true",
         help="기존 데이터에 신규 경기만 추가 (들어쓰기 대신 병합)",
     )
+    parser.add_argument(
+        "--sweep",
+        type=int,
+        nargs="+",
+        default=None,
+        metavar="LENGTH",
+        help="경기 전 강수량 윈도우 길이 탐색 (예: 1 2 3 4 6)",
+    )
 
     args = parser.parse_args()
 
@@ -447,8 +591,18 @@ def main():
         collect_all_stadiums_weather()
         return
 
-    # 특정 구장 수집
     stadium_id = args.stadium or DEFAULT_STADIUM
+
+    # 윈도우 크기 탐색
+    if args.sweep:
+        sweep_df = sweep_pre_game_windows(stadium_id, lengths=args.sweep)
+        if sweep_df is not None:
+            window_cols = [c for c in sweep_df.columns if c.startswith("precipitation_")]
+            print("\n[윈도우별 평균: 취소 vs 정상]")
+            print(sweep_df.groupby("cancelled")[window_cols].mean().T)
+        return
+
+    # 특정 구장 수집
     collect_stadium_weather(stadium_id, append=args.append)
 
 